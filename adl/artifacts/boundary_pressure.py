@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from adl.utils.io import ensure_dir, write_json
+
+
+def _render_markdown(report: dict[str, Any]) -> str:
+    runs = report["runs"]
+    lines: list[str] = []
+    lines.append("# Boundary Pressure Report")
+    lines.append(f"Generated: {report['generated_at_utc']}")
+    lines.append(
+        f"Runs: {runs['total']} ({runs['blocked']} blocked), "
+        f"{runs['first_timestamp']} .. {runs['last_timestamp']}"
+    )
+    lines.append("")
+    lines.append(f"_{report['method']['note']}_")
+    lines.append("")
+
+    for title, key, col in (
+        ("Most common out-of-bounds paths", "out_of_bounds_paths", "path"),
+        ("Repeated forbidden touches", "forbidden_paths", "path"),
+        ("Forbidden touches by path class", "forbidden_by_path_class", "path_class"),
+    ):
+        lines.append(f"## {title}")
+        rows = report[key]
+        if not rows:
+            lines.append("- <none>")
+        for r in rows:
+            lines.append(f"- `{r[col]}`: {r['count']} (±{r['error']})")
+        lines.append("")
+
+    lines.append("## Under-permissive contracts (missing authority)")
+    if not report["under_permissive_contracts"]:
+        lines.append("- <none>")
+    for c in report["under_permissive_contracts"]:
+        classes = ", ".join(f"`{r['path_class']}`" for r in c["top_path_classes"])
+        lines.append(
+            f"- {c['decision_id']}: {c['out_of_bounds_rate']:.0%} of runs out of bounds ({classes})"
+        )
+    lines.append("")
+
+    lines.append("## Over-permissive contracts")
+    if not report["over_permissive_contracts"]:
+        lines.append("- <none>")
+    for c in report["over_permissive_contracts"]:
+        lines.append(f"- {c['decision_id']}: {'; '.join(c['reasons'])}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def write_pressure_report(out_dir: Path, report: dict[str, Any]) -> tuple[Path, Path]:
+    ensure_dir(out_dir)
+    json_path = out_dir / "boundary_pressure.json"
+    md_path = out_dir / "boundary_pressure.md"
+    with json_path.open("w", encoding="utf-8") as f:
+        write_json(report, f)
+    md_path.write_text(_render_markdown(report), encoding="utf-8", errors="surrogateescape")
+    return json_path, md_path
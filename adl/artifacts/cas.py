@@ -0,0 +1,217 @@
+"""
+Content-addressed snapshot store.
+
+Layout under `<artifacts>/cas/`:
+
+    objects/ab/<sha256>.json[.gz|.xz]   compact JSON snapshot minus its per-run
+                                        fields (timestamp, profile)
+    refs.jsonl                          one line per run: decision_id, timestamp,
+                                        digest, object[, profile]
+    .lock                               writer lock
+
+The digest covers the canonical compact JSON of the snapshot without
+`timestamp` and `profile` (timings differ on every run, so they travel with the
+ref), so CI re-runs that reach the same verdict on the same diff store their
+body once and only add a ref line. Objects are written atomically (temp file +
+rename) and never modified; compression is applied after hashing, so the digest
+does not depend on the codec and an object already stored with any codec is
+reused. A new object and its directory entry are fsynced before its ref is
+appended (under an exclusive lock, like the ledger index), so a durable ref
+never points at a missing or empty object.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import lzma
+import os
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from adl.utils.io import atomic_write_bytes, exclusive_lock, fsync_dir
+
+CAS_DIRNAME = "cas"
+OBJECTS_DIRNAME = "objects"
+REFS_FILENAME = "refs.jsonl"
+LOCK_FILENAME = ".lock"
+
+# codec -> object file suffix
+CODECS: dict[str, str] = {"none": ".json", "gzip": ".json.gz", "lzma": ".json.xz"}
+
+
+@dataclass(frozen=True)
+class CasRef:
+    decision_id: str
+    timestamp: str
+    digest: str
+    object: str  # path relative to the store root
+    profile: dict[str, Any] | None = None
+
+
+# Differ on every run, so they live on the ref rather than in the hashed body.
+_PER_RUN_FIELDS = frozenset({"timestamp", "profile"})
+
+
+def canonical_body(payload: dict[str, Any]) -> bytes:
+    """Compact, key-sorted JSON of the payload without its timestamp and profile."""
+    body = {k: v for k, v in payload.items() if k not in _PER_RUN_FIELDS}
+    return json.dumps(body, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _encode(data: bytes, codec: str) -> bytes:
+    if codec == "gzip":
+        return gzip.compress(data, mtime=0)
+    if codec == "lzma":
+        return lzma.compress(data, preset=6)
+    return data
+
+
+def _decode(data: bytes, name: str) -> bytes:
+    if name.endswith(".gz"):
+        return gzip.decompress(data)
+    if name.endswith(".xz"):
+        return lzma.decompress(data)
+    return data
+
+
+def _parse_ref(line: bytes) -> CasRef | None:
+    try:
+        obj: Any = json.loads(line)
+        return CasRef(**obj)
+    except (ValueError, TypeError):
+        return None  # torn final line of a crashed writer
+
+
+class CasStore:
+    def __init__(self, root: Path, codec: str = "none") -> None:
+        if codec not in CODECS:
+            raise ValueError(f"Unknown codec {codec!r}; expected one of {', '.join(CODECS)}.")
+        self.root = root
+        self.codec = codec
+
+    @classmethod
+    def for_artifacts(cls, artifacts_dir: Path, codec: str = "none") -> CasStore:
+        return cls(artifacts_dir / CAS_DIRNAME, codec=codec)
+
+    @property
+    def refs_path(self) -> Path:
+        return self.root / REFS_FILENAME
+
+    def _existing(self, digest: str) -> str | None:
+        for suffix in CODECS.values():
+            rel = f"{OBJECTS_DIRNAME}/{digest[:2]}/{digest}{suffix}"
+            if (self.root / rel).exists():
+                return rel
+        return None
+
+    # -- writing ---------------------------------------------------------------
+
+    def put(self, payload: dict[str, Any]) -> tuple[CasRef, bool]:
+        """
+        Store one snapshot payload (needs `decision_id` and `timestamp`).
+        Returns its ref and whether a new object was written.
+        """
+        body = canonical_body(payload)
+        digest = hashlib.sha256(body).hexdigest()
+        rel = self._existing(digest)
+        created = rel is None
+        if rel is None:
+            rel = f"{OBJECTS_DIRNAME}/{digest[:2]}/{digest}{CODECS[self.codec]}"
+            shard = (self.root / rel).parent
+            new_shard = not shard.exists()
+            atomic_write_bytes(self.root / rel, _encode(body, self.codec), durable=True)
+            if new_shard:
+                fsync_dir(shard.parent)
+
+        profile = payload.get("profile")
+        ref = CasRef(
+            decision_id=str(payload["decision_id"]),
+            timestamp=str(payload["timestamp"]),
+            digest=digest,
+            object=rel,
+            profile=profile if isinstance(profile, dict) else None,
+        )
+        fields = asdict(ref)
+        if ref.profile is None:
+            del fields["profile"]
+        line = json.dumps(fields).encode("utf-8") + b"\n"
+        with exclusive_lock(self.root / LOCK_FILENAME), self.refs_path.open("ab") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        return ref, created
+
+    # -- reading ---------------------------------------------------------------
+
+    def refs(
+        self,
+        decision_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[CasRef]:
+        """Refs in append order; `since`/`until` bound the ISO timestamp."""
+        for ref, _ in self.refs_after(0):
+            if decision_id is not None and ref.decision_id != decision_id:
+                continue
+            if since is not None and ref.timestamp < since:
+                continue
+            if until is not None and ref.timestamp > until:
+                continue
+            yield ref
+
+    def refs_after(self, offset: int) -> Iterator[tuple[CasRef, int]]:
+        """Refs from byte `offset` of refs.jsonl on, each with the offset past its line."""
+        try:
+            f = self.refs_path.open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # a writer is mid-append
+                offset += len(line)
+                ref = _parse_ref(line)
+                if ref is not None:
+                    yield ref, offset
+
+    def _body(self, ref: CasRef) -> bytes:
+        return _decode((self.root / ref.object).read_bytes(), ref.object)
+
+    def load(self, ref: CasRef) -> dict[str, Any]:
+        """The snapshot payload behind a ref, timestamp (and profile) restored."""
+        return self._payload(self._body(ref), ref)
+
+    @staticmethod
+    def _payload(body: bytes, ref: CasRef) -> dict[str, Any]:
+        obj: dict[str, Any] = json.loads(body)
+        obj["timestamp"] = ref.timestamp
+        if ref.profile is not None:
+            obj["profile"] = ref.profile
+        return obj
+
+    def iter_records(self, refs: Iterator[CasRef]) -> Iterator[dict[str, Any]]:
+        # A body shared by consecutive refs (re-runs) is read and inflated once.
+        last: tuple[str, bytes] | None = None
+        for ref in refs:
+            if last is None or last[0] != ref.digest:
+                last = (ref.digest, self._body(ref))
+            yield self._payload(last[1], ref)
+
+    def history(
+        self,
+        decision_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        return self.iter_records(self.refs(decision_id, since, until))
+
+    def object_count(self) -> int:
+        objects = self.root / OBJECTS_DIRNAME
+        if not objects.is_dir():
+            return 0
+        return sum(1 for _ in objects.glob("*/*.json*"))
@@ -3,9 +3,24 @@ from __future__ import annotations
 from pathlib import Path
 
 from adl.engine.types import AdmissibilityResult
+from adl.utils.io import atomic_write_bytes
+from adl.utils.profiling import NULL_PROFILER, Profiler
 
 
-def write_decision_record(out_path: Path, result: AdmissibilityResult, timestamp: str) -> None:
+def write_decision_record(
+    out_path: Path,
+    result: AdmissibilityResult,
+    timestamp: str,
+    profiler: Profiler = NULL_PROFILER,
+) -> None:
+    with profiler.span("write_decision_record") as attrs:
+        text = _render(result, timestamp)
+        # surrogateescape: non-UTF-8 path bytes from git are written back verbatim.
+        atomic_write_bytes(out_path, text.encode("utf-8", "surrogateescape"))
+        attrs["chars"] = len(text)
+
+
+def _render(result: AdmissibilityResult, timestamp: str) -> str:
     lines: list[str] = []
     status = "ADMITTED (commit-time)" if result.admitted else "REJECTED (commit-time)"
 
@@ -18,12 +33,21 @@ def write_decision_record(out_path: Path, result: AdmissibilityResult, timestamp
         lines.append(f"- {c.name}: {c.status} — {c.detail}")
     lines.append("")
     lines.append("## Changed paths (evidence)")
+    if result.evidence is not None:
+        total = result.evidence["changed_path_count"]
+        lines.append(f"Showing {len(result.changed_paths)} of {total} changed paths.")
+        lines.append("")
     if result.changed_paths:
         for p in result.changed_paths:
             lines.append(f"- {p}")
     else:
         lines.append("- <none detected>")
     lines.append("")
+    if result.evidence is not None and result.evidence["directories"]:
+        lines.append("## Changed directories (changed / forbidden / out-of-bounds)")
+        for d, c in result.evidence["directories"].items():
+            lines.append(f"- {d}: {c['changed']} / {c['forbidden']} / {c['out_of_bounds']}")
+        lines.append("")
     if result.failures:
         lines.append("## Failures (non-admissible)")
         for f in result.failures:
@@ -40,5 +64,4 @@ def write_decision_record(out_path: Path, result: AdmissibilityResult, timestamp
         "this document explains why the transition was allowed."
     )
     lines.append("")
-
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+    return "\n".join(lines)
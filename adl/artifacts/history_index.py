@@ -0,0 +1,466 @@
+"""
+SQLite index over stored snapshots (`adl query`).
+
+`<artifacts>/.adl-index/history.sqlite3` holds one row per stored snapshot in
+`runs`, plus its `checks`, `failures` and `changed_paths`. It is filled
+incrementally:
+
+- ledger and CAS: `sources` keeps the byte offset reached in
+  `ledger/index.jsonl` and `cas/refs.jsonl`; a sync reads only the lines after
+  it (see Ledger.entries_after / CasStore.refs_after)
+- `snapshots/*.json`: `files` keeps each file's (mtime_ns, size); a file that
+  changed since is indexed as a new run. The file store keeps one file per
+  decision, so earlier runs stay queryable here after the file is replaced.
+
+The CLI indexes after every snapshot write and syncs before every query, so the
+index needs no maintenance; `adl query reindex` rebuilds it from scratch.
+
+Runs are indexed by decision_id, timestamp and status. Changed paths are
+stored as UTF-8 BLOBs with the `surrogatepass` scheme PathTable uses, so file
+names that are not valid UTF-8 (lone surrogates after os.fsdecode) round-trip.
+They are matched by prefix as a byte range (`path >= 'src/' AND path < 'src0'`),
+which uses the path index instead of scanning.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any, TypeVar
+
+from adl.artifacts.cas import CAS_DIRNAME, CasStore
+from adl.artifacts.ledger import LEDGER_DIRNAME, Ledger
+from adl.artifacts.snapshot import snapshot_changed_paths
+
+INDEX_DIRNAME = ".adl-index"
+DB_FILENAME = "history.sqlite3"
+SCHEMA_VERSION = "2"
+_BATCH = 1000
+_ERRORS = "surrogatepass"
+_ANALYZE_AFTER = 10_000
+
+_T = TypeVar("_T")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS sources (name TEXT PRIMARY KEY, position INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS files (
+    name TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    decision_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    status TEXT NOT NULL,
+    source TEXT NOT NULL,
+    locator TEXT NOT NULL,
+    path_count INTEGER NOT NULL,
+    UNIQUE (source, locator)
+);
+CREATE INDEX IF NOT EXISTS runs_decision ON runs (decision_id, timestamp);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status, timestamp);
+CREATE TABLE IF NOT EXISTS checks (
+    run_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    status TEXT NOT NULL,
+    detail TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS checks_run ON checks (run_id);
+CREATE INDEX IF NOT EXISTS checks_status ON checks (status, name);
+CREATE TABLE IF NOT EXISTS failures (run_id INTEGER NOT NULL, message TEXT NOT NULL);
+CREATE INDEX IF NOT EXISTS failures_run ON failures (run_id);
+CREATE TABLE IF NOT EXISTS changed_paths (run_id INTEGER NOT NULL, path BLOB NOT NULL);
+CREATE INDEX IF NOT EXISTS changed_paths_path ON changed_paths (path, run_id);
+"""
+_TABLES = ("meta", "sources", "files", "runs", "checks", "failures", "changed_paths")
+
+
+def _batched(items: Iterable[_T], n: int) -> Iterator[list[_T]]:
+    it = iter(items)
+    while batch := list(itertools.islice(it, n)):
+        yield batch
+
+
+def encode_path(path: str) -> bytes:
+    return path.encode("utf-8", _ERRORS)
+
+
+def decode_path(data: bytes) -> str:
+    return data.decode("utf-8", _ERRORS)
+
+
+def _text(value: object) -> str:
+    # Messages and names are display text: escape lone surrogates sqlite cannot store.
+    s = str(value)
+    return s if s.isascii() else s.encode("utf-8", "backslashreplace").decode("utf-8")
+
+
+def _prefix_end(prefix: bytes) -> bytes | None:
+    # Smallest byte string greater than every string starting with `prefix`.
+    head = prefix.rstrip(b"\xff")
+    if not head:
+        return None
+    return head[:-1] + bytes([head[-1] + 1])
+
+
+class HistoryIndex:
+    def __init__(self, db_path: Path) -> None:
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(db_path, timeout=30.0)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None or row[0] != SCHEMA_VERSION:
+            # Column types may have changed: recreate the tables, then rebuild lazily.
+            with self._db:
+                for table in _TABLES:
+                    self._db.execute(f"DROP TABLE IF EXISTS {table}")
+            self._db.executescript(_SCHEMA)
+            self.clear()
+
+    @classmethod
+    def for_artifacts(cls, artifacts_dir: Path) -> HistoryIndex:
+        return cls(artifacts_dir / INDEX_DIRNAME / DB_FILENAME)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> HistoryIndex:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- writing ---------------------------------------------------------------
+
+    def clear(self) -> None:
+        with self._db:
+            for table in _TABLES:
+                self._db.execute(f"DELETE FROM {table}")
+            self._db.execute(
+                "INSERT INTO meta (key, value) VALUES ('schema_version', ?)", (SCHEMA_VERSION,)
+            )
+
+    def _position(self, name: str) -> int:
+        row = self._db.execute("SELECT position FROM sources WHERE name = ?", (name,)).fetchone()
+        return int(row[0]) if row else 0
+
+    def _set_position(self, name: str, position: int) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO sources (name, position) VALUES (?, ?)", (name, position)
+        )
+
+    def _drop_source(self, source: str) -> None:
+        runs = "SELECT id FROM runs WHERE source = ?"
+        for table in ("checks", "failures", "changed_paths"):
+            self._db.execute(f"DELETE FROM {table} WHERE run_id IN ({runs})", (source,))
+        self._db.execute("DELETE FROM runs WHERE source = ?", (source,))
+
+    def add(self, record: dict[str, Any], source: str, locator: str) -> bool:
+        """Index one snapshot record; False if (source, locator) is already indexed."""
+        paths = snapshot_changed_paths(record)
+        cur = self._db.execute(
+            "INSERT OR IGNORE INTO runs"
+            " (decision_id, timestamp, status, source, locator, path_count)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                _text(record.get("decision_id", "UNKNOWN")),
+                _text(record.get("timestamp", "")),
+                "admitted" if record.get("admitted") else "rejected",
+                source,
+                locator,
+                len(paths),
+            ),
+        )
+        if cur.rowcount == 0:
+            return False
+        run_id = cur.lastrowid
+        self._db.executemany(
+            "INSERT INTO checks (run_id, name, status, detail) VALUES (?, ?, ?, ?)",
+            (
+                (run_id, _text(c.get("name")), _text(c.get("status")), _text(c.get("detail", "")))
+                for c in record.get("checks") or []
+                if isinstance(c, dict)
+            ),
+        )
+        self._db.executemany(
+            "INSERT INTO failures (run_id, message) VALUES (?, ?)",
+            ((run_id, _text(m)) for m in record.get("failures") or []),
+        )
+        self._db.executemany(
+            "INSERT INTO changed_paths (run_id, path) VALUES (?, ?)",
+            ((run_id, encode_path(p)) for p in paths),
+        )
+        return True
+
+    def add_all(self, items: Iterable[tuple[dict[str, Any], str, str]]) -> int:
+        """`add` for many (record, source, locator) items in one transaction."""
+        with self._db:
+            added = sum(self.add(record, source, locator) for record, source, locator in items)
+        if added >= _ANALYZE_AFTER:
+            self.optimize()
+        return added
+
+    def sync(self, artifacts_dir: Path, scan_files: bool = True) -> int:
+        """Index snapshots stored since the last sync; returns the number of new runs."""
+        with self._db:
+            added = self._sync_ledger(Ledger(artifacts_dir / LEDGER_DIRNAME))
+            added += self._sync_cas(CasStore(artifacts_dir / CAS_DIRNAME))
+            if scan_files:
+                added += self._sync_files(artifacts_dir / "snapshots")
+        if added >= _ANALYZE_AFTER:
+            self.optimize()
+        return added
+
+    def optimize(self) -> None:
+        # Table statistics let the planner pick e.g. the timestamp index over the
+        # status index when a window is narrow.
+        self._db.execute("ANALYZE")
+
+    def reindex(self, artifacts_dir: Path) -> int:
+        self.clear()
+        return self.sync(artifacts_dir)
+
+    def _start(self, source: str, log: Path) -> int:
+        # A log shorter than what was indexed was replaced: index it again.
+        start = self._position(source)
+        size = log.stat().st_size if log.exists() else 0
+        if size < start:
+            self._drop_source(source)
+            start = 0
+        return start
+
+    def _sync_ledger(self, ledger: Ledger) -> int:
+        added = 0
+        for batch in _batched(
+            ledger.entries_after(self._start("ledger", ledger.index_path)), _BATCH
+        ):
+            entries = [e for e, _ in batch]
+            for entry, record in zip(entries, ledger.iter_records(iter(entries)), strict=True):
+                added += self.add(record, "ledger", f"{entry.segment}:{entry.offset}")
+            self._set_position("ledger", batch[-1][1])
+        return added
+
+    def _sync_cas(self, cas: CasStore) -> int:
+        added = 0
+        for batch in _batched(cas.refs_after(self._start("cas", cas.refs_path)), _BATCH):
+            refs = [r for r, _ in batch]
+            # Re-runs share digest and object; the refs.jsonl offset tells them apart.
+            ends = [end for _, end in batch]
+            for end, record in zip(ends, cas.iter_records(iter(refs)), strict=True):
+                added += self.add(record, "cas", str(end))
+            self._set_position("cas", batch[-1][1])
+        return added
+
+    def _sync_files(self, snapshots_dir: Path) -> int:
+        try:
+            dir_mtime = snapshots_dir.stat().st_mtime_ns
+        except FileNotFoundError:
+            return 0
+        if dir_mtime == self._position("snapshots_dir"):
+            return 0
+        known = {
+            name: (mtime, size)
+            for name, mtime, size in self._db.execute("SELECT name, mtime_ns, size FROM files")
+        }
+        added = 0
+        with os.scandir(snapshots_dir) as it:
+            for e in it:
+                if not e.name.endswith(".json") or not e.is_file():
+                    continue
+                st = e.stat()
+                if known.get(_text(e.name)) != (st.st_mtime_ns, st.st_size):
+                    added += self._index_file(Path(e.path), st)
+        self._set_position("snapshots_dir", dir_mtime)
+        return added
+
+    def _index_file(self, path: Path, st: os.stat_result) -> bool:
+        self._db.execute(
+            "INSERT OR REPLACE INTO files (name, mtime_ns, size) VALUES (?, ?, ?)",
+            (_text(path.name), st.st_mtime_ns, st.st_size),
+        )
+        try:
+            record: Any = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return False
+        if not isinstance(record, dict):
+            return False
+        return self.add(record, "file", _text(f"{path.name}@{record.get('timestamp', '')}"))
+
+    def index_file(self, path: Path) -> bool:
+        """Index one snapshot file just written (no directory scan)."""
+        with self._db:
+            return self._index_file(path, path.stat())
+
+    # -- queries ---------------------------------------------------------------
+
+    def runs(
+        self,
+        decision_id: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        path_prefix: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Matching runs, oldest first, each with its failure messages."""
+        where: list[str] = []
+        args: list[Any] = []
+        if decision_id is not None:
+            where.append("decision_id = ?")
+            args.append(decision_id)
+        if status is not None:
+            where.append("status = ?")
+            args.append(status)
+        if since is not None:
+            where.append("timestamp >= ?")
+            args.append(since)
+        if until is not None:
+            where.append("timestamp <= ?")
+            args.append(until)
+        if path_prefix:
+            start = encode_path(path_prefix)
+            end = _prefix_end(start)
+            if end is None:
+                where.append("id IN (SELECT run_id FROM changed_paths WHERE path >= ?)")
+                args.append(start)
+            else:
+                where.append(
+                    "id IN (SELECT run_id FROM changed_paths WHERE path >= ? AND path < ?)"
+                )
+                args.extend((start, end))
+        sql = "SELECT id, decision_id, timestamp, status, source, locator, path_count FROM runs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY timestamp, id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        cur = self._db.execute(sql, args)
+        while rows := cur.fetchmany(_BATCH):
+            failures = self._failures([r[0] for r in rows])
+            for run_id, did, ts, st, source, locator, path_count in rows:
+                yield {
+                    "decision_id": did,
+                    "timestamp": ts,
+                    "admitted": st == "admitted",
+                    "source": source,
+                    "locator": locator,
+                    "path_count": path_count,
+                    "failures": failures.get(run_id, []),
+                }
+
+    def _failures(self, run_ids: list[int]) -> dict[int, list[str]]:
+        out: dict[int, list[str]] = {}
+        marks = ",".join("?" * len(run_ids))
+        for run_id, message in self._db.execute(
+            f"SELECT run_id, message FROM failures WHERE run_id IN ({marks}) ORDER BY rowid",
+            run_ids,
+        ):
+            out.setdefault(run_id, []).append(message)
+        return out
+
+    def flips(
+        self,
+        to_status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        decision_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Runs whose status differs from the previous run of the same decision."""
+        inner_where = ""
+        args: list[Any] = []
+        if decision_id is not None:
+            inner_where = " WHERE decision_id = ?"
+            args.append(decision_id)
+        where = ["previous_status IS NOT NULL", "previous_status != status"]
+        if to_status is not None:
+            where.append("status = ?")
+            args.append(to_status)
+        if since is not None:
+            where.append("timestamp >= ?")
+            args.append(since)
+        if until is not None:
+            where.append("timestamp <= ?")
+            args.append(until)
+        sql = (
+            "SELECT decision_id, timestamp, status, previous_timestamp, previous_status FROM ("
+            " SELECT decision_id, timestamp, status, id,"
+            "  LAG(status) OVER w AS previous_status,"
+            "  LAG(timestamp) OVER w AS previous_timestamp"
+            f" FROM runs{inner_where}"
+            " WINDOW w AS (PARTITION BY decision_id ORDER BY timestamp, id)"
+            f") WHERE {' AND '.join(where)} ORDER BY timestamp, id"
+        )
+        for did, ts, st, prev_ts, prev_st in self._db.execute(sql, args):
+            yield {
+                "decision_id": did,
+                "timestamp": ts,
+                "from": prev_st,
+                "to": st,
+                "previous_timestamp": prev_ts,
+            }
+
+    def check_counts(
+        self,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        decision_id: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Runs per (check name, status), most frequent first."""
+        where: list[str] = []
+        args: list[Any] = []
+        if status is not None:
+            where.append("c.status = ?")
+            args.append(status)
+        if decision_id is not None:
+            where.append("r.decision_id = ?")
+            args.append(decision_id)
+        if since is not None:
+            where.append("r.timestamp >= ?")
+            args.append(since)
+        if until is not None:
+            where.append("r.timestamp <= ?")
+            args.append(until)
+        # With a decision or time filter, walk the matching runs first (CROSS JOIN
+        # fixes the order); the planner cannot tell how narrow a window is.
+        narrow = decision_id is not None or since is not None or until is not None
+        join = "runs r CROSS JOIN checks c" if narrow else "checks c JOIN runs r"
+        sql = f"SELECT c.name, c.status, COUNT(*) FROM {join} ON r.id = c.run_id"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " GROUP BY c.name, c.status ORDER BY COUNT(*) DESC, c.name, c.status"
+        for name, st, count in self._db.execute(sql, args):
+            yield {"name": name, "status": st, "runs": count}
+
+    def run_count(self) -> int:
+        return int(self._db.execute("SELECT COUNT(*) FROM runs").fetchone()[0])
+
+
+def index_written(artifacts_dir: Path, snapshot_file: Path | None = None) -> None:
+    """
+    Bring the index up to date after a snapshot write: the one file for the
+    file store, else the ledger/CAS tail. Indexing never fails the write; a
+    later query or reindex catches up.
+    """
+    # ValueError covers text sqlite3 cannot encode, should a record carry any.
+    with (
+        contextlib.suppress(sqlite3.Error, OSError, ValueError),
+        HistoryIndex.for_artifacts(artifacts_dir) as index,
+    ):
+        if snapshot_file is not None:
+            index.index_file(snapshot_file)
+        else:
+            index.sync(artifacts_dir, scan_files=False)
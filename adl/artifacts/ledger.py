@@ -0,0 +1,307 @@
+"""
+Append-only snapshot ledger.
+
+Layout under `<artifacts>/ledger/`:
+
+    segment-000001.jsonl[.gz]   one compact JSON snapshot per line
+    index.jsonl                 one line per record: decision_id, timestamp,
+                                segment, offset, length
+    .lock                       writer lock
+
+Segments rotate once they reach `max_segment_bytes`. Compressed segments store
+each record as its own gzip member, so a record can be read from its offset
+without inflating the rest of the segment (and the file is still a valid .gz).
+
+A record is committed when its index line is written: the record is appended
+and fsynced first, then the index line. Writers hold an exclusive lock, so
+concurrent CI jobs on a shared volume serialize; readers take no lock and only
+follow the index. The next writer repairs what a killed writer (or a lost
+index) left behind: complete records past the last index line get their index
+lines back, and only a torn trailing record is truncated.
+
+Per-decision reads scan `index.jsonl` (small fixed-shape lines) and then seek
+straight to the matching records; the segments themselves are never scanned.
+For indexed lookups over large histories use `adl query` (history_index).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+import zlib
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import IO, Any
+
+from adl.utils.io import exclusive_lock, fsync_dir
+
+LEDGER_DIRNAME = "ledger"
+INDEX_FILENAME = "index.jsonl"
+LOCK_FILENAME = ".lock"
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+
+_SEGMENT_RE = re.compile(r"^segment-(\d{6})\.jsonl(\.gz)?$")
+_INDEX_TAIL_BYTES = 64 * 1024
+_SCAN_CHUNK = 64 * 1024
+
+
+@dataclass(frozen=True)
+class LedgerEntry:
+    decision_id: str
+    timestamp: str
+    segment: str
+    offset: int
+    length: int
+
+
+def _segment_name(number: int, compress: bool) -> str:
+    return f"segment-{number:06d}.jsonl" + (".gz" if compress else "")
+
+
+def _parse_index_line(line: bytes) -> LedgerEntry | None:
+    try:
+        obj: Any = json.loads(line)
+        return LedgerEntry(**obj)
+    except (ValueError, TypeError):
+        return None  # torn final line of a crashed writer
+
+
+def _scan_records(data: bytes, compressed: bool) -> Iterator[tuple[int, int, dict[str, Any]]]:
+    """(offset, length, record) of the complete records in `data`, up to the first torn one."""
+    view = memoryview(data)
+    pos = 0
+    while pos < len(data):
+        if compressed:
+            d = zlib.decompressobj(wbits=31)  # one gzip member per record
+            chunks: list[bytes] = []
+            end = pos
+            try:
+                while not d.eof and end < len(data):
+                    chunks.append(d.decompress(view[end : end + _SCAN_CHUNK]))
+                    end += _SCAN_CHUNK
+            except zlib.error:
+                return
+            if not d.eof:
+                return
+            length = min(end, len(data)) - len(d.unused_data) - pos
+            line = b"".join(chunks)
+        else:
+            nl = data.find(b"\n", pos)
+            if nl < 0:
+                return
+            length = nl + 1 - pos
+            line = data[pos : nl + 1]
+        try:
+            obj = json.loads(line)
+            if not isinstance(obj, dict) or "decision_id" not in obj or "timestamp" not in obj:
+                return
+        except ValueError:
+            return
+        yield pos, length, obj
+        pos += length
+
+
+def _write_synced(f: IO[bytes], data: bytes) -> None:
+    f.write(data)
+    f.flush()
+    os.fsync(f.fileno())
+
+
+class Ledger:
+    def __init__(
+        self,
+        root: Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        compress: bool = False,
+    ) -> None:
+        self.root = root
+        self.max_segment_bytes = max_segment_bytes
+        self.compress = compress
+
+    @classmethod
+    def for_artifacts(cls, artifacts_dir: Path, compress: bool = False) -> Ledger:
+        return cls(artifacts_dir / LEDGER_DIRNAME, compress=compress)
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / INDEX_FILENAME
+
+    def segments(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        return sorted(n for n in os.listdir(self.root) if _SEGMENT_RE.match(n))
+
+    # -- writing ---------------------------------------------------------------
+
+    def append(self, record: dict[str, Any]) -> LedgerEntry:
+        """Append one snapshot payload (needs `decision_id` and `timestamp`)."""
+        line = json.dumps(record, sort_keys=True, separators=(",", ":")).encode("utf-8") + b"\n"
+        data = gzip.compress(line, mtime=0) if self.compress else line
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        with exclusive_lock(self.root / LOCK_FILENAME):
+            last = self._recover()
+            segment = self._target_segment(last, len(data))
+            seg_path = self.root / segment
+            created = not seg_path.exists()
+            with seg_path.open("ab") as f:
+                offset = f.tell()
+                _write_synced(f, data)
+            if created:
+                fsync_dir(self.root)
+
+            entry = LedgerEntry(
+                decision_id=str(record["decision_id"]),
+                timestamp=str(record["timestamp"]),
+                segment=segment,
+                offset=offset,
+                length=len(data),
+            )
+            with self.index_path.open("ab") as f:
+                _write_synced(f, json.dumps(asdict(entry)).encode("utf-8") + b"\n")
+            return entry
+
+    def _recover(self) -> LedgerEntry | None:
+        """
+        Drop a torn index tail, re-index complete records the index is missing and
+        truncate a torn trailing record; return the last entry.
+        """
+        try:
+            with self.index_path.open("rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - _INDEX_TAIL_BYTES))
+                tail = f.read()
+        except FileNotFoundError:
+            tail, size = b"", 0
+
+        end = tail.rfind(b"\n") + 1
+        if end < len(tail):
+            os.truncate(self.index_path, size - (len(tail) - end))
+        lines = tail[:end].splitlines()
+        last = _parse_index_line(lines[-1]) if lines else None
+
+        segments = self.segments()
+        if not segments or (last is None and lines):
+            return last
+        if last is None:
+            start, offset = 0, 0  # no index at all: every segment is re-indexed
+        elif last.segment in segments:
+            start, offset = segments.index(last.segment), last.offset + last.length
+        else:
+            return last
+
+        missing: list[LedgerEntry] = []
+        for segment in segments[start:]:
+            path = self.root / segment
+            with path.open("rb") as f:
+                f.seek(offset)
+                data = f.read()
+            good = 0
+            for pos, length, record in _scan_records(data, segment.endswith(".gz")):
+                missing.append(
+                    LedgerEntry(
+                        decision_id=str(record["decision_id"]),
+                        timestamp=str(record["timestamp"]),
+                        segment=segment,
+                        offset=offset + pos,
+                        length=length,
+                    )
+                )
+                good = pos + length
+            if segment == segments[-1] and good < len(data):
+                os.truncate(path, offset + good)  # only the torn tail
+            offset = 0
+
+        if missing:
+            with self.index_path.open("ab") as f:
+                _write_synced(
+                    f, b"".join(json.dumps(asdict(e)).encode("utf-8") + b"\n" for e in missing)
+                )
+            last = missing[-1]
+        return last
+
+    def _target_segment(self, last: LedgerEntry | None, size: int) -> str:
+        segments = self.segments()
+        if not segments:
+            return _segment_name(1, self.compress)
+        active = segments[-1]
+        m = _SEGMENT_RE.match(active)
+        assert m is not None
+        used = (last.offset + last.length) if last and last.segment == active else 0
+        same_format = bool(m.group(2)) == self.compress
+        if same_format and (used == 0 or used + size <= self.max_segment_bytes):
+            return active
+        return _segment_name(int(m.group(1)) + 1, self.compress)
+
+    # -- reading ---------------------------------------------------------------
+
+    def entries(
+        self,
+        decision_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[LedgerEntry]:
+        """Committed entries in append order; `since`/`until` bound the ISO timestamp."""
+        for entry, _ in self.entries_after(0):
+            if decision_id is not None and entry.decision_id != decision_id:
+                continue
+            if since is not None and entry.timestamp < since:
+                continue
+            if until is not None and entry.timestamp > until:
+                continue
+            yield entry
+
+    def entries_after(self, offset: int) -> Iterator[tuple[LedgerEntry, int]]:
+        """
+        Committed entries whose index line starts at byte `offset` or later, each
+        with the offset just past its line, so incremental readers can resume.
+        """
+        try:
+            f = self.index_path.open("rb")
+        except FileNotFoundError:
+            return
+        with f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # a writer is mid-append
+                offset += len(line)
+                entry = _parse_index_line(line)
+                if entry is not None:
+                    yield entry, offset
+
+    def iter_records(self, entries: Iterator[LedgerEntry]) -> Iterator[dict[str, Any]]:
+        """Load the records behind `entries`, keeping one segment open at a time."""
+        current: str | None = None
+        f: IO[bytes] | None = None
+        try:
+            for entry in entries:
+                if entry.segment != current:
+                    if f is not None:
+                        f.close()
+                    f = (self.root / entry.segment).open("rb")
+                    current = entry.segment
+                assert f is not None
+                f.seek(entry.offset)
+                data = f.read(entry.length)
+                if entry.segment.endswith(".gz"):
+                    data = gzip.decompress(data)
+                obj: dict[str, Any] = json.loads(data)
+                yield obj
+        finally:
+            if f is not None:
+                f.close()
+
+    def history(
+        self,
+        decision_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        return self.iter_records(self.entries(decision_id, since, until))
+
+    def count(self) -> int:
+        return sum(1 for _ in self.entries())
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+from adl.utils.io import atomic_write_bytes
+
+SHARDS_DIRNAME = "shards"
+
+
+def shard_path(shards_dir: Path, name: str, label: str) -> Path:
+    """`<shards_dir>/<decision_id or "batch">.<i>-of-<N>.shard.json`."""
+    return shards_dir / f"{name}.{label}.shard.json"
+
+
+def write_shard(shards_dir: Path, name: str, payload: dict[str, Any]) -> Path:
+    shard = payload["shard"]
+    out = shard_path(shards_dir, name, f"{shard['index']}-of-{shard['count']}")
+    data = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    atomic_write_bytes(out, data.encode("utf-8"))
+    return out
+
+
+def read_shards(shards_dir: Path, kind: str) -> dict[str, list[dict[str, Any]]]:
+    """Payloads of one kind grouped by file name prefix (decision_id, or "batch")."""
+    groups: dict[str, list[dict[str, Any]]] = {}
+    if not shards_dir.is_dir():
+        return groups
+    for p in sorted(shards_dir.glob("*.shard.json")):
+        payload: Any = json.loads(p.read_bytes())
+        if isinstance(payload, dict) and payload.get("kind") == kind:
+            name = p.name.rsplit(".", 3)[0]
+            groups.setdefault(name, []).append(payload)
+    return groups
@@ -1,21 +1,143 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 from pathlib import Path
 from typing import Any
 
+from adl.engine.pathtable import as_list, front_code, front_decode
 from adl.engine.types import AdmissibilityResult
+from adl.utils.io import atomic_text_writer, atomic_write_bytes, write_json
+from adl.utils.profiling import NULL_PROFILER, Profiler
 
 
-def write_snapshot(out_path: Path, result: AdmissibilityResult, timestamp: str) -> None:
+def _index_path(snapshots_dir: Path) -> Path:
+    # Kept outside snapshots_dir: writing it must not change the directory mtime it records.
+    return snapshots_dir.parent / ".adl-index" / f"{snapshots_dir.name}.json"
+
+
+def _count_snapshots(snapshots_dir: Path) -> int:
+    with os.scandir(snapshots_dir) as it:
+        return sum(1 for e in it if e.name.endswith(".json"))
+
+
+def _read_index(snapshots_dir: Path) -> dict[str, int] | None:
+    try:
+        obj: Any = json.loads(_index_path(snapshots_dir).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(obj, dict) or not isinstance(obj.get("count"), int):
+        return None
+    return obj
+
+
+def _write_index(snapshots_dir: Path, count: int, dir_mtime_ns: int) -> None:
+    payload = {"count": count, "dir_mtime_ns": dir_mtime_ns}
+    with contextlib.suppress(OSError):
+        atomic_write_bytes(_index_path(snapshots_dir), json.dumps(payload).encode("utf-8"))
+
+
+def snapshot_count(snapshots_dir: Path) -> int:
+    """
+    Number of *.json snapshots, served from the index written alongside snapshots.
+    The index records the directory mtime; any add/remove done outside
+    write_snapshot changes it and triggers a single rescan.
+    """
+    try:
+        mtime_ns = snapshots_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return 0
+    index = _read_index(snapshots_dir)
+    if index is not None and index.get("dir_mtime_ns") == mtime_ns:
+        return index["count"]
+    count = _count_snapshots(snapshots_dir)
+    _write_index(snapshots_dir, count, mtime_ns)
+    return count
+
+
+def _record_write(out_path: Path, created: bool, mtime_before: int | None) -> None:
+    snapshots_dir = out_path.parent
+    index = _read_index(snapshots_dir)
+    mtime_after = snapshots_dir.stat().st_mtime_ns
+    if index is not None and index.get("dir_mtime_ns") == mtime_before:
+        count = index["count"] + int(created and out_path.name.endswith(".json"))
+    else:
+        count = _count_snapshots(snapshots_dir)
+    _write_index(snapshots_dir, count, mtime_after)
+
+
+FRONT_CODED_KEY = "changed_paths_front_coded"
+
+
+def snapshot_payload(
+    result: AdmissibilityResult, timestamp: str, compact_paths: bool = False
+) -> dict[str, Any]:
+    """
+    The snapshot document; also the record format of the append-only ledger.
+    With `compact_paths`, changed paths are stored front-coded under
+    `changed_paths_front_coded` (see adl.engine.pathtable); readers go through
+    `snapshot_changed_paths` / `expand_snapshot`.
+    """
     payload: dict[str, Any] = {
         "decision_id": result.decision_id,
         "timestamp": timestamp,
         "admitted": result.admitted,
-        "checks": [c.__dict__ for c in result.checks],
-        "changed_paths": result.changed_paths,
+        "checks": [c.to_dict() for c in result.checks],
         "warnings": result.warnings,
         "failures": result.failures,
         "schema_version": result.schema_version,
     }
-    out_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+    if compact_paths:
+        payload[FRONT_CODED_KEY] = front_code(result.changed_paths)
+    else:
+        payload["changed_paths"] = as_list(result.changed_paths)
+    if result.evidence is not None:
+        payload["evidence"] = result.evidence
+    if result.profile is not None:
+        payload["profile"] = result.profile
+    return payload
+
+
+def snapshot_changed_paths(record: dict[str, Any]) -> list[str]:
+    """`changed_paths` of a stored snapshot, in either encoding."""
+    coded = record.get(FRONT_CODED_KEY)
+    if isinstance(coded, list):
+        return list(front_decode(coded))
+    return [str(p) for p in record.get("changed_paths") or []]
+
+
+def expand_snapshot(record: dict[str, Any]) -> dict[str, Any]:
+    """The record with front-coded paths decoded back to a plain `changed_paths` list."""
+    if FRONT_CODED_KEY not in record:
+        return record
+    out = {k: v for k, v in record.items() if k != FRONT_CODED_KEY}
+    out["changed_paths"] = snapshot_changed_paths(record)
+    return out
+
+
+def write_snapshot(
+    out_path: Path,
+    result: AdmissibilityResult,
+    timestamp: str,
+    profiler: Profiler = NULL_PROFILER,
+    compact_paths: bool = False,
+) -> None:
+    with profiler.span("write_snapshot") as attrs:
+        _write_snapshot(out_path, result, timestamp, compact_paths)
+        attrs["bytes"] = out_path.stat().st_size if profiler.enabled else 0
+
+
+def _write_snapshot(
+    out_path: Path, result: AdmissibilityResult, timestamp: str, compact_paths: bool
+) -> None:
+    payload = snapshot_payload(result, timestamp, compact_paths)
+    created = not out_path.exists()
+    try:
+        mtime_before: int | None = out_path.parent.stat().st_mtime_ns
+    except FileNotFoundError:
+        mtime_before = None
+    # Atomic: a reader (or a killed writer) never sees a half-written snapshot.
+    with atomic_text_writer(out_path) as f:
+        write_json(payload, f)
+    _record_write(out_path, created, mtime_before)
@@ -1,19 +1,28 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import os
 import sys
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
+from enum import StrEnum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import typer
-import yaml
 
-from adl.artifacts.decision_record import write_decision_record
-from adl.artifacts.snapshot import write_snapshot
-from adl.engine.debt import compute_debt_report
-from adl.engine.evaluator import evaluate_admissibility
-from adl.utils.io import ensure_dir, now_utc_iso
+from adl.utils.io import ensure_dir, now_utc_iso, write_json
+from adl.utils.profiling import NULL_PROFILER, PROFILE_HOOK_ENV, Profiler, load_hook
+
+# Engine modules (yaml, jsonschema, ...) are imported inside the commands that
+# need them; see docs/performance.md for the cold-start budget.
+if TYPE_CHECKING:
+    from adl.artifacts.history_index import HistoryIndex
+    from adl.engine.contracts import CacheStats, ContractCache
+    from adl.engine.routing import RouteDecision
+    from adl.engine.sharding import Shard
+    from adl.engine.types import AdmissibilityResult
 
 app = typer.Typer(
     add_completion=False,
@@ -28,14 +37,58 @@ class Paths:
     contracts_dir: Path
 
 
-def _load_contract(path: Path) -> dict[str, Any]:
-    if not path.exists():
-        raise FileNotFoundError(f"Contract not found: {path}")
-    with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not isinstance(data, dict):
-        raise ValueError("Decision contract must be a YAML mapping/object.")
-    return data
+class SnapshotStore(StrEnum):
+    file = "file"
+    ledger = "ledger"
+    ledger_gz = "ledger-gz"
+    cas = "cas"
+    cas_gz = "cas-gz"
+    cas_xz = "cas-xz"
+
+
+_STORE_HELP = (
+    "Where snapshots go: file (snapshots/<id>.snapshot.json), ledger, ledger-gz, "
+    "or the deduplicating content-addressed store: cas, cas-gz, cas-xz."
+)
+_COMPACT_PATHS_HELP = "Front-code changed_paths in stored snapshots (readers decode them)."
+_CAS_CODECS = {
+    SnapshotStore.cas: "none",
+    SnapshotStore.cas_gz: "gzip",
+    SnapshotStore.cas_xz: "lzma",
+}
+
+
+def _load_contract(path: Path, cache: ContractCache | None = None) -> dict[str, Any]:
+    from adl.engine.contracts import load_contract
+
+    return load_contract(path, cache)
+
+
+# One cache per repo per process, so a resident `adl serve` keeps contracts warm.
+_contract_caches: dict[Path, ContractCache] = {}
+
+
+def _contract_cache(paths: Paths, enabled: bool) -> ContractCache | None:
+    if not enabled:
+        return None
+    from adl.engine.contracts import ContractCache
+
+    cache = _contract_caches.get(paths.repo_root)
+    if cache is None:
+        cache = _contract_caches[paths.repo_root] = ContractCache.for_repo(paths.repo_root)
+    return cache
+
+
+def _cache_stats_mark(cache: ContractCache | None) -> CacheStats:
+    from adl.engine.contracts import CacheStats
+
+    return CacheStats(**cache.stats.to_dict()) if cache is not None else CacheStats()
+
+
+def _echo_cache_stats(cache: ContractCache | None, mark: CacheStats, enabled: bool) -> None:
+    if enabled and cache is not None:
+        stats = cache.stats.since(mark).to_dict()
+        typer.echo(json.dumps({"contract_cache": stats}), err=True)
 
 
 def _resolve_paths(repo_root: Path, artifacts_dir: Path | None) -> Paths:
@@ -45,6 +98,201 @@ def _resolve_paths(repo_root: Path, artifacts_dir: Path | None) -> Paths:
     return Paths(repo_root=rr, artifacts_dir=artifacts, contracts_dir=contracts)
 
 
+def _echo_json(obj: dict[str, Any]) -> None:
+    # Incremental write; same bytes as typer.echo(json.dumps(obj, indent=2, sort_keys=True)).
+    write_json(obj, sys.stdout)
+    sys.stdout.write("\n")
+    sys.stdout.flush()
+
+
+def _store_snapshot(
+    paths: Paths,
+    result: AdmissibilityResult,
+    ts: str,
+    store: SnapshotStore,
+    profiler: Profiler = NULL_PROFILER,
+    compact_paths: bool = False,
+) -> Path:
+    from adl.artifacts.snapshot import write_snapshot
+
+    if store in _CAS_CODECS:
+        from adl.artifacts.cas import CasStore
+        from adl.artifacts.snapshot import snapshot_payload
+
+        cas = CasStore.for_artifacts(paths.artifacts_dir, codec=_CAS_CODECS[store])
+        with profiler.span("cas_put") as attrs:
+            ref, created = cas.put(snapshot_payload(result, ts, compact_paths))
+            attrs.update(digest=ref.digest, created=created)
+        _index_snapshot(paths, profiler)
+        return cas.root / ref.object
+
+    if store is not SnapshotStore.file:
+        from adl.artifacts.ledger import Ledger
+        from adl.artifacts.snapshot import snapshot_payload
+
+        ledger = Ledger.for_artifacts(
+            paths.artifacts_dir, compress=store is SnapshotStore.ledger_gz
+        )
+        with profiler.span("ledger_append") as attrs:
+            entry = ledger.append(snapshot_payload(result, ts, compact_paths))
+            attrs.update(segment=entry.segment, bytes=entry.length)
+        _index_snapshot(paths, profiler)
+        return ledger.root / entry.segment
+
+    ensure_dir(paths.artifacts_dir / "snapshots")
+    out_path = paths.artifacts_dir / "snapshots" / f"{result.decision_id}.snapshot.json"
+    write_snapshot(
+        out_path=out_path,
+        result=result,
+        timestamp=ts,
+        profiler=profiler,
+        compact_paths=compact_paths,
+    )
+    _index_snapshot(paths, profiler, out_path)
+    return out_path
+
+
+def _index_snapshot(paths: Paths, profiler: Profiler, snapshot_file: Path | None = None) -> None:
+    # Keeps `adl query` incremental; see adl.artifacts.history_index.
+    from adl.artifacts.history_index import index_written
+
+    with profiler.span("history_index"):
+        index_written(paths.artifacts_dir, snapshot_file)
+
+
+def _profiler(enabled: bool) -> Profiler:
+    if not enabled:
+        return NULL_PROFILER
+    hook = os.environ.get(PROFILE_HOOK_ENV)
+    return Profiler(hooks=[load_hook(hook)] if hook else [])
+
+
+def _write_artifacts(
+    paths: Paths,
+    result: AdmissibilityResult,
+    ts: str,
+    store: SnapshotStore = SnapshotStore.file,
+    profiler: Profiler = NULL_PROFILER,
+    compact_paths: bool = False,
+) -> None:
+    from adl.artifacts.decision_record import write_decision_record
+
+    ensure_dir(paths.artifacts_dir / "decision_records")
+
+    record_path = (
+        paths.artifacts_dir
+        / "decision_records"
+        / f"{result.decision_id}.decision_record.md"
+    )
+
+    write_decision_record(out_path=record_path, result=result, timestamp=ts, profiler=profiler)
+    _store_snapshot(paths, result, ts, store, profiler, compact_paths)
+
+
+_RESULT_CACHE_HELP = (
+    "Reuse evaluation results stored in DIR (LRU, size-bounded; may be shared between runners)."
+)
+_SHARD_HELP = "Evaluate only shard i of N (e.g. 2/4); combine the partial snapshots with adl merge."
+
+
+def _parse_shard(spec: str | None, evidence_limit: int | None = None) -> Shard | None:
+    if spec is None:
+        return None
+    from adl.engine.sharding import Shard
+
+    if evidence_limit is not None:
+        raise typer.BadParameter("cannot be combined with --evidence-limit", param_hint="--shard")
+    try:
+        return Shard.parse(spec)
+    except ValueError as e:
+        raise typer.BadParameter(str(e), param_hint="--shard") from e
+
+
+def _run_path_shard(
+    paths: Paths,
+    contract_path: Path,
+    strict: bool,
+    cache: bool,
+    write_artifacts: bool,
+    shard: Shard,
+    changed_paths: Sequence[str] | None,
+) -> None:
+    from adl.artifacts.shards import SHARDS_DIRNAME, write_shard
+    from adl.engine.diff_inspector import collect_changed_paths
+    from adl.engine.sharding import evaluate_path_shard, shard_admitted
+
+    contract_obj = _load_contract(contract_path, _contract_cache(paths, cache))
+    changed = collect_changed_paths(paths.repo_root) if changed_paths is None else changed_paths
+    payload = evaluate_path_shard(
+        paths.repo_root, contract_path, contract_obj, strict, shard, changed
+    )
+    if write_artifacts:
+        write_shard(paths.artifacts_dir / SHARDS_DIRNAME, payload["decision_id"], payload)
+    _echo_json(payload)
+
+    if not shard_admitted(payload):
+        raise typer.Exit(code=1)
+
+
+def _run_check(
+    paths: Paths,
+    contract_path: Path,
+    strict: bool,
+    evidence_limit: int | None,
+    cache: bool,
+    write_artifacts: bool,
+    store: SnapshotStore,
+    profiler: Profiler,
+    changed_paths: Sequence[str] | None = None,
+    extra: dict[str, Any] | None = None,
+    shard: Shard | None = None,
+    result_cache_dir: Path | None = None,
+    compact_paths: bool = False,
+) -> None:
+    """Shared by check/record/gate; `extra` keys are added to the stdout JSON."""
+    if shard is not None:
+        _run_path_shard(paths, contract_path, strict, cache, write_artifacts, shard, changed_paths)
+        return
+
+    import asyncio
+
+    from adl.engine.evaluator import evaluate_admissibility_async
+
+    result_cache = None
+    if result_cache_dir is not None:
+        from adl.engine.result_cache import ResultCache
+
+        result_cache = ResultCache.for_dir(result_cache_dir)
+
+    # git diff runs while the contract is parsed and checked.
+    result = asyncio.run(
+        evaluate_admissibility_async(
+            repo_root=paths.repo_root,
+            contract_path=contract_path,
+            strict=strict,
+            cache=_contract_cache(paths, cache),
+            changed_paths=changed_paths,
+            evidence_limit=evidence_limit,
+            profiler=profiler,
+            result_cache=result_cache,
+        )
+    )
+
+    if write_artifacts:
+        _write_artifacts(paths, result, now_utc_iso(), store, profiler, compact_paths)
+
+    out = result.to_dict()
+    if extra:
+        out.update(extra)
+    if profiler.enabled:
+        # The snapshot carries the evaluation stages; stdout also covers artifact writes.
+        out["profile"] = profiler.to_dict()
+    _echo_json(out)
+
+    if not result.admitted:
+        raise typer.Exit(code=1)
+
+
 @app.command("check")
 def check(
     contract: Path = typer.Option(..., "--contract", "-c", help="Path to Decision Contract YAML."),
@@ -64,42 +312,53 @@ def check(
         "--strict/--non-strict",
         help="Strict blocks on warnings.",
     ),
+    evidence_limit: int | None = typer.Option(
+        None,
+        "--evidence-limit",
+        min=1,
+        help="Stream changed paths and cap evidence lists at N (for very large diffs).",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from .adl-cache/ (keyed by content hash).",
+    ),
+    store: SnapshotStore = typer.Option(SnapshotStore.file, "--store", help=_STORE_HELP),
+    compact_paths: bool = typer.Option(False, "--compact-paths", help=_COMPACT_PATHS_HELP),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Add per-stage wall/CPU timings to the JSON output and snapshot.",
+    ),
+    shard: str | None = typer.Option(None, "--shard", help=_SHARD_HELP),
+    result_cache_dir: Path | None = typer.Option(
+        None,
+        "--result-cache-dir",
+        envvar="ADL_RESULT_CACHE_DIR",
+        help=_RESULT_CACHE_HELP,
+    ),
 ) -> None:
     """
     Validate a Decision Contract and run deterministic admissibility checks.
     Exit code 1 if non-admissible.
-    """
-    paths = _resolve_paths(repo_root, artifacts_dir)
-    contract_path = contract.resolve()
 
-    contract_obj = _load_contract(contract_path)
-    result = evaluate_admissibility(
-        repo_root=paths.repo_root,
-        contract_path=contract_path,
-        contract=contract_obj,
+    With --shard, only the shard's changed paths are matched and the output is a
+    partial snapshot (written to <artifacts>/shards/ with --write-artifacts).
+    """
+    _run_check(
+        paths=_resolve_paths(repo_root, artifacts_dir),
+        contract_path=contract.resolve(),
         strict=strict,
+        evidence_limit=evidence_limit,
+        cache=cache,
+        write_artifacts=write_artifacts,
+        store=store,
+        compact_paths=compact_paths,
+        profiler=_profiler(profile),
+        shard=_parse_shard(shard, evidence_limit),
+        result_cache_dir=result_cache_dir,
     )
 
-    if write_artifacts:
-        ensure_dir(paths.artifacts_dir / "decision_records")
-        ensure_dir(paths.artifacts_dir / "snapshots")
-        ts = now_utc_iso()
-
-        record_path = (
-            paths.artifacts_dir
-            / "decision_records"
-            / f"{result.decision_id}.decision_record.md"
-        )
-        snapshot_path = paths.artifacts_dir / "snapshots" / f"{result.decision_id}.snapshot.json"
-
-        write_decision_record(out_path=record_path, result=result, timestamp=ts)
-        write_snapshot(out_path=snapshot_path, result=result, timestamp=ts)
-
-    typer.echo(json.dumps(result.to_dict(), indent=2, sort_keys=True))
-
-    if not result.admitted:
-        raise typer.Exit(code=1)
-
 
 @app.command("record")
 def record(
@@ -115,6 +374,31 @@ def record(
         "--strict/--non-strict",
         help="Strict blocks on warnings.",
     ),
+    evidence_limit: int | None = typer.Option(
+        None,
+        "--evidence-limit",
+        min=1,
+        help="Stream changed paths and cap evidence lists at N (for very large diffs).",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from .adl-cache/ (keyed by content hash).",
+    ),
+    store: SnapshotStore = typer.Option(SnapshotStore.file, "--store", help=_STORE_HELP),
+    compact_paths: bool = typer.Option(False, "--compact-paths", help=_COMPACT_PATHS_HELP),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Add per-stage wall/CPU timings to the JSON output and snapshot.",
+    ),
+    shard: str | None = typer.Option(None, "--shard", help=_SHARD_HELP),
+    result_cache_dir: Path | None = typer.Option(
+        None,
+        "--result-cache-dir",
+        envvar="ADL_RESULT_CACHE_DIR",
+        help=_RESULT_CACHE_HELP,
+    ),
 ) -> None:
     """
     Run admissibility checks and ALWAYS write artifacts.
@@ -126,8 +410,310 @@ def record(
         artifacts_dir=artifacts_dir,
         write_artifacts=True,
         strict=strict,
+        evidence_limit=evidence_limit,
+        cache=cache,
+        store=store,
+        compact_paths=compact_paths,
+        profile=profile,
+        shard=shard,
+        result_cache_dir=result_cache_dir,
+    )
+
+
+_ROUTES_HELP = "Route table YAML (default: decisions/routes.yaml, else the built-in table)."
+_ROUTE_CONTRACT_HELP = "Override a route's contract, as NAME=PATH (repeatable)."
+
+
+def _route(
+    paths: Paths,
+    routes: Path | None,
+    explicit: Path | None,
+    route_contracts: list[str],
+    profiler: Profiler = NULL_PROFILER,
+) -> tuple[RouteDecision, Sequence[str]]:
+    """Compile the route table and classify one diff; the diff is returned for reuse."""
+    from adl.engine.diff_inspector import collect_changed_paths
+    from adl.engine.routing import load_route_table
+
+    overrides: dict[str, str] = {}
+    for item in route_contracts:
+        name, sep, contract = item.partition("=")
+        if not sep or not name or not contract:
+            raise typer.BadParameter(
+                f"Expected NAME=PATH, got {item!r}", param_hint="--route-contract"
+            )
+        overrides[name] = contract
+    try:
+        table = load_route_table(paths.repo_root, routes)
+        if overrides:
+            table = table.with_contracts(overrides)
+    except (OSError, ValueError) as e:
+        typer.echo(f"Invalid route table: {e}", err=True)
+        raise typer.Exit(code=2) from e
+
+    changed = collect_changed_paths(paths.repo_root, profiler)
+    with profiler.span("route") as attrs:
+        decision = table.route(changed, explicit=str(explicit) if explicit else None)
+        attrs["route"] = decision.route
+    return decision, changed
+
+
+def _github_output(decision: RouteDecision) -> None:
+    target = os.environ.get("GITHUB_OUTPUT")
+    if not target:
+        typer.echo("--github-output: GITHUB_OUTPUT is not set.", err=True)
+        raise typer.Exit(code=2)
+    with open(target, "a", encoding="utf-8") as f:
+        f.write(f"route={decision.route}\ncontract={decision.contract}\n")
+
+
+@app.command("route")
+def route(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    routes: Path | None = typer.Option(None, "--routes", help=_ROUTES_HELP),
+    contract: Path | None = typer.Option(
+        None, "--contract", "-c", help="Explicit contract; bypasses the route table."
+    ),
+    route_contract: list[str] = typer.Option([], "--route-contract", help=_ROUTE_CONTRACT_HELP),
+    github_output: bool = typer.Option(
+        False, "--github-output", help="Also append route= and contract= to $GITHUB_OUTPUT."
+    ),
+) -> None:
+    """
+    Select the governing contract for the current diff (JSON to stdout).
+    """
+    paths = _resolve_paths(repo_root, None)
+    decision, _ = _route(paths, routes, contract, route_contract)
+    if github_output:
+        _github_output(decision)
+    typer.echo(json.dumps(decision.to_dict(), indent=2, sort_keys=True))
+
+
+@app.command("gate")
+def gate(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    routes: Path | None = typer.Option(None, "--routes", help=_ROUTES_HELP),
+    contract: Path | None = typer.Option(
+        None, "--contract", "-c", help="Explicit contract; bypasses the route table."
+    ),
+    route_contract: list[str] = typer.Option([], "--route-contract", help=_ROUTE_CONTRACT_HELP),
+    strict: bool = typer.Option(
+        True,
+        "--strict/--non-strict",
+        help="Strict blocks on warnings.",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from .adl-cache/ (keyed by content hash).",
+    ),
+    store: SnapshotStore = typer.Option(SnapshotStore.file, "--store", help=_STORE_HELP),
+    compact_paths: bool = typer.Option(False, "--compact-paths", help=_COMPACT_PATHS_HELP),
+    github_output: bool = typer.Option(
+        False, "--github-output", help="Also append route= and contract= to $GITHUB_OUTPUT."
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Add per-stage wall/CPU timings to the JSON output and snapshot.",
+    ),
+    result_cache_dir: Path | None = typer.Option(
+        None,
+        "--result-cache-dir",
+        envvar="ADL_RESULT_CACHE_DIR",
+        help=_RESULT_CACHE_HELP,
+    ),
+) -> None:
+    """
+    Route the diff to its contract, then record it (like `adl record`).
+    The diff is collected once and shared by routing and evaluation.
+    """
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    profiler = _profiler(profile)
+    decision, changed = _route(paths, routes, contract, route_contract, profiler)
+    if github_output:
+        _github_output(decision)
+    typer.echo(f"Route: {decision.route} -> {decision.contract}", err=True)
+
+    _run_check(
+        paths=paths,
+        contract_path=(paths.repo_root / decision.contract).resolve(),
+        strict=strict,
+        evidence_limit=None,
+        cache=cache,
+        write_artifacts=True,
+        store=store,
+        compact_paths=compact_paths,
+        profiler=profiler,
+        changed_paths=changed,
+        extra={"route": decision.to_dict()},
+        result_cache_dir=result_cache_dir,
+    )
+
+
+@app.command("check-all")
+def check_all(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    write_artifacts: bool = typer.Option(
+        False,
+        "--write-artifacts",
+        help="Write decision_record + snapshot for every contract.",
+    ),
+    strict: bool = typer.Option(
+        True,
+        "--strict/--non-strict",
+        help="Strict blocks on warnings.",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes (default: CPU count).",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from .adl-cache/ (keyed by content hash).",
+    ),
+    cache_stats: bool = typer.Option(
+        False,
+        "--cache-stats",
+        help="Print contract parse-cache hit/miss stats to stderr.",
+    ),
+    store: SnapshotStore = typer.Option(SnapshotStore.file, "--store", help=_STORE_HELP),
+    compact_paths: bool = typer.Option(False, "--compact-paths", help=_COMPACT_PATHS_HELP),
+    shard: str | None = typer.Option(
+        None, "--shard", help="Evaluate only contract shard i of N (e.g. 2/4); see merge --batch."
+    ),
+) -> None:
+    """
+    Evaluate every contract under decisions/contracts/ against one diff.
+    Exit code 1 if any contract is non-admissible.
+    """
+    from adl.engine.batch import evaluate_all
+    from adl.engine.contracts import list_contracts
+
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    all_contracts = list_contracts(paths.contracts_dir)
+    shard_spec = _parse_shard(shard)
+    indices = list(range(len(all_contracts)))
+    if shard_spec is not None:
+        indices = [
+            i
+            for i in indices
+            if shard_spec.owns(all_contracts[i].relative_to(paths.repo_root).as_posix())
+        ]
+    contract_paths = [all_contracts[i] for i in indices]
+    contract_cache = _contract_cache(paths, cache)
+    mark = _cache_stats_mark(contract_cache)
+
+    batch = evaluate_all(
+        repo_root=paths.repo_root,
+        contract_paths=contract_paths,
+        strict=strict,
+        workers=workers,
+        cache=contract_cache,
+    )
+    _echo_cache_stats(contract_cache, mark, cache_stats)
+
+    if write_artifacts:
+        ts = now_utc_iso()
+        for _, result in batch.results:
+            _write_artifacts(paths, result, ts, store, compact_paths=compact_paths)
+
+    out = batch.to_dict()
+    if shard_spec is not None and write_artifacts:
+        from adl.artifacts.shards import SHARDS_DIRNAME, write_shard
+        from adl.engine.sharding import batch_shard_payload
+
+        payload = batch_shard_payload(shard_spec, out, indices, len(all_contracts))
+        write_shard(paths.artifacts_dir / SHARDS_DIRNAME, "batch", payload)
+    _echo_json(out)
+
+    if not batch.admitted:
+        raise typer.Exit(code=1)
+
+
+@app.command("merge")
+def merge(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir holding shards/ (default: ./artifacts).",
+    ),
+    decision_id: str | None = typer.Option(
+        None, "--decision-id", "-d", help="Which contract's shards (needed if several)."
+    ),
+    batch: bool = typer.Option(False, "--batch", help="Merge check-all --shard outputs."),
+    write_artifacts: bool = typer.Option(
+        True,
+        "--write-artifacts/--no-write-artifacts",
+        help="Write the merged decision_record + snapshot.",
+    ),
+    store: SnapshotStore = typer.Option(SnapshotStore.file, "--store", help=_STORE_HELP),
+    compact_paths: bool = typer.Option(False, "--compact-paths", help=_COMPACT_PATHS_HELP),
+) -> None:
+    """
+    Combine --shard partial snapshots into the single-node result.
+    Exit code 1 if non-admissible, 2 if shards are missing or inconsistent.
+    """
+    from adl.artifacts.shards import SHARDS_DIRNAME, read_shards
+    from adl.engine.sharding import (
+        BATCH_SHARD,
+        PATH_SHARD,
+        ShardError,
+        merge_batch_shards,
+        merge_path_shards,
     )
 
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    shards_dir = paths.artifacts_dir / SHARDS_DIRNAME
+    groups = read_shards(shards_dir, BATCH_SHARD if batch else PATH_SHARD)
+    if not batch and decision_id is None and len(groups) > 1:
+        names = ", ".join(groups)
+        typer.echo(f"Shards for several decisions; pass --decision-id ({names}).", err=True)
+        raise typer.Exit(code=2)
+    name = "batch" if batch else decision_id or next(iter(groups), "")
+
+    try:
+        payloads = groups.get(name, [])
+        if batch:
+            out = merge_batch_shards(payloads)
+            _echo_json(out)
+            if not out["admitted"]:
+                raise typer.Exit(code=1)
+            return
+
+        from adl.engine.checks import load_check_registry
+
+        registry = load_check_registry(paths.repo_root)
+        contract_obj = None
+        if payloads and registry.phase(needs_paths=True):
+            contract_obj = _load_contract(paths.repo_root / payloads[0]["contract_path"])
+        result = merge_path_shards(payloads, registry, contract_obj)
+    except ShardError as e:
+        typer.echo(f"{shards_dir}: {e}", err=True)
+        raise typer.Exit(code=2) from e
+
+    if write_artifacts:
+        _write_artifacts(paths, result, now_utc_iso(), store, compact_paths=compact_paths)
+    _echo_json(result.to_dict())
+
+    if not result.admitted:
+        raise typer.Exit(code=1)
+
 
 @app.command("snapshot")
 def snapshot(
@@ -138,11 +724,15 @@ def snapshot(
         "--artifacts-dir",
         help="Artifacts dir (default: ./artifacts).",
     ),
+    store: SnapshotStore = typer.Option(SnapshotStore.file, "--store", help=_STORE_HELP),
+    compact_paths: bool = typer.Option(False, "--compact-paths", help=_COMPACT_PATHS_HELP),
 ) -> None:
     """
     Produce a machine-readable snapshot for the current evaluation context.
     Snapshot does not imply admission; it is evidence.
     """
+    from adl.engine.evaluator import evaluate_admissibility
+
     paths = _resolve_paths(repo_root, artifacts_dir)
     contract_path = contract.resolve()
     contract_obj = _load_contract(contract_path)
@@ -154,11 +744,169 @@ def snapshot(
         strict=False,
     )
 
-    ensure_dir(paths.artifacts_dir / "snapshots")
-    ts = now_utc_iso()
-    out_path = paths.artifacts_dir / "snapshots" / f"{result.decision_id}.snapshot.json"
-    write_snapshot(out_path=out_path, result=result, timestamp=ts)
-    typer.echo(str(out_path))
+    out = _store_snapshot(paths, result, now_utc_iso(), store, compact_paths=compact_paths)
+    typer.echo(str(out))
+
+
+@app.command("history")
+def history(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    decision_id: str | None = typer.Option(None, "--decision-id", "-d", help="Only this decision."),
+    since: str | None = typer.Option(None, "--since", help="ISO timestamp lower bound."),
+    until: str | None = typer.Option(None, "--until", help="ISO timestamp upper bound."),
+) -> None:
+    """
+    Print stored snapshots (oldest first) as JSON lines.
+    Only snapshots written with --store ledger/ledger-gz or cas/cas-gz/cas-xz are included.
+    """
+    import heapq
+
+    from adl.artifacts.cas import CasStore
+    from adl.artifacts.ledger import Ledger
+    from adl.artifacts.snapshot import expand_snapshot
+
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    ledger = Ledger.for_artifacts(paths.artifacts_dir)
+    cas = CasStore.for_artifacts(paths.artifacts_dir)
+    records = heapq.merge(
+        ledger.history(decision_id, since=since, until=until),
+        cas.history(decision_id, since=since, until=until),
+        key=lambda r: str(r["timestamp"]),
+    )
+    for rec in records:
+        sys.stdout.write(json.dumps(expand_snapshot(rec), sort_keys=True) + "\n")
+    sys.stdout.flush()
+
+
+query_app = typer.Typer(
+    help="Query stored snapshots through the SQLite index in <artifacts>/.adl-index/."
+)
+app.add_typer(query_app, name="query")
+
+
+class RunStatus(StrEnum):
+    admitted = "admitted"
+    rejected = "rejected"
+
+
+def _open_history_index(repo_root: Path, artifacts_dir: Path | None) -> HistoryIndex:
+    from adl.artifacts.history_index import HistoryIndex
+
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    index = HistoryIndex.for_artifacts(paths.artifacts_dir)
+    # Catch up on snapshots stored by anything that did not index them.
+    index.sync(paths.artifacts_dir)
+    return index
+
+
+def _echo_lines(rows: Iterable[dict[str, Any]]) -> None:
+    for row in rows:
+        sys.stdout.write(json.dumps(row, sort_keys=True) + "\n")
+    sys.stdout.flush()
+
+
+@query_app.command("runs")
+def query_runs(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    decision_id: str | None = typer.Option(None, "--decision-id", "-d", help="Only this decision."),
+    status: RunStatus | None = typer.Option(None, "--status", help="admitted or rejected."),
+    since: str | None = typer.Option(None, "--since", help="ISO timestamp lower bound."),
+    until: str | None = typer.Option(None, "--until", help="ISO timestamp upper bound."),
+    path_prefix: str | None = typer.Option(
+        None,
+        "--path-prefix",
+        help="Only runs that changed a path starting with this (e.g. trading/).",
+    ),
+    limit: int | None = typer.Option(None, "--limit", min=1, help="At most N runs."),
+) -> None:
+    """Print matching runs (oldest first) as JSON lines, with their failures."""
+    with _open_history_index(repo_root, artifacts_dir) as index:
+        _echo_lines(
+            index.runs(
+                decision_id=decision_id,
+                status=status.value if status else None,
+                since=since,
+                until=until,
+                path_prefix=path_prefix,
+                limit=limit,
+            )
+        )
+
+
+@query_app.command("flips")
+def query_flips(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    decision_id: str | None = typer.Option(None, "--decision-id", "-d", help="Only this decision."),
+    to: RunStatus | None = typer.Option(None, "--to", help="Only flips to this status."),
+    since: str | None = typer.Option(None, "--since", help="ISO timestamp lower bound."),
+    until: str | None = typer.Option(None, "--until", help="ISO timestamp upper bound."),
+) -> None:
+    """Print runs whose verdict differs from the decision's previous run, as JSON lines."""
+    with _open_history_index(repo_root, artifacts_dir) as index:
+        _echo_lines(
+            index.flips(
+                to_status=to.value if to else None,
+                since=since,
+                until=until,
+                decision_id=decision_id,
+            )
+        )
+
+
+@query_app.command("checks")
+def query_checks(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    decision_id: str | None = typer.Option(None, "--decision-id", "-d", help="Only this decision."),
+    status: str | None = typer.Option(None, "--status", help="Only this check status (e.g. FAIL)."),
+    since: str | None = typer.Option(None, "--since", help="ISO timestamp lower bound."),
+    until: str | None = typer.Option(None, "--until", help="ISO timestamp upper bound."),
+) -> None:
+    """Print run counts per check name and status as JSON lines, most frequent first."""
+    with _open_history_index(repo_root, artifacts_dir) as index:
+        _echo_lines(
+            index.check_counts(status=status, since=since, until=until, decision_id=decision_id)
+        )
+
+
+@query_app.command("reindex")
+def query_reindex(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+) -> None:
+    """
+    Rebuild the index from the ledger, CAS and snapshot files.
+    Earlier versions of overwritten snapshot files are not recoverable.
+    """
+    from adl.artifacts.history_index import HistoryIndex
+
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    with HistoryIndex.for_artifacts(paths.artifacts_dir) as index:
+        runs = index.reindex(paths.artifacts_dir)
+        _echo_json({"index": str(index.db_path), "runs": runs})
 
 
 @app.command("debt")
@@ -170,12 +918,52 @@ def debt(
         help="Artifacts dir (default: ./artifacts).",
     ),
     out_json: bool = typer.Option(True, "--json/--no-json", help="Emit JSON to stdout."),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from .adl-cache/ (keyed by content hash).",
+    ),
+    cache_stats: bool = typer.Option(
+        False,
+        "--cache-stats",
+        help="Print contract parse-cache hit/miss stats to stderr.",
+    ),
+    use_index: bool = typer.Option(
+        True,
+        "--index/--no-index",
+        help="Re-score only changed contracts using .adl-cache/debt_index.json.",
+    ),
+    base: str | None = typer.Option(
+        None, "--base", help="Compute contract drift from this git revision to --head."
+    ),
+    head: str = typer.Option("HEAD", "--head", help="Head revision for drift (default: HEAD)."),
 ) -> None:
     """
     Compute decision debt/drift metrics as derived report (not contractual).
     """
+    from adl.engine.debt import compute_debt_report
+    from adl.engine.debt_index import DebtIndex
+    from adl.engine.drift import GitError
+
     paths = _resolve_paths(repo_root, artifacts_dir)
-    report = compute_debt_report(repo_root=paths.repo_root, artifacts_dir=paths.artifacts_dir)
+    contract_cache = _contract_cache(paths, cache)
+    mark = _cache_stats_mark(contract_cache)
+    index = DebtIndex.for_repo(paths.repo_root) if use_index else None
+    try:
+        report = compute_debt_report(
+            repo_root=paths.repo_root,
+            artifacts_dir=paths.artifacts_dir,
+            cache=contract_cache,
+            index=index,
+            base=base,
+            head=head,
+        )
+    except GitError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=2) from e
+    _echo_cache_stats(contract_cache, mark, cache_stats)
+    if cache_stats and index is not None:
+        typer.echo(json.dumps({"debt_index": index.stats.to_dict()}), err=True)
 
     if out_json:
         typer.echo(json.dumps(report, indent=2, sort_keys=True))
@@ -184,6 +972,311 @@ def debt(
         raise typer.Exit(code=2)
 
 
+class PortfolioFormat(StrEnum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
+@app.command("portfolio")
+def portfolio(
+    repos: list[Path] | None = typer.Argument(None, help="Repo roots to scan."),
+    repos_file: Path | None = typer.Option(
+        None,
+        "--repos-file",
+        help="File with one repo root per line ('-' for stdin).",
+    ),
+    fmt: PortfolioFormat = typer.Option(PortfolioFormat.ndjson, "--format", help="Row format."),
+    out_dir: Path | None = typer.Option(
+        None,
+        "--out-dir",
+        help="Write contracts/repos/reasons.<format> here (default: NDJSON on stdout).",
+    ),
+    report_dir: Path | None = typer.Option(
+        None,
+        "--report-dir",
+        help="Also write each repo's `adl debt` JSON report here.",
+    ),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes (default: CPU count).",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from each repo's .adl-cache/ (keyed by content hash).",
+    ),
+    use_index: bool = typer.Option(
+        True,
+        "--index/--no-index",
+        help="Re-score only changed contracts using each repo's .adl-cache/debt_index.json.",
+    ),
+) -> None:
+    """
+    Score decision debt across many repos, streaming per-contract rows plus
+    per-repo and per-reason rollups. Exit code 1 if any repo could not be scored.
+    """
+    import hashlib
+
+    from adl.engine.portfolio import (
+        CONTRACT_COLUMNS,
+        REASON_COLUMNS,
+        REPO_COLUMNS,
+        CsvWriter,
+        NdjsonWriter,
+        RepoScan,
+        RowWriter,
+        read_repo_list,
+        scan_portfolio,
+    )
+    from adl.utils.io import atomic_write_bytes
+
+    if fmt is PortfolioFormat.csv and out_dir is None:
+        typer.echo("--format csv needs --out-dir (one file per table).", err=True)
+        raise typer.Exit(code=2)
+
+    def repo_list() -> Iterator[str]:
+        yield from (str(r) for r in repos or [])
+        if repos_file is None:
+            return
+        if str(repos_file) == "-":
+            yield from read_repo_list(sys.stdin)
+            return
+        with repos_file.open(encoding="utf-8") as f:
+            yield from read_repo_list(f)
+
+    def keep_report(scan: RepoScan) -> None:
+        assert report_dir is not None and scan.report is not None
+        root = Path(scan.repo).resolve()
+        tag = hashlib.sha256(os.fsencode(root)).hexdigest()[:8]
+        body = json.dumps(scan.report, indent=2, sort_keys=True) + "\n"
+        atomic_write_bytes(report_dir / f"{root.name}-{tag}.debt.json", body.encode("utf-8"))
+
+    with contextlib.ExitStack() as stack:
+        outputs: dict[str, str] = {}
+        writers: list[RowWriter] = []
+        for table, columns in (
+            ("contracts", CONTRACT_COLUMNS),
+            ("repos", REPO_COLUMNS),
+            ("reasons", REASON_COLUMNS),
+        ):
+            if out_dir is None:
+                writers.append(NdjsonWriter(sys.stdout, kind=table[:-1]))
+                continue
+            ensure_dir(out_dir)
+            path = out_dir / f"{table}.{fmt.value}"
+            stream = stack.enter_context(path.open("w", encoding="utf-8", newline=""))
+            writers.append(
+                CsvWriter(stream, columns) if fmt is PortfolioFormat.csv else NdjsonWriter(stream)
+            )
+            outputs[table] = str(path)
+
+        summary = scan_portfolio(
+            repo_list(),
+            contracts=writers[0],
+            repo_rows=writers[1],
+            reasons=writers[2],
+            workers=workers,
+            use_index=use_index,
+            use_cache=cache,
+            on_report=keep_report if report_dir is not None else None,
+        )
+
+    result = dict(summary.to_dict(), outputs=outputs)
+    if out_dir is None:
+        sys.stdout.flush()
+        typer.echo(json.dumps(result, sort_keys=True), err=True)
+    else:
+        _echo_json(result)
+    if summary.failed:
+        raise typer.Exit(code=1)
+
+
+@app.command("drift")
+def drift(
+    base: str = typer.Option(..., "--base", help="Base git revision (e.g. origin/main)."),
+    head: str = typer.Option("HEAD", "--head", help="Head git revision (default: HEAD)."),
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    write_report: bool = typer.Option(
+        True,
+        "--write/--no-write",
+        help="Write steward/contract_drift_report.json under the artifacts dir.",
+    ),
+    cache: bool = typer.Option(
+        True,
+        "--cache/--no-cache",
+        help="Reuse parsed contracts from .adl-cache/ (keyed by content hash).",
+    ),
+) -> None:
+    """
+    Compare sensitive fields of every contract changed between --base and --head.
+    Derived report; never blocks.
+    """
+    from adl.engine.drift import GitError, compute_drift_report
+
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    try:
+        report = compute_drift_report(
+            repo_root=paths.repo_root,
+            base=base,
+            head=head,
+            generated_at=now_utc_iso(),
+            cache=_contract_cache(paths, cache),
+        )
+    except GitError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(code=2) from e
+
+    if write_report:
+        ensure_dir(paths.artifacts_dir / "steward")
+        out_path = paths.artifacts_dir / "steward" / "contract_drift_report.json"
+        with out_path.open("w", encoding="utf-8") as f:
+            write_json(report, f)
+    _echo_json(report)
+
+
+@app.command("pressure")
+def pressure(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    artifacts_dir: Path | None = typer.Option(
+        None,
+        "--artifacts-dir",
+        help="Artifacts dir (default: ./artifacts).",
+    ),
+    top_k: int = typer.Option(50, "--top-k", min=1, help="Paths kept per frequency table."),
+    workers: int | None = typer.Option(
+        None,
+        "--workers",
+        "-j",
+        min=1,
+        help="Worker processes (default: CPU count).",
+    ),
+) -> None:
+    """
+    Aggregate boundary pressure over snapshots, ledger records and CAS refs.
+    Writes reports/boundary_pressure.{json,md} under the artifacts dir.
+    """
+    from adl.artifacts.boundary_pressure import write_pressure_report
+    from adl.engine.pressure import compute_pressure_report
+
+    paths = _resolve_paths(repo_root, artifacts_dir)
+    report = compute_pressure_report(
+        repo_root=paths.repo_root,
+        artifacts_dir=paths.artifacts_dir,
+        top_k=top_k,
+        workers=workers,
+        generated_at=now_utc_iso(),
+    )
+    json_path, md_path = write_pressure_report(paths.artifacts_dir / "reports", report)
+    typer.echo(str(json_path))
+    typer.echo(str(md_path))
+
+
+@app.command("serve")
+def serve(
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    socket_path: Path | None = typer.Option(
+        None,
+        "--socket",
+        help="Unix socket path (default: $ADL_SOCKET or <repo>/.adl-cache/adl.sock).",
+    ),
+    idle_timeout: float | None = typer.Option(
+        1800.0,
+        "--idle-timeout",
+        help="Exit after this many idle seconds (0 = never).",
+    ),
+) -> None:
+    """
+    Run a warm local evaluator for pre-commit hooks.
+    Use `adl-client <command> ...` to talk to it; it falls back to in-process runs.
+    """
+    from adl.client import default_socket_path
+    from adl.server import AdlServer
+
+    path = socket_path or Path(default_socket_path(str(repo_root)))
+    server = AdlServer(path.resolve(), idle_timeout=idle_timeout or None)
+    typer.echo(str(server.socket_path))
+    with contextlib.suppress(KeyboardInterrupt):
+        server.serve_until_idle()
+
+
+@app.command("watch")
+def watch(
+    contract: Path = typer.Option(..., "--contract", "-c", help="Path to Decision Contract YAML."),
+    repo_root: Path = typer.Option(Path("."), "--repo-root", help="Repo root (default: .)."),
+    strict: bool = typer.Option(
+        True,
+        "--strict/--non-strict",
+        help="Strict blocks on warnings.",
+    ),
+    poll: bool = typer.Option(False, "--poll", help="Poll instead of using inotify."),
+    interval: float = typer.Option(
+        0.5,
+        "--interval",
+        min=0.01,
+        help="Polling interval in seconds (with --poll or when inotify is unavailable).",
+    ),
+    max_updates: int | None = typer.Option(
+        None,
+        "--max-updates",
+        min=1,
+        help="Exit after printing N updates.",
+    ),
+) -> None:
+    """
+    Re-evaluate a contract whenever the git index or working tree changes.
+    Prints one JSON line per change; only paths new to the diff are re-matched.
+    A contract that fails to load prints an `error` line; the last good one stays in use.
+    """
+    import subprocess
+
+    from adl.engine.incremental import IncrementalEvaluator
+    from adl.utils.fswatch import InotifyWatcher, open_watcher
+
+    root = repo_root.resolve()
+    contract_path = contract.resolve()
+    git = subprocess.run(
+        ["git", "rev-parse", "--absolute-git-dir"],
+        cwd=root,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    git_dir = Path(git.stdout.strip()) if git.returncode == 0 else root / ".git"
+
+    evaluator = IncrementalEvaluator(root, contract_path, strict)
+    watcher = open_watcher(root, git_dir, (contract_path,), interval, poll)
+    if isinstance(watcher, InotifyWatcher):
+        typer.echo(f"watching {root} (inotify, {watcher.watch_count} directories)", err=True)
+    else:
+        typer.echo(f"watching {root} (polling every {interval}s)", err=True)
+
+    printed = 0
+    force = True
+    with contextlib.suppress(KeyboardInterrupt):
+        try:
+            while True:
+                update = evaluator.refresh(force=force)
+                force = False
+                if update is not None:
+                    typer.echo(json.dumps(update.to_dict(), sort_keys=True))
+                    sys.stdout.flush()
+                    printed += 1
+                    if printed == max_updates:
+                        break
+                while not watcher.wait():
+                    pass
+        finally:
+            watcher.close()
+
+
 def main() -> None:
     try:
         app()
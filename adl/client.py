@@ -0,0 +1,97 @@
+"""
+Thin client for `adl serve`.
+
+Imports only the standard library, sends the command line to a warm server over
+a Unix domain socket and replays its stdout/stderr/exit code. When no server is
+reachable (or it declines the request) the command runs in-process via adl.cli,
+so output is the same either way.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+from adl import __version__
+
+SERVED_COMMANDS = frozenset({"check", "record", "check-all", "debt"})
+# Environment that changes what git, the CI diff strategy and adl's own settings
+# (result cache dir, profile hook, route) see; the socket path stays the server's.
+FORWARDED_ENV_PREFIXES = ("GIT_", "GITHUB_", "ADL_")
+SOCKET_ENV = "ADL_SOCKET"
+MAX_RESPONSE_BYTES = 256 * 1024 * 1024
+
+
+def default_socket_path(repo_root: str = ".") -> str:
+    return os.environ.get(SOCKET_ENV) or os.path.join(
+        os.path.abspath(repo_root), ".adl-cache", "adl.sock"
+    )
+
+
+def is_forwarded(name: str) -> bool:
+    return name.startswith(FORWARDED_ENV_PREFIXES) and name != SOCKET_ENV
+
+
+def forwarded_env() -> dict[str, str]:
+    return {k: v for k, v in os.environ.items() if is_forwarded(k)}
+
+
+def request(argv: list[str], socket_path: str, timeout: float = 120.0) -> dict[str, Any] | None:
+    """Send one request; None means "no usable server" and the caller should run in-process."""
+    if not hasattr(socket, "AF_UNIX") or not os.path.exists(socket_path):
+        return None
+
+    payload = {
+        "version": __version__,
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": forwarded_env(),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(timeout)
+            s.connect(socket_path)
+            s.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            s.shutdown(socket.SHUT_WR)
+            chunks: list[bytes] = []
+            size = 0
+            while chunk := s.recv(65536):
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > MAX_RESPONSE_BYTES:
+                    return None
+    except OSError:
+        return None
+
+    try:
+        response: Any = json.loads(b"".join(chunks))
+    except ValueError:
+        return None
+    if not isinstance(response, dict) or response.get("status") != "ok":
+        return None
+    return response
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = sys.argv[1:] if argv is None else argv
+
+    if args and args[0] in SERVED_COMMANDS:
+        response = request(args, default_socket_path())
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stdout.flush()
+            sys.stderr.write(response["stderr"])
+            sys.stderr.flush()
+            sys.exit(int(response["exit_code"]))
+
+    from adl.cli import main as cli_main
+
+    sys.argv = ["adl", *args]
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import fnmatch
+import re
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any
+
+IMPLICIT_ALLOW: tuple[str, ...] = ("decisions/contracts/", "artifacts/", "docs/")
+
+_FORBID = 1
+_ALLOW = 2
+_BOTH = _FORBID | _ALLOW
+
+# `[...]` is only a character class next to `*`/`?`; on its own it stays literal,
+# so existing rules such as `app/[id]/` keep their plain prefix meaning.
+_GLOB_CHARS = frozenset("*?")
+# Memoized transitions per DFA state; beyond this, transitions are computed on the fly
+# so a diff with millions of distinct file names cannot grow the matcher unboundedly.
+_MAX_TRANSITIONS = 4096
+_COMPILE_CACHE_SIZE = 128
+
+
+class _Globstar:
+    __slots__ = ()
+
+
+_GLOBSTAR = _Globstar()
+
+# A rule component: literal text, a single-component glob, or `**`.
+_Part = str | Callable[[str], Any] | _Globstar
+
+
+def _components(prefix: Any) -> list[str]:
+    # Same normalization as the legacy prefix check: "a/b/" and "a/b" both cover
+    # "a/b" itself and everything below it.
+    return str(prefix).replace("\\", "/").rstrip("/").split("/")
+
+
+def _compile_part(part: str) -> _Part:
+    if part == "**":
+        return _GLOBSTAR
+    if _GLOB_CHARS.isdisjoint(part):
+        return part
+    return re.compile(fnmatch.translate(part)).match
+
+
+class _State:
+    """
+    A set of (rule, position) NFA states plus the flags of rules completed on entry.
+
+    States without glob or `**` rules are `closed`: their (literal) transitions are
+    all built eagerly, so a component missing from `next` is a dead end.
+    """
+
+    __slots__ = ("flags", "closed", "literal", "globs", "globstars", "next")
+
+    def __init__(self, flags: int) -> None:
+        self.flags = flags
+        self.closed = False
+        self.literal: dict[str, list[tuple[int, int]]] = {}
+        self.globs: list[tuple[Callable[[str], Any], tuple[int, int]]] = []
+        self.globstars: list[tuple[int, int]] = []
+        self.next: dict[str, _State | None] = {}
+
+
+class AuthorityMatcher:
+    """
+    Component-level DFA over `can_write_paths` / `cannot_touch` rules, compiled once
+    per contract.
+
+    Rules are prefixes of path components; each component may be literal text,
+    a glob (`*`, `?`, plus `[...]` within such a component, not crossing "/")
+    or `**` (zero or more components). A rule covers every path whose leading components it matches,
+    so literal rules keep the plain prefix semantics.
+
+    DFA states are built lazily from the rule NFA and transitions are memoized
+    per (state, component), so classification is one dict lookup per path
+    component however many rules the contract has. Every state on the walk that
+    completes a `cannot_touch` rule marks the path forbidden, every state that
+    completes a `can_write_paths` (or implicit allow) rule marks it allowed.
+    """
+
+    __slots__ = ("_rules", "_states", "_root")
+
+    def __init__(self, can_write: Iterable[Any], cannot_touch: Iterable[Any]) -> None:
+        self._rules: list[tuple[int, tuple[_Part, ...]]] = []
+        for p in cannot_touch:
+            self._rules.append((_FORBID, tuple(_compile_part(c) for c in _components(p))))
+        for p in can_write:
+            self._rules.append((_ALLOW, tuple(_compile_part(c) for c in _components(p))))
+        self._states: dict[tuple[frozenset[tuple[int, int]], int], _State] = {}
+        root = self._state({(i, 0) for i in range(len(self._rules))})
+        assert root is not None
+        self._root = root
+
+    def _state(self, nfa: set[tuple[int, int]]) -> _State | None:
+        # Epsilon closure: `**` may match zero components.
+        stack = list(nfa)
+        while stack:
+            i, pos = stack.pop()
+            parts = self._rules[i][1]
+            if pos < len(parts) and parts[pos] is _GLOBSTAR and (i, pos + 1) not in nfa:
+                nfa.add((i, pos + 1))
+                stack.append((i, pos + 1))
+
+        flags = 0
+        live: set[tuple[int, int]] = set()
+        for i, pos in nfa:
+            flag, parts = self._rules[i]
+            if pos == len(parts):
+                flags |= flag  # rule complete; it covers everything below, so drop it
+            else:
+                live.add((i, pos))
+        if not live and not flags:
+            return None
+
+        key = (frozenset(live), flags)
+        state = self._states.get(key)
+        if state is not None:
+            return state
+        state = self._states[key] = _State(flags)
+        for i, pos in sorted(live):
+            part = self._rules[i][1][pos]
+            if isinstance(part, str):
+                state.literal.setdefault(part, []).append((i, pos + 1))
+            elif isinstance(part, _Globstar):
+                state.globstars.append((i, pos))
+            else:
+                state.globs.append((part, (i, pos + 1)))
+        if not state.globs and not state.globstars:
+            for part, targets in state.literal.items():
+                state.next[part] = self._state(set(targets))
+            state.closed = True
+        return state
+
+    def _step(self, state: _State, part: str) -> _State | None:
+        nfa = set(state.literal.get(part, ()))
+        nfa.update(state.globstars)
+        for match, target in state.globs:
+            if match(part):
+                nfa.add(target)
+        return self._state(nfa) if nfa else None
+
+    def classify(self, path: str) -> tuple[bool, bool]:
+        """Return (forbidden, allowed) for a changed path."""
+        state = self._root
+        flags = state.flags
+        for part in path.replace("\\", "/").split("/"):
+            nxt = state.next.get(part)
+            if nxt is None:
+                if state.closed or part in state.next:
+                    break
+                nxt = self._step(state, part)
+                if len(state.next) < _MAX_TRANSITIONS:
+                    state.next[part] = nxt
+                if nxt is None:
+                    break
+            state = nxt
+            flags |= state.flags
+            if flags == _BOTH:
+                break
+        return bool(flags & _FORBID), bool(flags & _ALLOW)
+
+
+@lru_cache(maxsize=_COMPILE_CACHE_SIZE)
+def _compile(can_write: tuple[str, ...], cannot_touch: tuple[str, ...]) -> AuthorityMatcher:
+    return AuthorityMatcher(can_write=can_write, cannot_touch=cannot_touch)
+
+
+def compile_authority(
+    can_write: Iterable[Any],
+    cannot_touch: Iterable[Any],
+    implicit_allow: Iterable[str] = IMPLICIT_ALLOW,
+) -> AuthorityMatcher:
+    """
+    Matchers are cached on the rule lists, so every evaluation of the same
+    contract content (check-all, `adl serve`, debt scans) shares one warm DFA.
+    """
+    return _compile(
+        tuple(str(p) for p in [*can_write, *implicit_allow]),
+        tuple(str(p) for p in cannot_touch),
+    )
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
+
+from adl.engine.contracts import CacheStats, ContractCache, load_contract
+from adl.engine.diff_inspector import collect_changed_paths
+from adl.engine.evaluator import evaluate_admissibility
+from adl.engine.pathtable import as_list
+from adl.engine.types import AdmissibilityResult
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    repo_root: Path
+    changed_paths: Sequence[str]
+    results: list[tuple[Path, AdmissibilityResult]]
+    schema_version: str = "v0.1"
+
+    @property
+    def admitted(self) -> bool:
+        return all(r.admitted for _, r in self.results)
+
+    def to_dict(self) -> dict[str, Any]:
+        items: list[dict[str, Any]] = []
+        for contract_path, r in self.results:
+            # The diff is shared; don't materialize it once per contract.
+            d = replace(r, changed_paths=[]).to_dict()
+            d.pop("changed_paths")
+            try:
+                d["contract_path"] = contract_path.relative_to(self.repo_root).as_posix()
+            except ValueError:
+                d["contract_path"] = contract_path.as_posix()
+            items.append(d)
+        return {
+            "schema_version": self.schema_version,
+            "admitted": self.admitted,
+            "contract_count": len(self.results),
+            "changed_paths": as_list(self.changed_paths),
+            "results": items,
+        }
+
+
+def _evaluate_one(
+    repo_root: Path,
+    contract_path: Path,
+    changed_paths: Sequence[str],
+    strict: bool,
+    cache: ContractCache | None,
+) -> AdmissibilityResult:
+    return evaluate_admissibility(
+        repo_root=repo_root,
+        contract_path=contract_path,
+        contract=load_contract(contract_path, cache),
+        strict=strict,
+        changed_paths=changed_paths,
+    )
+
+
+# Shared per-worker state: the changed-path set is shipped once per process
+# (pool initializer) instead of being pickled with every task.
+_worker_state: dict[str, Any] = {}
+
+
+def _init_worker(
+    repo_root: Path,
+    changed_paths: Sequence[str],
+    strict: bool,
+    cache_dir: Path | None,
+    use_cache: bool,
+) -> None:
+    _worker_state.update(
+        repo_root=repo_root,
+        changed_paths=changed_paths,
+        strict=strict,
+        cache=ContractCache(cache_dir) if use_cache else None,
+    )
+
+
+def _evaluate_in_worker(contract_path: Path) -> tuple[AdmissibilityResult, CacheStats]:
+    cache: ContractCache | None = _worker_state["cache"]
+    before = CacheStats(**cache.stats.to_dict()) if cache is not None else CacheStats()
+    result = _evaluate_one(
+        _worker_state["repo_root"],
+        contract_path,
+        _worker_state["changed_paths"],
+        _worker_state["strict"],
+        cache,
+    )
+    # The parent already holds the diff; re-attached there instead of pickled back.
+    result = replace(result, changed_paths=())
+    return result, cache.stats.since(before) if cache is not None else CacheStats()
+
+
+def evaluate_all(
+    repo_root: Path,
+    contract_paths: list[Path],
+    strict: bool,
+    workers: int | None = None,
+    changed_paths: Sequence[str] | None = None,
+    cache: ContractCache | None = None,
+) -> BatchResult:
+    """
+    Evaluate many contracts against one changed-path set.
+    The diff is collected once; contracts are parsed and evaluated in a process pool.
+    Results keep the order of `contract_paths`.
+    """
+    changed = collect_changed_paths(repo_root) if changed_paths is None else changed_paths
+    n_workers = workers if workers is not None else (os.cpu_count() or 1)
+    n_workers = max(1, min(n_workers, len(contract_paths)))
+
+    if n_workers == 1:
+        results = [_evaluate_one(repo_root, p, changed, strict, cache) for p in contract_paths]
+    else:
+        chunksize = max(1, len(contract_paths) // (n_workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(
+                repo_root,
+                changed,
+                strict,
+                cache.cache_dir if cache is not None else None,
+                cache is not None,
+            ),
+        ) as pool:
+            results = []
+            for result, delta in pool.map(_evaluate_in_worker, contract_paths, chunksize=chunksize):
+                results.append(replace(result, changed_paths=changed))
+                if cache is not None:
+                    cache.stats.add(delta)
+
+    return BatchResult(
+        repo_root=repo_root,
+        changed_paths=changed,
+        results=list(zip(contract_paths, results, strict=True)),
+    )
@@ -0,0 +1,392 @@
+"""
+Contract check registry.
+
+Each check declares the inputs it needs ("contract", "changed_paths") and returns a
+`CheckOutcome`. `evaluate_admissibility` runs the contract checks first and the
+changed-path checks after the boundary checks; within a phase, results always
+come back in registration order, even when checks run concurrently.
+
+Extra checks come from `decisions/checks.yaml`:
+
+    concurrency: 4                  # optional; thread pool size per phase
+    checks:
+      - name: rollback_plan_present
+        field: intent.goal          # dotted path; a string or list of strings
+        keywords: [rollback, revert]
+        severity: strict            # fail | warn | strict (FAIL when strict, else WARN)
+        pass: Rollback plan is stated.
+        fail: Describe how the change is rolled back.
+      - name: owners_file_untouched
+        callable: my_pkg.checks:owners_untouched   # (CheckContext) -> CheckOutcome
+        inputs: [changed_paths]
+
+Keyword rules are compiled once into a single word-boundary-aware regex.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import marshal
+import re
+import sys
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from adl.engine.types import CheckResult, CheckStatus
+from adl.engine.validation import DEFAULT_SCHEMA_PATH, get_compiled_schema
+from adl.utils.profiling import NULL_PROFILER, Profiler
+
+CHECKS_FILENAME = "checks.yaml"
+INPUTS = frozenset({"contract", "changed_paths"})
+SEVERITIES = ("fail", "warn", "strict")
+
+FALSIFIABLE_TOKENS: tuple[str, ...] = (
+    "%",
+    "p95",
+    "p99",
+    "latency",
+    "blocks",
+    "ci",
+    "fails",
+    "error",
+    "slo",
+    "ms",
+    "seconds",
+)
+
+
+class KeywordMatcher:
+    """
+    One compiled regex for a keyword set. Alphabetic token edges must sit on a
+    letter boundary (so "ms" matches "200ms" but not "items", and "ci" does not
+    match "decision"); a trailing plural "s" is allowed. Matching is case-insensitive.
+    """
+
+    __slots__ = ("tokens", "_rx")
+
+    def __init__(self, tokens: Iterable[str]) -> None:
+        self.tokens = tuple(sorted({str(t).lower() for t in tokens if str(t)}))
+        alts: list[str] = []
+        for t in sorted(self.tokens, key=len, reverse=True):
+            head = "(?<![a-z])" if t[0].isalpha() else ""
+            tail = "s?(?![a-z])" if t[-1].isalpha() else ""
+            alts.append(f"{head}{re.escape(t)}{tail}")
+        self._rx = re.compile("|".join(alts), re.IGNORECASE) if alts else None
+
+    def search(self, text: str) -> bool:
+        return self._rx is not None and self._rx.search(text) is not None
+
+
+@dataclass(frozen=True)
+class CheckContext:
+    contract: dict[str, Any]
+    strict: bool
+    changed_paths: Sequence[str] | None = None
+    schema_path: Path = DEFAULT_SCHEMA_PATH
+    profiler: Profiler = NULL_PROFILER
+
+
+@dataclass
+class CheckOutcome:
+    checks: list[CheckResult] = field(default_factory=list)
+    warnings: list[str] = field(default_factory=list)
+    failures: list[str] = field(default_factory=list)
+
+
+CheckFn = Callable[[CheckContext], CheckOutcome]
+
+
+@dataclass(frozen=True)
+class Check:
+    name: str
+    run: CheckFn
+    inputs: frozenset[str] = frozenset({"contract"})
+    # Declarative description; feeds CheckRegistry.fingerprint.
+    spec: Mapping[str, Any] = field(default_factory=dict)
+
+
+def verdict(
+    name: str, ok: bool, pass_detail: str, fail_detail: str, severity: str, strict: bool
+) -> CheckOutcome:
+    """PASS, or FAIL/WARN per severity; the fail detail is also the failure/warning text."""
+    if ok:
+        return CheckOutcome(checks=[CheckResult(name, CheckStatus.PASS, pass_detail)])
+    if severity == "fail" or (severity == "strict" and strict):
+        return CheckOutcome(
+            checks=[CheckResult(name, CheckStatus.FAIL, fail_detail)], failures=[fail_detail]
+        )
+    return CheckOutcome(
+        checks=[CheckResult(name, CheckStatus.WARN, fail_detail)], warnings=[fail_detail]
+    )
+
+
+def field_text(contract: dict[str, Any], dotted: str) -> str | None:
+    """Text of a string or list-of-strings field; None when absent or another type."""
+    value: Any = contract
+    for key in dotted.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    if isinstance(value, list):
+        return " ".join(str(x) for x in value)
+    if isinstance(value, str):
+        return value
+    return None
+
+
+# -- built-in checks -------------------------------------------------------------
+
+
+def _schema_check(ctx: CheckContext) -> CheckOutcome:
+    with ctx.profiler.span("schema_validation") as attrs:
+        errors = get_compiled_schema(ctx.schema_path).error_messages(ctx.contract)
+        attrs["error_count"] = len(errors)
+    if errors:
+        return CheckOutcome(
+            checks=[
+                CheckResult(
+                    "contract_schema_valid",
+                    CheckStatus.FAIL,
+                    "Decision contract schema violations.",
+                )
+            ],
+            failures=[f"schema: {m}" for m in errors],
+        )
+    return CheckOutcome(
+        checks=[CheckResult("contract_schema_valid", CheckStatus.PASS, "Contract matches schema.")]
+    )
+
+
+_FALSIFIABLE = KeywordMatcher(FALSIFIABLE_TOKENS)
+
+
+def _falsifiable_check(ctx: CheckContext) -> CheckOutcome:
+    criteria = ctx.contract.get("success_criteria", [])
+    ok = isinstance(criteria, list) and _FALSIFIABLE.search(" ".join(str(x) for x in criteria))
+    return verdict(
+        "success_criteria_falsifiable",
+        bool(ok),
+        "Success criteria appear falsifiable.",
+        "Success criteria look non-falsifiable; "
+        "add measurable thresholds or explicit CI conditions.",
+        "strict",
+        ctx.strict,
+    )
+
+
+def _alternatives_check(ctx: CheckContext) -> CheckOutcome:
+    alts = ctx.contract.get("alternatives_rejected", [])
+    return verdict(
+        "alternatives_provided",
+        isinstance(alts, list) and len(alts) >= 1,
+        "Alternatives are present.",
+        "No alternatives rejected captured. Weak audit posture.",
+        "strict",
+        ctx.strict,
+    )
+
+
+BUILTIN_CHECKS: tuple[Check, ...] = (
+    Check("contract_schema_valid", _schema_check, spec={"builtin": 1}),
+    Check(
+        "success_criteria_falsifiable",
+        _falsifiable_check,
+        spec={"builtin": 1, "keywords": list(_FALSIFIABLE.tokens)},
+    ),
+    Check("alternatives_provided", _alternatives_check, spec={"builtin": 1}),
+)
+
+
+# -- configured checks -----------------------------------------------------------
+
+
+def keyword_check(
+    name: str,
+    field_path: str,
+    keywords: Iterable[str],
+    severity: str = "strict",
+    pass_detail: str | None = None,
+    fail_detail: str | None = None,
+) -> Check:
+    if severity not in SEVERITIES:
+        raise ValueError(f"Check {name!r}: severity must be one of {', '.join(SEVERITIES)}.")
+    matcher = KeywordMatcher(keywords)
+    if not matcher.tokens:
+        raise ValueError(f"Check {name!r}: keywords must not be empty.")
+    ok_msg = pass_detail or f"{field_path} mentions one of: {', '.join(matcher.tokens)}."
+    fail_msg = fail_detail or f"{field_path} mentions none of: {', '.join(matcher.tokens)}."
+
+    def run(ctx: CheckContext) -> CheckOutcome:
+        text = field_text(ctx.contract, field_path)
+        ok = text is not None and matcher.search(text)
+        return verdict(name, bool(ok), ok_msg, fail_msg, severity, ctx.strict)
+
+    spec = {
+        "field": field_path,
+        "keywords": list(matcher.tokens),
+        "severity": severity,
+        "pass": ok_msg,
+        "fail": fail_msg,
+    }
+    return Check(name, run, spec=spec)
+
+
+def _callable_check(name: str, target: str, inputs: Iterable[str]) -> Check:
+    module_name, _, attr = target.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Check {name!r}: expected callable 'module:function', got {target!r}")
+    fn: CheckFn = getattr(importlib.import_module(module_name), attr)
+    wanted = frozenset(inputs)
+    if not wanted <= INPUTS:
+        raise ValueError(f"Check {name!r}: inputs must be within {sorted(INPUTS)}.")
+    spec = {"callable": target, "inputs": sorted(wanted), "source": _source_digest(fn)}
+    return Check(name, fn, inputs=wanted, spec=spec)
+
+
+def _module_file(module_name: str) -> str | None:
+    return getattr(sys.modules.get(module_name), "__file__", None)
+
+
+def _source_digest(fn: Any) -> str:
+    """Hash of the file defining `fn`, else of its bytecode, so editing the check re-keys it."""
+    path = _module_file(getattr(fn, "__module__", ""))
+    if path:
+        try:
+            return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            pass
+    code = getattr(fn, "__code__", None)
+    return hashlib.sha256(marshal.dumps(code)).hexdigest() if code is not None else ""
+
+
+class CheckRegistry:
+    """Ordered checks; names are unique."""
+
+    def __init__(self, checks: Iterable[Check] = BUILTIN_CHECKS, concurrency: int = 1) -> None:
+        self.checks: list[Check] = []
+        self.concurrency = max(1, concurrency)
+        for c in checks:
+            self.register(c)
+
+    def register(self, check: Check) -> None:
+        if not check.inputs <= INPUTS:
+            raise ValueError(f"Check {check.name!r}: inputs must be within {sorted(INPUTS)}.")
+        if any(c.name == check.name for c in self.checks):
+            raise ValueError(f"Duplicate check name: {check.name!r}")
+        self.checks.append(check)
+
+    @classmethod
+    def from_config(cls, config: Any) -> CheckRegistry:
+        if config is None:
+            return cls()
+        if not isinstance(config, Mapping):
+            raise ValueError("Check config must be a mapping with a 'checks' list.")
+        registry = cls(concurrency=int(config.get("concurrency", 1)))
+        for item in config.get("checks") or []:
+            if not isinstance(item, Mapping) or not item.get("name"):
+                raise ValueError("Each check needs a 'name'.")
+            name = str(item["name"])
+            if item.get("callable"):
+                check = _callable_check(
+                    name, str(item["callable"]), item.get("inputs") or ["contract"]
+                )
+            else:
+                check = keyword_check(
+                    name,
+                    str(item.get("field", "success_criteria")),
+                    [str(k) for k in item.get("keywords") or []],
+                    str(item.get("severity", "strict")),
+                    item.get("pass"),
+                    item.get("fail"),
+                )
+            registry.register(check)
+        return registry
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the check set (names, inputs, specs), e.g. for result caches."""
+        payload = [
+            {"name": c.name, "inputs": sorted(c.inputs), "spec": dict(c.spec)} for c in self.checks
+        ]
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def phase(self, needs_paths: bool) -> list[Check]:
+        return [c for c in self.checks if ("changed_paths" in c.inputs) == needs_paths]
+
+    def run(self, ctx: CheckContext, needs_paths: bool = False) -> CheckOutcome:
+        """Run one phase; outcomes are merged in registration order."""
+        selected = self.phase(needs_paths)
+        if self.concurrency > 1 and len(selected) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.concurrency, len(selected))) as pool:
+                outcomes = list(pool.map(lambda c: c.run(ctx), selected))
+        else:
+            outcomes = [c.run(ctx) for c in selected]
+        merged = CheckOutcome()
+        for o in outcomes:
+            merged.checks.extend(o.checks)
+            merged.warnings.extend(o.warnings)
+            merged.failures.extend(o.failures)
+        return merged
+
+
+DEFAULT_REGISTRY = CheckRegistry()
+
+_lock = threading.Lock()
+# checks.yaml path -> (mtime_ns, size, registry, callable module sources)
+_loaded: dict[str, tuple[int, int, CheckRegistry, dict[str, tuple[int, int] | None]]] = {}
+
+
+def _file_stat(path: str | None) -> tuple[int, int] | None:
+    if not path:
+        return None
+    try:
+        st = Path(path).stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _callable_sources(registry: CheckRegistry) -> dict[str, tuple[int, int] | None]:
+    modules = {
+        str(c.spec["callable"]).partition(":")[0] for c in registry.checks if "callable" in c.spec
+    }
+    return {m: _file_stat(_module_file(m)) for m in sorted(modules)}
+
+
+def load_check_registry(repo_root: Path) -> CheckRegistry:
+    """
+    `<repo_root>/decisions/checks.yaml` when present, else the built-in checks.
+    Cached per file and invalidated on mtime/size change of the file or of a
+    module defining a callable check (which is then re-imported).
+    """
+    path = repo_root / "decisions" / CHECKS_FILENAME
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return DEFAULT_REGISTRY
+    key = str(path.resolve())
+    with _lock:
+        hit = _loaded.get(key)
+    stale: list[str] = []
+    if hit is not None and hit[:2] == (st.st_mtime_ns, st.st_size):
+        stale = [m for m, sig in hit[3].items() if _file_stat(_module_file(m)) != sig]
+        if not stale:
+            return hit[2]
+
+    from adl.engine.contracts import load_yaml_file
+
+    for module_name in stale:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            importlib.reload(module)
+    registry = CheckRegistry.from_config(load_yaml_file(path))
+    with _lock:
+        _loaded[key] = (st.st_mtime_ns, st.st_size, registry, _callable_sources(registry))
+    return registry
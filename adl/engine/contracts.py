@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+CACHE_DIRNAME = ".adl-cache"
+
+_MARSHAL_SAFE = (str, int, float, bool, type(None))
+
+
+def list_contracts(contracts_dir: Path) -> list[Path]:
+    if not contracts_dir.exists():
+        return []
+    return sorted([p for p in contracts_dir.glob("*.y*ml") if p.is_file()])
+
+
+def parse_yaml(data: bytes) -> Any:
+    # Imported here so cache hits and indexed debt runs never load PyYAML.
+    import yaml
+
+    # libyaml-backed CSafeLoader when PyYAML was built with it; same results, much faster.
+    loader: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(data, Loader=loader)
+
+
+def _marshal_safe(obj: Any) -> bool:
+    # marshal only round-trips plain data; YAML timestamps/sets/binary are not cached.
+    if isinstance(obj, _MARSHAL_SAFE):
+        return True
+    if isinstance(obj, list):
+        return all(_marshal_safe(x) for x in obj)
+    if isinstance(obj, dict):
+        return all(_marshal_safe(k) and _marshal_safe(v) for k, v in obj.items())
+    return False
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    writes: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "writes": self.writes}
+
+    def add(self, other: CacheStats) -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.writes += other.writes
+
+    def since(self, before: CacheStats) -> CacheStats:
+        return CacheStats(
+            hits=self.hits - before.hits,
+            misses=self.misses - before.misses,
+            writes=self.writes - before.writes,
+        )
+
+
+class ContractCache:
+    """
+    Parsed-contract cache keyed by file content sha256.
+
+    Entries live in memory and, when `cache_dir` is set, as marshal files under
+    `<cache_dir>/<sha[:2]>/<sha>.marshal`. A changed file has a new hash, so
+    stale entries are never served. marshal is used instead of pickle because
+    loading it cannot execute code, even if the cache directory is tampered with.
+    Parsed objects are shared between callers and must be treated as read-only.
+    """
+
+    def __init__(self, cache_dir: Path | None = None) -> None:
+        self.cache_dir = cache_dir
+        self.stats = CacheStats()
+        self._memory: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_repo(cls, repo_root: Path) -> ContractCache:
+        return cls(repo_root / CACHE_DIRNAME / "contracts")
+
+    def _entry_path(self, digest: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / digest[:2] / f"{digest}.marshal"
+
+    def _read_entry(self, digest: str) -> tuple[bool, Any]:
+        entry = self._entry_path(digest)
+        if entry is None:
+            return False, None
+        try:
+            obj = marshal.loads(entry.read_bytes())
+        except (OSError, EOFError, ValueError, TypeError):
+            return False, None
+        return (True, obj) if _marshal_safe(obj) else (False, None)
+
+    def _write_entry(self, digest: str, obj: Any) -> None:
+        entry = self._entry_path(digest)
+        if self.cache_dir is None or entry is None or not _marshal_safe(obj):
+            return
+        try:
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            # Keep the cache root out of `git status` in host repositories.
+            ignore = self.cache_dir.parent / ".gitignore"
+            if not ignore.exists():
+                ignore.write_text("*\n", encoding="utf-8")
+            tmp = entry.with_name(f"{entry.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_bytes(marshal.dumps(obj))
+            os.replace(tmp, entry)
+        except OSError:
+            return
+        with self._lock:
+            self.stats.writes += 1
+
+    def load_bytes(self, data: bytes) -> Any:
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._memory:
+                self.stats.hits += 1
+                return self._memory[digest]
+
+        found, obj = self._read_entry(digest)
+        if found:
+            with self._lock:
+                self.stats.hits += 1
+        else:
+            obj = parse_yaml(data)
+            with self._lock:
+                self.stats.misses += 1
+            self._write_entry(digest, obj)
+
+        with self._lock:
+            self._memory[digest] = obj
+        return obj
+
+    def load(self, path: Path) -> Any:
+        return self.load_bytes(path.read_bytes())
+
+
+def contract_digest(contract: dict[str, Any]) -> str:
+    """sha256 of the parsed contract's canonical JSON; formatting and comments do not count."""
+    raw = json.dumps(contract, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(raw.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def load_yaml_file(path: Path, cache: ContractCache | None = None) -> Any:
+    data = path.read_bytes()
+    return cache.load_bytes(data) if cache is not None else parse_yaml(data)
+
+
+def load_contract(path: Path, cache: ContractCache | None = None) -> dict[str, Any]:
+    if not path.exists():
+        raise FileNotFoundError(f"Contract not found: {path}")
+    data = load_yaml_file(path, cache)
+    if not isinstance(data, dict):
+        raise ValueError("Decision contract must be a YAML mapping/object.")
+    return data
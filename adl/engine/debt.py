@@ -1,20 +1,25 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import yaml
+if TYPE_CHECKING:
+    from adl.engine.contracts import ContractCache
+    from adl.engine.debt_index import DebtIndex
 
 
-def _list_contracts(contracts_dir: Path) -> list[Path]:
-    if not contracts_dir.exists():
-        return []
-    return sorted([p for p in contracts_dir.glob("*.y*ml") if p.is_file()])
+def _load_yaml(p: Path, cache: ContractCache | None = None) -> dict[str, Any]:
+    # Lazy: a warm DebtIndex run never parses YAML.
+    from adl.engine.contracts import load_yaml_file
+
+    obj = load_yaml_file(p, cache)
+    return obj if isinstance(obj, dict) else {}
 
 
-def _load_yaml(p: Path) -> dict[str, Any]:
-    with p.open("r", encoding="utf-8") as f:
-        obj = yaml.safe_load(f)
+def _parse_yaml_bytes(data: bytes, cache: ContractCache | None) -> dict[str, Any]:
+    from adl.engine.contracts import parse_yaml
+
+    obj = cache.load_bytes(data) if cache is not None else parse_yaml(data)
     return obj if isinstance(obj, dict) else {}
 
 
@@ -43,27 +48,76 @@ def _score_contract(contract: dict[str, Any]) -> tuple[float, list[str]]:
     return debt, reasons
 
 
-def compute_debt_report(repo_root: Path, artifacts_dir: Path) -> dict[str, Any]:
+def _drift_block(
+    repo_root: Path, base: str | None, head: str, cache: ContractCache | None
+) -> dict[str, Any]:
+    if base is None:
+        return {
+            "status": "skipped",
+            "note": "Pass a base revision (adl debt --base <rev>) to compare contracts.",
+        }
+    from adl.engine.drift import compute_drift_report, drift_summary
+
+    return drift_summary(compute_drift_report(repo_root, base, head, cache=cache))
+
+
+def compute_debt_report(
+    repo_root: Path,
+    artifacts_dir: Path,
+    cache: ContractCache | None = None,
+    index: DebtIndex | None = None,
+    base: str | None = None,
+    head: str = "HEAD",
+) -> dict[str, Any]:
+    """
+    With `index`, only contracts whose content changed since the last run are
+    parsed and scored, and the snapshot count comes from the snapshot index.
+    With `base`, the drift block summarizes contract drift from base to head.
+    """
     contracts_dir = repo_root / "decisions" / "contracts"
-    contracts = _list_contracts(contracts_dir)
 
     items: list[dict[str, Any]] = []
-    for p in contracts:
-        c = _load_yaml(p)
-        score, reasons = _score_contract(c)
-        items.append(
-            {
-                "decision_id": str(c.get("decision_id", p.stem)),
-                "contract_path": str(p.relative_to(repo_root).as_posix()),
-                "debt_score": round(score, 3),
-                "reasons": reasons,
-            }
-        )
+    if index is None:
+        from adl.engine.contracts import list_contracts
+
+        for p in list_contracts(contracts_dir):
+            c = _load_yaml(p, cache)
+            score, reasons = _score_contract(c)
+            items.append(
+                {
+                    "decision_id": str(c.get("decision_id", p.stem)),
+                    "contract_path": str(p.relative_to(repo_root).as_posix()),
+                    "debt_score": round(score, 3),
+                    "reasons": reasons,
+                }
+            )
+    else:
+
+        def score_file(p: Path, data: bytes) -> tuple[str, float, list[str]]:
+            c = _parse_yaml_bytes(data, cache)
+            score, reasons = _score_contract(c)
+            return str(c.get("decision_id", p.stem)), round(score, 3), reasons
+
+        for e in index.refresh(repo_root, contracts_dir, score_file):
+            items.append(
+                {
+                    "decision_id": e.decision_id,
+                    "contract_path": e.path,
+                    "debt_score": e.score,
+                    "reasons": list(e.reasons),
+                }
+            )
+        index.save()
 
     avg = round(sum(i["debt_score"] for i in items) / len(items), 3) if items else 0.0
 
     snapshots_dir = artifacts_dir / "snapshots"
-    snapshot_count = len(list(snapshots_dir.glob("*.json"))) if snapshots_dir.exists() else 0
+    if index is None:
+        snapshot_count = len(list(snapshots_dir.glob("*.json"))) if snapshots_dir.exists() else 0
+    else:
+        from adl.artifacts.snapshot import snapshot_count as indexed_snapshot_count
+
+        snapshot_count = indexed_snapshot_count(snapshots_dir)
 
     return {
         "schema_version": "v0.1",
@@ -72,9 +126,6 @@ def compute_debt_report(repo_root: Path, artifacts_dir: Path) -> dict[str, Any]:
             "contract_count": len(items),
             "avg_debt_score": avg,
             "snapshot_count": snapshot_count,
-            "drift": {
-                "status": "stub_v0.1",
-                "note": "Drift detection lands in v0.2+ using historical snapshots.",
-            },
+            "drift": _drift_block(repo_root, base, head, cache),
         },
     }
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Any
+
+from adl.utils.io import atomic_write_bytes
+
+# Bump when _score_contract changes so stored scores are recomputed.
+SCORING_VERSION = 1
+INDEX_FILENAME = "debt_index.json"
+
+
+@dataclass
+class IndexedContract:
+    path: str
+    mtime_ns: int
+    size: int
+    sha256: str
+    decision_id: str
+    score: float
+    reasons: list[str]
+
+
+@dataclass
+class IndexStats:
+    reused: int = 0
+    rehashed: int = 0
+    rescored: int = 0
+    removed: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+ScoreFn = Callable[[Path, bytes], tuple[str, float, list[str]]]
+
+
+class DebtIndex:
+    """
+    Persistent per-contract debt scores.
+
+    A contract whose (mtime_ns, size) is unchanged is not read at all; one whose
+    stat changed but content hash did not is re-hashed only. Only contracts with
+    new content are parsed and re-scored. Stored at .adl-cache/debt_index.json.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.stats = IndexStats()
+        self._entries: dict[str, IndexedContract] = {}
+        self._written_ns = 0
+        self._dirty = False
+        self._load()
+
+    @classmethod
+    def for_repo(cls, repo_root: Path) -> DebtIndex:
+        from adl.engine.contracts import CACHE_DIRNAME
+
+        return cls(repo_root / CACHE_DIRNAME / INDEX_FILENAME)
+
+    def _load(self) -> None:
+        try:
+            obj: Any = json.loads(self.path.read_bytes())
+        except (OSError, ValueError):
+            return
+        if not isinstance(obj, dict) or obj.get("scoring_version") != SCORING_VERSION:
+            return
+        written = obj.get("written_ns")
+        self._written_ns = written if isinstance(written, int) else 0
+        try:
+            self._entries = {e["path"]: IndexedContract(**e) for e in obj.get("contracts", [])}
+        except (TypeError, KeyError):
+            self._entries = {}
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        payload = {
+            "scoring_version": SCORING_VERSION,
+            "written_ns": time.time_ns(),
+            "contracts": [asdict(e) for _, e in sorted(self._entries.items())],
+        }
+        try:
+            atomic_write_bytes(self.path, json.dumps(payload).encode("utf-8"))
+        except OSError:
+            return
+        self._dirty = False
+
+    def refresh(
+        self, repo_root: Path, contracts_dir: Path, score: ScoreFn
+    ) -> list[IndexedContract]:
+        """Bring the index up to date with `contracts_dir`; returns entries sorted by path."""
+        if not contracts_dir.exists():
+            found: list[os.DirEntry[str]] = []
+        else:
+            with os.scandir(contracts_dir) as it:
+                found = [e for e in it if fnmatchcase(e.name, "*.y*ml") and e.is_file()]
+        found.sort(key=lambda e: e.name)
+
+        seen: set[str] = set()
+        out: list[IndexedContract] = []
+        for entry in found:
+            p = Path(entry.path)
+            rel = p.relative_to(repo_root).as_posix()
+            seen.add(rel)
+            st = entry.stat()
+            cached = self._entries.get(rel)
+
+            # Like git's racy-clean check: a file touched at or after the index was
+            # written may have changed within one timestamp tick, so verify its hash.
+            if (
+                cached is not None
+                and (cached.mtime_ns, cached.size) == (st.st_mtime_ns, st.st_size)
+                and st.st_mtime_ns < self._written_ns
+            ):
+                self.stats.reused += 1
+                out.append(cached)
+                continue
+
+            data = p.read_bytes()
+            digest = hashlib.sha256(data).hexdigest()
+            if cached is not None and cached.sha256 == digest:
+                self.stats.rehashed += 1
+                cached.mtime_ns, cached.size = st.st_mtime_ns, st.st_size
+            else:
+                self.stats.rescored += 1
+                decision_id, value, reasons = score(p, data)
+                cached = IndexedContract(
+                    path=rel,
+                    mtime_ns=st.st_mtime_ns,
+                    size=st.st_size,
+                    sha256=digest,
+                    decision_id=decision_id,
+                    score=value,
+                    reasons=reasons,
+                )
+            self._entries[rel] = cached
+            self._dirty = True
+            out.append(cached)
+
+        for stale in set(self._entries) - seen:
+            del self._entries[stale]
+            self.stats.removed += 1
+            self._dirty = True
+
+        return out
@@ -3,11 +3,18 @@ from __future__ import annotations
 import json
 import os
 import subprocess
-from dataclasses import dataclass
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from adl.engine.types import CheckResult
+from adl.engine.authority import IMPLICIT_ALLOW, compile_authority
+from adl.engine.pathtable import PathTable
+from adl.engine.types import CheckResult, CheckStatus
+from adl.utils.profiling import NULL_PROFILER, Profiler
+
+_READ_CHUNK = 64 * 1024
 
 
 @dataclass(frozen=True)
@@ -17,18 +24,86 @@ class BoundaryEval:
     failures: list[str]
 
 
-def _run_git(repo_root: Path, args: list[str]) -> tuple[int, str]:
-    p = subprocess.run(
+@dataclass(frozen=True)
+class StrategyTiming:
+    strategy: str
+    seconds: float
+    returncode: int | None
+    path_count: int
+
+
+@dataclass
+class DiffStats:
+    """Filled in while changed paths are streamed; complete once the stream is exhausted."""
+
+    strategy: str | None = None
+    timings: list[StrategyTiming] = field(default_factory=list)
+
+    @property
+    def subprocess_count(self) -> int:
+        return len(self.timings)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "strategy": self.strategy,
+            "subprocess_count": self.subprocess_count,
+            "timings": [t.__dict__ for t in self.timings],
+        }
+
+
+def _iter_git_z(
+    repo_root: Path,
+    args: list[str],
+    strategy: str,
+    stats: DiffStats,
+) -> Iterator[str]:
+    """
+    Run `git <args>` (NUL-delimited output) and yield entries as they arrive.
+    Paths are decoded with os.fsdecode, so newlines and non-UTF-8 bytes survive.
+    """
+    t0 = time.perf_counter()
+    count = 0
+    proc = subprocess.Popen(
         ["git", *args],
         cwd=str(repo_root),
-        check=False,
-        capture_output=True,
-        text=True,
+        bufsize=0,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
     )
-    return p.returncode, p.stdout.strip()
+    assert proc.stdout is not None
+    try:
+        pending = b""
+        while True:
+            # Unbuffered pipe: read() returns whatever is available (one syscall).
+            chunk = proc.stdout.read(_READ_CHUNK)
+            if not chunk:
+                break
+            *entries, pending = (pending + chunk).split(b"\0")
+            for entry in entries:
+                if entry:
+                    count += 1
+                    yield os.fsdecode(entry)
+        if pending:
+            count += 1
+            yield os.fsdecode(pending)
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+        proc.stdout.close()
+        returncode = proc.wait()
+        stats.timings.append(
+            StrategyTiming(
+                strategy=strategy,
+                seconds=round(time.perf_counter() - t0, 6),
+                returncode=returncode,
+                path_count=count,
+            )
+        )
 
 
 def _prefix_match(path: str, prefixes: list[str]) -> bool:
+    # Reference semantics for AuthorityMatcher; kept for regression comparison.
     norm = path.replace("\\", "/")
     for p in prefixes:
         pp = str(p).replace("\\", "/").rstrip("/") + "/"
@@ -37,7 +112,7 @@ def _prefix_match(path: str, prefixes: list[str]) -> bool:
     return False
 
 
-def _paths_from_github_event(repo_root: Path) -> list[str] | None:
+def _github_event_range() -> tuple[str, str] | None:
     """
     Deterministic diff selection in CI:
     - pull_request: base sha -> head sha
@@ -77,47 +152,65 @@ def _paths_from_github_event(repo_root: Path) -> list[str] | None:
 
     if not base_sha or not head_sha:
         return None
+    return base_sha, head_sha
 
-    code, out = _run_git(repo_root, ["diff", "--name-only", f"{base_sha}..{head_sha}"])
-    if code != 0 or not out:
-        return []
-
-    return [line.strip() for line in out.splitlines() if line.strip()]
-
-
-def collect_changed_paths(repo_root: Path) -> list[str]:
-    # 1) CI deterministic path selection (preferred)
-    ci_paths = _paths_from_github_event(repo_root=repo_root)
-    if ci_paths is not None:
-        return ci_paths
 
-    # 2) Local dev: staged first
-    code, staged = _run_git(repo_root, ["diff", "--cached", "--name-only"])
-    if code == 0 and staged:
-        return [line.strip() for line in staged.splitlines() if line.strip()]
+def _diff_strategies() -> list[tuple[str, list[str]]]:
+    # 1) CI deterministic path selection (preferred, authoritative even when empty)
+    ci_range = _github_event_range()
+    if ci_range is not None:
+        base_sha, head_sha = ci_range
+        return [("github_event", ["diff", "--name-only", "-z", f"{base_sha}..{head_sha}"])]
 
-    # 3) Local dev: working tree
-    code, wt = _run_git(repo_root, ["diff", "--name-only"])
-    if code == 0 and wt:
-        return [line.strip() for line in wt.splitlines() if line.strip()]
+    return [
+        # 2) Local dev: staged first
+        ("staged", ["diff", "--cached", "--name-only", "-z"]),
+        # 3) Local dev: working tree
+        ("working_tree", ["diff", "--name-only", "-z"]),
+        # 4) Fallback: last commit diff (fails cleanly when HEAD has no parent)
+        ("last_commit", ["diff", "--name-only", "-z", "HEAD^", "HEAD"]),
+    ]
 
-    # 4) Fallback: last commit diff if available
-    code, base = _run_git(repo_root, ["rev-parse", "--verify", "HEAD^"])
-    if code == 0 and base:
-        code2, head = _run_git(repo_root, ["rev-parse", "HEAD"])
-        if code2 == 0 and head:
-            code3, diff = _run_git(repo_root, ["diff", "--name-only", f"{base}..{head}"])
-            if code3 == 0 and diff:
-                return [line.strip() for line in diff.splitlines() if line.strip()]
-
-    return []
-
-
-def evaluate_boundaries(contract: dict[str, Any], changed_paths: list[str]) -> BoundaryEval:
-    checks: list[CheckResult] = []
-    warnings: list[str] = []
-    failures: list[str] = []
 
+def iter_changed_paths(repo_root: Path, stats: DiffStats | None = None) -> Iterator[str]:
+    """
+    Stream changed paths from the first diff strategy that yields any.
+    Each strategy is a single `git` process; later strategies only run
+    when the earlier ones produced nothing.
+    """
+    stats = stats if stats is not None else DiffStats()
+    strategies = _diff_strategies()
+    for name, args in strategies:
+        if name == "github_event":
+            stats.strategy = name
+        produced = False
+        for path in _iter_git_z(repo_root, args, name, stats):
+            if not produced:
+                stats.strategy = name
+                produced = True
+            yield path
+        if produced or name == "github_event":
+            return
+
+
+def collect_changed_paths_with_stats(repo_root: Path) -> tuple[PathTable, DiffStats]:
+    stats = DiffStats()
+    paths = PathTable(iter_changed_paths(repo_root, stats))
+    return paths, stats
+
+
+def collect_changed_paths(repo_root: Path, profiler: Profiler = NULL_PROFILER) -> PathTable:
+    """The whole diff, in a compact `PathTable` (reads like a list of paths)."""
+    if not profiler.enabled:
+        return PathTable(iter_changed_paths(repo_root))
+    with profiler.span("collect_changed_paths") as attrs:
+        paths, stats = collect_changed_paths_with_stats(repo_root)
+        attrs.update(path_count=len(paths), **stats.to_dict())
+    profiler.count("git_subprocesses", stats.subprocess_count)
+    return paths
+
+
+def _bounded_authority(contract: dict[str, Any]) -> tuple[Any, Any]:
     constraints: dict[str, Any] = {}
     if isinstance(contract.get("constraints"), dict):
         constraints = contract["constraints"]
@@ -126,66 +219,205 @@ def evaluate_boundaries(contract: dict[str, Any], changed_paths: list[str]) -> B
     if isinstance(constraints.get("bounded_authority"), dict):
         ba = constraints["bounded_authority"]
 
-    can_write = ba.get("can_write_paths", [])
-    cannot_touch = ba.get("cannot_touch", [])
+    return ba.get("can_write_paths", []), ba.get("cannot_touch", [])
 
-    if not isinstance(can_write, list) or not isinstance(cannot_touch, list):
-        failures.append(
-            "bounded_authority fields must be lists: can_write_paths and cannot_touch."
-        )
-        checks.append(
-            CheckResult("bounded_authority_shape", "FAIL", "Invalid bounded_authority structure.")
-        )
-        return BoundaryEval(checks=checks, warnings=warnings, failures=failures)
 
-    checks.append(CheckResult("bounded_authority_shape", "PASS", 
-                              "bounded_authority is well-formed."))
+def _shape_failure() -> BoundaryEval:
+    return BoundaryEval(
+        checks=[
+            CheckResult(
+                "bounded_authority_shape", CheckStatus.FAIL, "Invalid bounded_authority structure."
+            )
+        ],
+        warnings=[],
+        failures=["bounded_authority fields must be lists: can_write_paths and cannot_touch."],
+    )
 
-    implicit_allow = ["decisions/contracts/", "artifacts/", "docs/"]
 
-    forbidden_hits: list[str] = []
-    for p in changed_paths:
-        if _prefix_match(p, cannot_touch):
-            forbidden_hits.append(p)
+def _verdicts(forbidden: str | None, out_of_bounds: str | None, total: int) -> BoundaryEval:
+    """Build boundary checks from rendered evidence (None means no hits)."""
+    checks: list[CheckResult] = []
+    warnings: list[str] = []
+    failures: list[str] = []
 
-    if forbidden_hits:
-        failures.append(f"Forbidden paths modified: {forbidden_hits}")
-        checks.append(CheckResult("forbidden_paths_untouched", "FAIL", 
-                                  "Touched forbidden paths."))
-    else:
-        checks.append(CheckResult("forbidden_paths_untouched", "PASS", 
-                                  "No forbidden paths touched."))
+    checks.append(
+        CheckResult(
+            "bounded_authority_shape", CheckStatus.PASS, "bounded_authority is well-formed."
+        )
+    )
 
-    out_of_bounds: list[str] = []
-    allowed_prefixes = [*can_write, *implicit_allow]
-    for p in changed_paths:
-        if not p.strip():
-            continue
-        if not _prefix_match(p, allowed_prefixes):
-            out_of_bounds.append(p)
+    if forbidden is not None:
+        failures.append(f"Forbidden paths modified: {forbidden}")
+        checks.append(
+            CheckResult("forbidden_paths_untouched", CheckStatus.FAIL, "Touched forbidden paths.")
+        )
+    else:
+        checks.append(
+            CheckResult(
+                "forbidden_paths_untouched", CheckStatus.PASS, "No forbidden paths touched."
+            )
+        )
 
-    if out_of_bounds:
+    if out_of_bounds is not None:
         failures.append(f"Out-of-bounds modifications: {out_of_bounds}")
         checks.append(
-            CheckResult("bounded_authority_respected", "FAIL", "Changes exceed bounded authority.")
+            CheckResult(
+                "bounded_authority_respected", CheckStatus.FAIL, "Changes exceed bounded authority."
+            )
         )
     else:
         checks.append(
-            CheckResult("bounded_authority_respected", "PASS", "Changes respect bounded authority.")
+            CheckResult(
+                "bounded_authority_respected",
+                CheckStatus.PASS,
+                "Changes respect bounded authority.",
+            )
         )
 
-    if len(changed_paths) == 0:
+    if total == 0:
         warnings.append(
             "No changed paths detected. Verify CI diff strategy or stage changes locally."
         )
-        checks.append(CheckResult("diff_detected", "WARN", "No diff detected."))
+        checks.append(CheckResult("diff_detected", CheckStatus.WARN, "No diff detected."))
     else:
         checks.append(
             CheckResult(
                 "diff_detected",
-                "PASS",
-                f"{len(changed_paths)} changed paths detected.",
+                CheckStatus.PASS,
+                f"{total} changed paths detected.",
             )
         )
 
     return BoundaryEval(checks=checks, warnings=warnings, failures=failures)
+
+
+def classify_paths(
+    contract: dict[str, Any], changed_paths: Iterable[str]
+) -> list[tuple[bool, bool]] | None:
+    """(forbidden, allowed) per path, or None when bounded_authority is malformed."""
+    can_write, cannot_touch = _bounded_authority(contract)
+    if not isinstance(can_write, list) or not isinstance(cannot_touch, list):
+        return None
+    matcher = compile_authority(can_write, cannot_touch, IMPLICIT_ALLOW)
+    return [matcher.classify(p) for p in changed_paths]
+
+
+def boundary_verdicts(
+    changed_paths: Sequence[str], classified: list[tuple[bool, bool]] | None
+) -> BoundaryEval:
+    """Boundary checks from per-path verdicts (see classify_paths), in diff order."""
+    if classified is None:
+        return _shape_failure()
+
+    forbidden_hits: list[str] = []
+    out_of_bounds: list[str] = []
+    for p, (forbidden, allowed) in zip(changed_paths, classified, strict=True):
+        if forbidden:
+            forbidden_hits.append(p)
+        if not allowed and p.strip():
+            out_of_bounds.append(p)
+
+    return _verdicts(
+        forbidden=str(forbidden_hits) if forbidden_hits else None,
+        out_of_bounds=str(out_of_bounds) if out_of_bounds else None,
+        total=len(changed_paths),
+    )
+
+
+def evaluate_boundaries(contract: dict[str, Any], changed_paths: Sequence[str]) -> BoundaryEval:
+    return boundary_verdicts(changed_paths, classify_paths(contract, changed_paths))
+
+
+def _directory_key(path: str, depth: int) -> str:
+    parts = path.replace("\\", "/").split("/")[:-1]
+    return "/".join(parts[:depth]) + "/" if parts else "./"
+
+
+class BoundaryEvidence:
+    """
+    Bounded evidence for streamed boundary evaluation: exact counts, capped
+    path samples, and per-directory aggregates instead of full path lists.
+    """
+
+    def __init__(self, limit: int, depth: int = 1) -> None:
+        self.limit = limit
+        self.depth = depth
+        self.total = 0
+        self.forbidden_count = 0
+        self.out_of_bounds_count = 0
+        self.changed_sample: list[str] = []
+        self.forbidden_sample: list[str] = []
+        self.out_of_bounds_sample: list[str] = []
+        self.directories: dict[str, list[int]] = {}
+
+    def add(self, path: str, forbidden: bool, out_of_bounds: bool) -> None:
+        self.total += 1
+        if len(self.changed_sample) < self.limit:
+            self.changed_sample.append(path)
+
+        counts = self.directories.get(key := _directory_key(path, self.depth))
+        if counts is None:
+            counts = self.directories[key] = [0, 0, 0]
+        counts[0] += 1
+
+        if forbidden:
+            self.forbidden_count += 1
+            counts[1] += 1
+            if len(self.forbidden_sample) < self.limit:
+                self.forbidden_sample.append(path)
+        if out_of_bounds:
+            self.out_of_bounds_count += 1
+            counts[2] += 1
+            if len(self.out_of_bounds_sample) < self.limit:
+                self.out_of_bounds_sample.append(path)
+
+    @staticmethod
+    def render(sample: list[str], count: int) -> str | None:
+        if count == 0:
+            return None
+        if count == len(sample):
+            return str(sample)
+        return f"{sample} (+{count - len(sample)} more; {count} total)"
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "evidence_limit": self.limit,
+            "changed_path_count": self.total,
+            "forbidden_count": self.forbidden_count,
+            "out_of_bounds_count": self.out_of_bounds_count,
+            "forbidden_sample": self.forbidden_sample,
+            "out_of_bounds_sample": self.out_of_bounds_sample,
+            "directories": {
+                k: {"changed": c[0], "forbidden": c[1], "out_of_bounds": c[2]}
+                for k, c in sorted(self.directories.items())
+            },
+        }
+
+
+def evaluate_boundaries_streaming(
+    contract: dict[str, Any],
+    changed_paths: Iterable[str],
+    evidence_limit: int,
+) -> tuple[BoundaryEval, BoundaryEvidence]:
+    """
+    Single pass over an iterable of paths (e.g. iter_changed_paths) with
+    memory bounded by `evidence_limit` and the number of directories.
+    """
+    evidence = BoundaryEvidence(limit=evidence_limit)
+    can_write, cannot_touch = _bounded_authority(contract)
+    if not isinstance(can_write, list) or not isinstance(cannot_touch, list):
+        for p in changed_paths:
+            evidence.add(p, forbidden=False, out_of_bounds=False)
+        return _shape_failure(), evidence
+
+    matcher = compile_authority(can_write, cannot_touch, IMPLICIT_ALLOW)
+    for p in changed_paths:
+        forbidden, allowed = matcher.classify(p)
+        evidence.add(p, forbidden=forbidden, out_of_bounds=not allowed and bool(p.strip()))
+
+    boundary = _verdicts(
+        forbidden=evidence.render(evidence.forbidden_sample, evidence.forbidden_count),
+        out_of_bounds=evidence.render(evidence.out_of_bounds_sample, evidence.out_of_bounds_count),
+        total=evidence.total,
+    )
+    return boundary, evidence
@@ -0,0 +1,499 @@
+"""
+Base-vs-head contract drift (docs/artifacts/contract_drift_report.example.json).
+
+Changed contracts are listed with one `git diff`, and every base and head blob is
+read through a single long-lived `git cat-file --batch` process, so the cost is
+three git processes no matter how many contracts a PR touches.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import threading
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from adl.engine.contracts import ContractCache
+
+CONTRACTS_REL = "decisions/contracts"
+LEVELS = ("none", "low", "medium", "high")
+
+SENSITIVE_FIELDS: tuple[str, ...] = (
+    "owner.team",
+    "owner.approver",
+    "intent.goal",
+    "intent.scope.includes",
+    "intent.scope.excludes",
+    "constraints.bounded_authority.can_write_paths",
+    "constraints.bounded_authority.cannot_touch",
+    "constraints.safety",
+)
+# Tracked so edits show up in the report, but never above "low".
+_LOW_FIELDS: tuple[str, ...] = ("title",)
+
+DRIFT_CLASSIFICATION: dict[str, list[str]] = {
+    "high": [
+        "cannot_touch removed or weakened",
+        "owner/approver changed",
+        "scope excludes removed (expands execution authority)",
+        "safety limits relaxed",
+    ],
+    "medium": [
+        "can_write_paths expanded",
+        "goal materially changed",
+        "includes expanded materially",
+    ],
+    "low": [
+        "title edits",
+        "formatting / reordering without semantic delta",
+        "owner/approver set where there was none",
+    ],
+}
+
+_MISSING = object()
+
+
+class GitError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class Blob:
+    oid: str
+    data: bytes
+
+
+class BlobReader:
+    """One `git cat-file --batch` process answering many `<rev>:<path>` lookups."""
+
+    def __init__(self, repo_root: Path) -> None:
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", "--batch"],
+            cwd=str(repo_root),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def __enter__(self) -> BlobReader:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        proc = self._proc
+        if proc.stdin is not None and not proc.stdin.closed:
+            proc.stdin.close()
+        if proc.stdout is not None:
+            proc.stdout.close()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+
+    def read_many(self, specs: Sequence[str]) -> list[Blob | None]:
+        """Blobs for `specs` in order; None where the object is missing or not a blob."""
+        stdin, stdout = self._proc.stdin, self._proc.stdout
+        assert stdin is not None and stdout is not None
+        request = b"".join(os.fsencode(s) + b"\n" for s in specs)
+
+        # Feed from a thread: with many lookups both pipes can fill up at once.
+        def feed(sink: IO[bytes]) -> None:
+            try:
+                sink.write(request)
+                sink.flush()
+            except BrokenPipeError:
+                pass
+
+        feeder = threading.Thread(target=feed, args=(stdin,), daemon=True)
+        feeder.start()
+        out: list[Blob | None] = []
+        try:
+            for _ in specs:
+                header = stdout.readline()
+                if not header:
+                    raise GitError("git cat-file --batch exited unexpectedly")
+                parts = header.split()
+                if len(parts) != 3:
+                    out.append(None)  # "<spec> missing" / "ambiguous"
+                    continue
+                oid, kind, size = parts
+                data = stdout.read(int(size))
+                stdout.read(1)  # trailing LF
+                out.append(Blob(oid.decode("ascii"), data) if kind == b"blob" else None)
+        finally:
+            feeder.join()
+        return out
+
+
+def _git(repo_root: Path, args: list[str]) -> bytes:
+    p = subprocess.run(["git", *args], cwd=str(repo_root), capture_output=True, check=False)
+    if p.returncode != 0:
+        msg = p.stderr.decode("utf-8", "replace").strip()
+        raise GitError(f"git {' '.join(args)} failed: {msg}")
+    return p.stdout
+
+
+def resolve_commits(repo_root: Path, base: str, head: str) -> tuple[str, str]:
+    for rev in (base, head):
+        if not rev or rev.startswith("-"):
+            raise GitError(f"Invalid revision: {rev!r}")
+    out = _git(repo_root, ["rev-parse", f"{base}^{{commit}}", f"{head}^{{commit}}"])
+    base_sha, head_sha = out.decode("ascii").split()
+    return base_sha, head_sha
+
+
+def changed_contracts(
+    repo_root: Path, base_sha: str, head_sha: str, contracts_rel: str = CONTRACTS_REL
+) -> list[str]:
+    """Repo-relative contract paths that differ between the two commits (incl. adds/deletes)."""
+    out = _git(
+        repo_root,
+        [
+            "diff",
+            "--name-only",
+            "-z",
+            "--no-renames",
+            base_sha,
+            head_sha,
+            "--",
+            f"{contracts_rel}/",
+        ],
+    )
+    names = (os.fsdecode(n) for n in out.split(b"\0") if n)
+    return sorted(n for n in names if n.endswith((".yaml", ".yml")) and "\n" not in n)
+
+
+# -- structural diff -------------------------------------------------------------
+
+
+def _get(obj: Any, dotted: str) -> Any:
+    for key in dotted.split("."):
+        if not isinstance(obj, dict) or key not in obj:
+            return _MISSING
+        obj = obj[key]
+    return obj
+
+
+def _as_list(value: Any) -> list[Any]:
+    if value is _MISSING or value is None:
+        return []
+    return list(value) if isinstance(value, list) else [value]
+
+
+def _key(item: Any) -> str:
+    # Path lists are plain strings; only structured entries need canonical JSON.
+    if isinstance(item, str):
+        return item
+    return "\0" + json.dumps(item, sort_keys=True, default=str)
+
+
+def _normalize_text(value: Any) -> str:
+    return " ".join(re.sub(r"[^\w\s]", " ", str(value)).casefold().split())
+
+
+def _plain(value: Any) -> Any:
+    return None if value is _MISSING else value
+
+
+def _json_safe(value: Any) -> Any:
+    # YAML yields dates/datetimes (e.g. `goal: 2025-01-01`); deltas are hashed and
+    # written as JSON, so anything json cannot encode is stored as text.
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return str(value)
+
+
+def _delta(field: str, kind: str, base: Any, head: Any, risk: str, why: str) -> dict[str, Any]:
+    return {
+        "field": field,
+        "type": kind,
+        "base": _json_safe(_plain(base)),
+        "head": _json_safe(_plain(head)),
+        "risk": risk,
+        "why": why,
+    }
+
+
+# field -> (risk when entries are added, risk when entries are removed, why-added, why-removed)
+_SET_RULES: dict[str, tuple[str, str, str, str]] = {
+    "constraints.bounded_authority.can_write_paths": (
+        "medium",
+        "low",
+        "Expanded write surface increases policy attack surface; requires explicit rationale.",
+        "Narrowed write surface.",
+    ),
+    "constraints.bounded_authority.cannot_touch": (
+        "low",
+        "high",
+        "Added protected paths.",
+        "Removed protected paths weakens bounded authority.",
+    ),
+    "intent.scope.includes": (
+        "medium",
+        "low",
+        "Scope includes expanded; execution intent grew.",
+        "Scope includes narrowed.",
+    ),
+    "intent.scope.excludes": (
+        "low",
+        "high",
+        "Added scope exclusions.",
+        "Removed scope exclusions expands execution authority.",
+    ),
+}
+
+
+def _diff_set(field: str, base: Any, head: Any) -> dict[str, Any] | None:
+    b, h = _as_list(base), _as_list(head)
+    bk, hk = {_key(x) for x in b}, {_key(x) for x in h}
+    added, removed = hk - bk, bk - hk
+    if not added and not removed:
+        if b != h:
+            return _delta(field, "reorder", base, head, "low", "Reordered without semantic delta.")
+        return None
+    risk_add, risk_rm, why_add, why_rm = _SET_RULES[field]
+    if added and removed:
+        kind = "set_change"
+        risk = max(risk_add, risk_rm, key=LEVELS.index)
+        why = why_add if risk == risk_add else why_rm
+    elif added:
+        kind, risk, why = "set_expansion", risk_add, why_add
+    else:
+        kind, risk, why = "set_reduction", risk_rm, why_rm
+    return _delta(field, kind, base, head, risk, why)
+
+
+def _diff_safety(field: str, base: Any, head: Any) -> dict[str, Any] | None:
+    if _plain(base) == _plain(head):
+        return None
+    b = base if isinstance(base, dict) else ({} if base is _MISSING else {"value": base})
+    h = head if isinstance(head, dict) else ({} if head is _MISSING else {"value": head})
+    relaxed = any(k not in h or h[k] != v for k, v in b.items())
+    if relaxed:
+        return _delta(field, "relaxed", base, head, "high", "Safety limits removed or changed.")
+    return _delta(field, "tightened", base, head, "low", "Safety limits added.")
+
+
+def _diff_scalar(field: str, base: Any, head: Any) -> dict[str, Any] | None:
+    if _plain(base) == _plain(head):
+        return None
+    kind = "added" if base is _MISSING else "removed" if head is _MISSING else "value_change"
+    if field.startswith("owner."):
+        if kind == "added":
+            return _delta(field, kind, base, head, "low", "Ownership recorded.")
+        return _delta(
+            field, kind, base, head, "high", "Ownership changed; re-confirm accountability."
+        )
+    if field == "intent.goal":
+        if _normalize_text(_plain(base)) == _normalize_text(_plain(head)):
+            return _delta(
+                field, "formatting", base, head, "low", "Wording edit without semantic delta."
+            )
+        return _delta(field, kind, base, head, "medium", "Goal materially changed.")
+    return _delta(field, kind, base, head, "low", "Descriptive edit.")
+
+
+def diff_contract(base: dict[str, Any], head: dict[str, Any]) -> list[dict[str, Any]]:
+    """Deltas on sensitive (and low-risk tracked) fields, in SENSITIVE_FIELDS order."""
+    deltas: list[dict[str, Any]] = []
+    for field in (*SENSITIVE_FIELDS, *_LOW_FIELDS):
+        b, h = _get(base, field), _get(head, field)
+        if field in _SET_RULES:
+            d = _diff_set(field, b, h)
+        elif field == "constraints.safety":
+            d = _diff_safety(field, b, h)
+        else:
+            d = _diff_scalar(field, b, h)
+        if d is not None:
+            deltas.append(d)
+    return deltas
+
+
+def _level(deltas: Iterable[dict[str, Any]]) -> str:
+    return max((d["risk"] for d in deltas), key=LEVELS.index, default="none")
+
+
+def _guardrails(head: dict[str, Any], deltas: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    expanded = any(
+        d["field"] == "constraints.bounded_authority.can_write_paths"
+        and d["type"] in ("set_expansion", "set_change")
+        for d in deltas
+    )
+    acked = bool(head.get("alternatives_rejected")) and bool(_plain(_get(head, "owner.approver")))
+    return [
+        {
+            "type": "steward_rule",
+            "rule": "Any expansion of can_write_paths requires alternatives_rejected + owner ack.",
+            "status": "FAIL" if expanded and not acked else "PASS",
+        }
+    ]
+
+
+def _summary(
+    level: str, deltas: list[dict[str, Any]], base_present: bool, head_present: bool
+) -> str:
+    if not head_present:
+        return "Contract removed at head."
+    if not deltas:
+        if not base_present:
+            return "New contract; no tracked fields set."
+        return "No semantic change to tracked fields."
+    top = [d for d in deltas if d["risk"] == level]
+    fields = ", ".join(dict.fromkeys(d["field"] for d in top))
+    if not base_present:
+        return f"New contract; {level}-risk additions to {fields}."
+    return f"{level.capitalize()}-risk change to {fields}."
+
+
+def _parse(blob: Blob | None, cache: ContractCache | None) -> dict[str, Any] | None:
+    if blob is None:
+        return None
+    from adl.engine.contracts import parse_yaml
+
+    try:
+        obj = cache.load_bytes(blob.data) if cache is not None else parse_yaml(blob.data)
+    except Exception:
+        return {}  # unparseable YAML still counts as present
+    return obj if isinstance(obj, dict) else {}
+
+
+def _contract_entry(
+    path: str, base: dict[str, Any] | None, head: dict[str, Any] | None
+) -> dict[str, Any]:
+    base_present, head_present = base is not None, head is not None
+    if head is not None:
+        # A new contract is classified as additions against an empty base.
+        deltas = diff_contract(base or {}, head)
+        level = _level(deltas) if deltas else "low"  # bytes changed, semantics did not
+    else:
+        deltas = []
+        level = "low"
+    current = head if head is not None else base or {}
+    return {
+        "decision_id": str(current.get("decision_id", Path(path).stem)),
+        "path": path,
+        "base_present": base_present,
+        "head_present": head_present,
+        "drift": {
+            "level": level,
+            "summary": _summary(level, deltas, base_present, head_present),
+            "deltas": deltas,
+            "guardrails": _guardrails(current, deltas),
+        },
+    }
+
+
+def _rollups(contracts: list[dict[str, Any]]) -> dict[str, Any]:
+    fields: Counter[str] = Counter()
+    high: list[dict[str, Any]] = []
+    for c in contracts:
+        drift = c["drift"]
+        fields.update(dict.fromkeys(d["field"] for d in drift["deltas"]).keys())
+        if drift["level"] == "high":
+            primary = next(d["field"] for d in drift["deltas"] if d["risk"] == "high")
+            high.append(
+                {"decision_id": c["decision_id"], "level": "high", "primary_field": primary}
+            )
+    return {
+        "drifted_contracts_count": sum(1 for c in contracts if c["drift"]["level"] != "none"),
+        "high_risk_contracts": high,
+        "most_common_drift_fields": [
+            {"field": f, "count": n}
+            for f, n in sorted(fields.items(), key=lambda kv: (-kv[1], kv[0]))
+        ],
+    }
+
+
+def _sha256_json(obj: Any) -> str:
+    data = json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf-8")
+    return "sha256:" + hashlib.sha256(data).hexdigest()
+
+
+def compute_drift_report(
+    repo_root: Path,
+    base: str,
+    head: str = "HEAD",
+    generated_at: str | None = None,
+    cache: ContractCache | None = None,
+) -> dict[str, Any]:
+    """Compare every contract changed between `base` and `head` (any git revisions)."""
+    base_sha, head_sha = resolve_commits(repo_root, base, head)
+    paths = changed_contracts(repo_root, base_sha, head_sha)
+
+    specs = [f"{sha}:{p}" for p in paths for sha in (base_sha, head_sha)]
+    blobs: list[Blob | None] = []
+    if specs:
+        with BlobReader(repo_root) as reader:
+            blobs = reader.read_many(specs)
+
+    contracts: list[dict[str, Any]] = []
+    inputs: list[list[str | None]] = []
+    for i, path in enumerate(paths):
+        b, h = blobs[2 * i], blobs[2 * i + 1]
+        inputs.append([path, b.oid if b else None, h.oid if h else None])
+        contracts.append(_contract_entry(path, _parse(b, cache), _parse(h, cache)))
+
+    report: dict[str, Any] = {
+        "schema_version": "v0.2",
+        "artifact": "contract_drift_report",
+        "generated_at_utc": generated_at,
+        "run": {
+            "repo": os.environ.get("GITHUB_REPOSITORY"),
+            "ref": os.environ.get("GITHUB_REF"),
+            "base_sha": base_sha,
+            "head_sha": head_sha,
+            "ci": {
+                "provider": "github-actions" if os.environ.get("GITHUB_ACTIONS") else None,
+                "run_id": os.environ.get("GITHUB_RUN_ID"),
+                "route": os.environ.get("ADL_ROUTE"),
+            },
+        },
+        "method": {
+            "deterministic": True,
+            "comparison": "base_vs_head_when_available_else_head_only",
+            "sensitive_fields": list(SENSITIVE_FIELDS),
+            "drift_classification": DRIFT_CLASSIFICATION,
+        },
+        "contracts": contracts,
+        "rollups": _rollups(contracts),
+    }
+    # Hash excludes the wall-clock and CI metadata so reruns on the same commits match.
+    hashed = {k: v for k, v in report.items() if k not in ("generated_at_utc", "run")}
+    report["integrity"] = {
+        "inputs_hash": _sha256_json([base_sha, head_sha, inputs]),
+        "artifact_hash": _sha256_json(hashed),
+        "reproducible": True,
+    }
+    return report
+
+
+def drift_summary(report: dict[str, Any]) -> dict[str, Any]:
+    """Compact form embedded in the debt report's portfolio block."""
+    rollups = report["rollups"]
+    return {
+        "status": "computed",
+        "base_sha": report["run"]["base_sha"],
+        "head_sha": report["run"]["head_sha"],
+        "changed_contracts_count": len(report["contracts"]),
+        "drifted_contracts_count": rollups["drifted_contracts_count"],
+        "levels": dict(Counter(c["drift"]["level"] for c in report["contracts"])),
+        "high_risk_contracts": rollups["high_risk_contracts"],
+    }
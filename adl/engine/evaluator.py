@@ -1,111 +1,94 @@
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
-from jsonschema import Draft202012Validator
-
-from adl.engine.diff_inspector import collect_changed_paths, evaluate_boundaries
-from adl.engine.types import AdmissibilityResult, CheckResult
-from adl.utils.io import load_json_schema
-
-
-def _schema_validate(contract: dict[str, Any], schema_path: Path) -> list[str]:
-    schema = load_json_schema(schema_path)
-    v = Draft202012Validator(schema)
-    errors = sorted(v.iter_errors(contract), key=lambda e: e.path)
-    msgs: list[str] = []
-    for e in errors:
-        loc = ".".join([str(p) for p in e.path]) if e.path else "<root>"
-        msgs.append(f"{loc}: {e.message}")
-    return msgs
-
-
-def _has_falsifiable_success_criteria(contract: dict[str, Any]) -> bool:
-    criteria = contract.get("success_criteria", [])
-    if not isinstance(criteria, list):
-        return False
-
-    tokens = [
-        "%",
-        "p95",
-        "p99",
-        "latency",
-        "blocks",
-        "ci",
-        "fails",
-        "error",
-        "slo",
-        "ms",
-        "seconds",
-    ]
-    joined = " ".join([str(x) for x in criteria]).lower()
-    return any(t in joined for t in tokens)
+from adl.engine.checks import CheckContext, CheckOutcome, CheckRegistry, load_check_registry
+from adl.engine.contracts import ContractCache, load_contract
+from adl.engine.diff_inspector import (
+    BoundaryEval,
+    DiffStats,
+    collect_changed_paths,
+    evaluate_boundaries,
+    evaluate_boundaries_streaming,
+    iter_changed_paths,
+)
+from adl.engine.result_cache import ResultCache, result_key
+from adl.engine.types import AdmissibilityResult, CheckResult, CheckStatus
+from adl.utils.profiling import NULL_PROFILER, Profiler
 
 
-def evaluate_admissibility(
+def _decision_id(contract: dict[str, Any]) -> str:
+    return str(contract.get("decision_id", "UNKNOWN"))
+
+
+@dataclass(frozen=True)
+class DiffStage:
+    boundary: BoundaryEval
+    changed: Sequence[str]
+    evidence: dict[str, Any] | None = None
+
+
+def _match_boundaries(
+    contract: dict[str, Any], changed: Sequence[str], profiler: Profiler
+) -> DiffStage:
+    with profiler.span("boundary_matching") as attrs:
+        boundary = evaluate_boundaries(contract=contract, changed_paths=changed)
+        attrs["path_count"] = len(changed)
+    return DiffStage(boundary, changed)
+
+
+def _stream_boundaries(
     repo_root: Path,
-    contract_path: Path,
     contract: dict[str, Any],
-    strict: bool,
-) -> AdmissibilityResult:
-    checks: list[CheckResult] = []
-    warnings: list[str] = []
-    failures: list[str] = []
-
-    decision_id = str(contract.get("decision_id", "UNKNOWN"))
-
-    schema_path = Path(__file__).resolve().parents[1] / "schema" / "decision_contract.schema.json"
-    schema_errors = _schema_validate(contract, schema_path)
-    if schema_errors:
-        failures.extend([f"schema: {m}" for m in schema_errors])
-        checks.append(
-            CheckResult("contract_schema_valid", "FAIL", "Decision contract schema violations.")
-        )
-    else:
-        checks.append(CheckResult("contract_schema_valid", "PASS", "Contract matches schema."))
-
-    if _has_falsifiable_success_criteria(contract):
-        checks.append(
-            CheckResult(
-                "success_criteria_falsifiable",
-                "PASS",
-                "Success criteria appear falsifiable.",
-            )
-        )
-    else:
-        msg = (
-            "Success criteria look non-falsifiable; "
-            "add measurable thresholds or explicit CI conditions."
+    changed_paths: Sequence[str] | None,
+    evidence_limit: int,
+    profiler: Profiler,
+) -> DiffStage:
+    stats = DiffStats()
+    source = iter_changed_paths(repo_root, stats) if changed_paths is None else changed_paths
+    # Diff streaming and matching interleave, so they share one span.
+    with profiler.span("diff_and_boundary_matching") as attrs:
+        boundary, streamed = evaluate_boundaries_streaming(
+            contract=contract, changed_paths=source, evidence_limit=evidence_limit
         )
-        if strict:
-            failures.append(msg)
-            checks.append(CheckResult("success_criteria_falsifiable", "FAIL", msg))
-        else:
-            warnings.append(msg)
-            checks.append(CheckResult("success_criteria_falsifiable", "WARN", msg))
-
-    alts = contract.get("alternatives_rejected", [])
-    if isinstance(alts, list) and len(alts) >= 1:
-        checks.append(CheckResult("alternatives_provided", "PASS", "Alternatives are present."))
-    else:
-        msg = "No alternatives rejected captured. Weak audit posture."
-        if strict:
-            failures.append(msg)
-            checks.append(CheckResult("alternatives_provided", "FAIL", msg))
-        else:
-            warnings.append(msg)
-            checks.append(CheckResult("alternatives_provided", "WARN", msg))
-
-    changed = collect_changed_paths(repo_root=repo_root)
-    boundary = evaluate_boundaries(contract=contract, changed_paths=changed)
-    
-        # Hardening: in strict mode, "no diff detected" is non-admissible.
-    if strict:
+        attrs.update(path_count=streamed.total, **stats.to_dict())
+    profiler.count("git_subprocesses", stats.subprocess_count)
+    return DiffStage(boundary, streamed.changed_sample, streamed.to_dict())
+
+
+def _cache_lookup(
+    cache: ResultCache, key: str, profiler: Profiler
+) -> AdmissibilityResult | None:
+    with profiler.span("result_cache_lookup") as attrs:
+        hit = cache.get(key)
+        attrs["hit"] = hit is not None
+    if hit is not None and profiler.enabled:
+        hit = replace(hit, profile=profiler.to_dict())
+    return hit
+
+
+def assemble_result(
+    decision_id: str,
+    ctx: CheckContext,
+    registry: CheckRegistry,
+    contract_outcome: CheckOutcome,
+    stage: DiffStage,
+) -> AdmissibilityResult:
+    checks: list[CheckResult] = list(contract_outcome.checks)
+    warnings: list[str] = list(contract_outcome.warnings)
+    failures: list[str] = list(contract_outcome.failures)
+    boundary = stage.boundary
+
+    # Hardening: in strict mode, "no diff detected" is non-admissible.
+    if ctx.strict:
         for c in boundary.checks:
-            if c.name == "diff_detected" and c.status == "WARN":
+            if c.name == "diff_detected" and c.status is CheckStatus.WARN:
                 failures.append(
-                    "Strict mode: no diff detected. " \
+                    "Strict mode: no diff detected. "
                     "Stage changes with git add or ensure CI diff strategy."
                 )
                 break
@@ -114,12 +97,151 @@ def evaluate_admissibility(
     failures.extend(boundary.failures)
     checks.extend(boundary.checks)
 
+    if registry.phase(needs_paths=True):
+        outcome = registry.run(replace(ctx, changed_paths=stage.changed), needs_paths=True)
+        checks.extend(outcome.checks)
+        warnings.extend(outcome.warnings)
+        failures.extend(outcome.failures)
+
     admitted = len(failures) == 0
     return AdmissibilityResult(
         decision_id=decision_id,
         admitted=admitted,
         checks=checks,
-        changed_paths=changed,
+        changed_paths=stage.changed,
         warnings=warnings,
         failures=failures,
+        evidence=stage.evidence,
+        profile=ctx.profiler.to_dict() if ctx.profiler.enabled else None,
     )
+
+
+def evaluate_admissibility(
+    repo_root: Path,
+    contract_path: Path,
+    contract: dict[str, Any],
+    strict: bool,
+    changed_paths: Sequence[str] | None = None,
+    evidence_limit: int | None = None,
+    profiler: Profiler = NULL_PROFILER,
+    registry: CheckRegistry | None = None,
+    result_cache: ResultCache | None = None,
+) -> AdmissibilityResult:
+    """
+    `changed_paths` lets callers that evaluate several contracts share one diff;
+    when omitted the diff is collected from `repo_root`.
+
+    With `evidence_limit`, paths are streamed through the boundary matcher and the
+    result carries capped path samples plus exact counts (`evidence`) instead of
+    every changed path.
+
+    With an enabled `profiler`, per-stage spans are recorded and attached as
+    `result.profile`.
+
+    Contract checks come from `registry` (default: `decisions/checks.yaml` under
+    `repo_root`, else the built-in checks); see adl.engine.checks.
+
+    With a `result_cache`, a run whose contract, diff, strictness, schema, checks
+    and engine version match a stored result returns it without validation or
+    boundary matching; see adl.engine.result_cache. Streaming runs bypass it.
+    """
+    registry = registry if registry is not None else load_check_registry(repo_root)
+    ctx = CheckContext(contract=contract, strict=strict, profiler=profiler)
+
+    if evidence_limit is not None:
+        contract_outcome = registry.run(ctx)
+        stage = _stream_boundaries(repo_root, contract, changed_paths, evidence_limit, profiler)
+        return assemble_result(_decision_id(contract), ctx, registry, contract_outcome, stage)
+
+    changed = (
+        collect_changed_paths(repo_root=repo_root, profiler=profiler)
+        if changed_paths is None
+        else changed_paths
+    )
+    key = None
+    if result_cache is not None:
+        key = result_key(contract, changed, strict, registry.fingerprint)
+        hit = _cache_lookup(result_cache, key, profiler)
+        if hit is not None:
+            return hit
+    contract_outcome = registry.run(ctx)
+    stage = _match_boundaries(contract, changed, profiler)
+    result = assemble_result(_decision_id(contract), ctx, registry, contract_outcome, stage)
+    if result_cache is not None and key is not None:
+        result_cache.put(key, result)
+    return result
+
+
+async def evaluate_admissibility_async(
+    repo_root: Path,
+    contract_path: Path,
+    strict: bool,
+    contract: dict[str, Any] | None = None,
+    cache: ContractCache | None = None,
+    changed_paths: Sequence[str] | None = None,
+    evidence_limit: int | None = None,
+    profiler: Profiler = NULL_PROFILER,
+    registry: CheckRegistry | None = None,
+    result_cache: ResultCache | None = None,
+) -> AdmissibilityResult:
+    """
+    Same result as `evaluate_admissibility`, with git overlapped with the CPU work.
+
+    When the diff has to be collected, the git subprocesses start on a worker
+    thread first. Contract loading (YAML parse, unless `contract` is given) and
+    the contract checks (schema validation, ...) then run while git works. With
+    `evidence_limit`, the streaming diff + boundary stage needs the parsed
+    contract, so it starts right after loading and overlaps the checks.
+    With a `result_cache`, the key needs the diff: while git is still running
+    the checks go ahead anyway (their outcome is dropped on a hit); with
+    `changed_paths` given, they only run after a miss.
+    """
+    loop = asyncio.get_running_loop()
+    diff: asyncio.Future[Sequence[str]] | None = None
+    if changed_paths is None and evidence_limit is None:
+        diff = loop.run_in_executor(None, collect_changed_paths, repo_root, profiler)
+
+    if contract is None:
+        with profiler.span("load_contract", cache=cache is not None):
+            contract = load_contract(contract_path, cache)
+    streaming: asyncio.Future[DiffStage] | None = None
+    if evidence_limit is not None:
+        streaming = loop.run_in_executor(
+            None,
+            _stream_boundaries,
+            repo_root,
+            contract,
+            changed_paths,
+            evidence_limit,
+            profiler,
+        )
+
+    registry = registry if registry is not None else load_check_registry(repo_root)
+    ctx = CheckContext(contract=contract, strict=strict, profiler=profiler)
+
+    key = None
+    contract_outcome: CheckOutcome | None = None
+    if result_cache is not None and streaming is None:
+        if diff is not None:
+            # Overlap the checks with git; a cache hit just discards their outcome.
+            contract_outcome = registry.run(ctx)
+        changed = await diff if diff is not None else changed_paths
+        assert changed is not None
+        key = result_key(contract, changed, strict, registry.fingerprint)
+        hit = _cache_lookup(result_cache, key, profiler)
+        if hit is not None:
+            return hit
+
+    if contract_outcome is None:
+        contract_outcome = registry.run(ctx)
+
+    if streaming is not None:
+        stage = await streaming
+    else:
+        changed = await diff if diff is not None else changed_paths
+        assert changed is not None
+        stage = _match_boundaries(contract, changed, profiler)
+    result = assemble_result(_decision_id(contract), ctx, registry, contract_outcome, stage)
+    if result_cache is not None and key is not None:
+        result_cache.put(key, result)
+    return result
@@ -0,0 +1,165 @@
+"""
+Incremental re-evaluation for `adl watch`.
+
+`IncrementalEvaluator` keeps the last changed-path set and a (forbidden,
+allowed) verdict per path. On `refresh()` it re-collects the diff and only
+classifies paths that were not in the previous set; paths that left the diff
+are dropped. The contract checks (schema validation, ...) run once and again
+only when the contract file or the check registry changes; a contract change
+also clears the per-path verdicts. The result is assembled exactly as
+`adl check` does, so both report the same thing for the same tree.
+
+A contract or check registry that cannot be loaded (mid-save, invalid YAML)
+is reported once as a `WatchError`; evaluation continues with the last good
+contract until the file loads again.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from adl.engine.checks import CheckContext, CheckOutcome, CheckRegistry, load_check_registry
+from adl.engine.contracts import contract_digest, load_contract
+from adl.engine.diff_inspector import boundary_verdicts, classify_paths, collect_changed_paths
+from adl.engine.evaluator import DiffStage, assemble_result
+from adl.engine.types import AdmissibilityResult
+
+# Raised while the contract or checks.yaml is being edited or replaced.
+_RELOAD_ERRORS = (OSError, ImportError, SyntaxError, ValueError, yaml.YAMLError)
+
+
+@dataclass(frozen=True)
+class WatchUpdate:
+    result: AdmissibilityResult
+    added: list[str]
+    removed: list[str]
+    reclassified: int
+    contract_reloaded: bool
+    elapsed_ms: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "decision_id": self.result.decision_id,
+            "admitted": self.result.admitted,
+            "changed_path_count": len(self.result.changed_paths),
+            "added": self.added,
+            "removed": self.removed,
+            "reclassified": self.reclassified,
+            "contract_reloaded": self.contract_reloaded,
+            "warnings": self.result.warnings,
+            "failures": self.result.failures,
+            "elapsed_ms": self.elapsed_ms,
+        }
+
+
+@dataclass(frozen=True)
+class WatchError:
+    contract_path: str
+    error: str
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"contract_path": self.contract_path, "error": self.error}
+
+
+class IncrementalEvaluator:
+    def __init__(self, repo_root: Path, contract_path: Path, strict: bool) -> None:
+        self.repo_root = repo_root
+        self.contract_path = contract_path
+        self.strict = strict
+        self._contract_stat: tuple[int, int] | None = None
+        self._contract_key: tuple[str, str] | None = None
+        self._contract: dict[str, Any] = {}
+        self._registry: CheckRegistry | None = None
+        self._outcome = CheckOutcome()
+        self._changed: Sequence[str] | None = None
+        # path -> (forbidden, allowed); None while bounded_authority is malformed.
+        self._verdicts: dict[str, tuple[bool, bool]] | None = {}
+        self._error: str | None = None
+
+    def _reload(self) -> bool:
+        """Re-read the contract and registry if they changed; True if the checks re-ran."""
+        st = self.contract_path.stat()
+        stat = (st.st_mtime_ns, st.st_size)
+        contract = self._contract
+        if stat != self._contract_stat:
+            contract = load_contract(self.contract_path)
+        registry = load_check_registry(self.repo_root)
+        # Only replace the last good contract once both loaded.
+        self._contract, self._contract_stat = contract, stat
+        key = (contract_digest(self._contract), registry.fingerprint)
+        if key == self._contract_key:
+            return False
+        if self._contract_key is None or key[0] != self._contract_key[0]:
+            self._verdicts = {}
+        self._contract_key = key
+        self._registry = registry
+        self._outcome = registry.run(self._context())
+        return True
+
+    def _context(self) -> CheckContext:
+        return CheckContext(contract=self._contract, strict=self.strict)
+
+    def refresh(self, force: bool = False) -> WatchUpdate | WatchError | None:
+        """
+        Re-evaluate against the current tree. Returns None when neither the diff
+        nor the contract changed since the last update (unless `force`), and a
+        WatchError the first time the contract or registry fails to load.
+        """
+        t0 = time.perf_counter()
+        try:
+            reloaded = self._reload()
+        except _RELOAD_ERRORS as e:
+            message = f"{type(e).__name__}: {e}"
+            if message != self._error:
+                self._error = message
+                return WatchError(str(self.contract_path), message)
+            if self._registry is None:
+                return None  # no good contract yet
+            reloaded = False
+        else:
+            if self._error is not None:
+                self._error = None
+                force = True  # report the recovery even if nothing else changed
+        changed = collect_changed_paths(self.repo_root)
+        previous = self._changed
+        if not (force or reloaded) and previous is not None and changed == previous:
+            return None
+
+        old = set(previous or ())
+        new = set(changed)
+        verdicts = self._verdicts if self._verdicts is not None else {}
+        fresh = [p for p in dict.fromkeys(changed) if p not in verdicts]
+        classified_fresh = classify_paths(self._contract, fresh)
+        classified: list[tuple[bool, bool]] | None = None
+        if classified_fresh is None:
+            self._verdicts = None
+        else:
+            verdicts.update(zip(fresh, classified_fresh, strict=True))
+            for p in [p for p in verdicts if p not in new]:
+                del verdicts[p]
+            self._verdicts = verdicts
+            classified = [verdicts[p] for p in changed]
+
+        assert self._registry is not None
+        result = assemble_result(
+            str(self._contract.get("decision_id", "UNKNOWN")),
+            self._context(),
+            self._registry,
+            self._outcome,
+            DiffStage(boundary_verdicts(changed, classified), changed),
+        )
+        self._changed = changed
+        return WatchUpdate(
+            result=result,
+            added=[p for p in changed if p not in old],
+            removed=sorted(old - new),
+            reclassified=len(fresh),
+            contract_reloaded=reloaded,
+            elapsed_ms=round((time.perf_counter() - t0) * 1000, 3),
+        )
@@ -0,0 +1,177 @@
+"""
+Compact changed-path storage.
+
+A diff of a few hundred thousand paths repeats the same long directory prefixes
+over and over. `PathTable` stores each distinct directory once and every path as
+(directory id, base name). Directory ids and name offsets live in `array`s and
+the base names in one UTF-8 buffer, so a path costs its name's bytes plus twelve,
+instead of a full string object and a list slot. Paths are rebuilt on access, so
+the table reads like the `list[str]` it replaces.
+
+`front_code` / `front_decode` are the prefix-compressed encoding used for
+`changed_paths` in snapshots written with `--compact-paths`: each entry is
+`[n, suffix]`, meaning "the first n characters of the previous path, then
+suffix". Git lists paths sorted, so neighbours share most of their prefix.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, overload
+
+_ERRORS = "surrogatepass"
+_CHUNK = 4096
+
+
+class PathTable(Sequence[str]):
+    __slots__ = ("_dirs", "_dir_index", "_dir_ids", "_ends", "_blob", "_ascii")
+
+    def __init__(self, paths: Iterable[str] = ()) -> None:
+        self._dirs: list[str] = [""]  # with trailing "/"; id 0 is the repo root
+        self._dir_index: dict[str, int] = {"": 0}
+        self._dir_ids = array("I")
+        # Base names, UTF-8 encoded back to back; _ends[i] is where name i ends.
+        self._ends = array("Q")
+        self._blob = bytearray()
+        self._ascii = True
+        self.extend(paths)
+
+    def append(self, path: str) -> None:
+        self.extend((path,))
+
+    def extend(self, paths: Iterable[str]) -> None:
+        it = iter(paths)
+        while chunk := list(itertools.islice(it, _CHUNK)):
+            self._extend_chunk(chunk)
+
+    def _extend_chunk(self, chunk: list[str]) -> None:
+        index, dirs = self._dir_index, self._dirs
+        ids: list[int] = []
+        names: list[str] = []
+        for path in chunk:
+            cut = path.rfind("/") + 1
+            d = path[:cut]
+            i = index.get(d)
+            if i is None:
+                i = index[d] = len(dirs)
+                dirs.append(d)
+            ids.append(i)
+            names.append(path[cut:])
+        self._dir_ids.extend(ids)
+
+        joined = "".join(names)
+        if joined.isascii():
+            # One encode per chunk; byte offsets equal character offsets.
+            base = len(self._blob)
+            self._blob += joined.encode("ascii")
+            self._ends.extend(itertools.accumulate(map(len, names), initial=base))
+            del self._ends[-len(names) - 1]
+            return
+        self._ascii = False
+        for name in names:
+            # surrogatepass: lone surrogates (os.fsdecode of non-UTF-8 bytes) round-trip.
+            self._blob += name.encode("utf-8", _ERRORS)
+            self._ends.append(len(self._blob))
+
+    @property
+    def directory_count(self) -> int:
+        return len(self._dirs)
+
+    def __len__(self) -> int:
+        return len(self._ends)
+
+    def _path(self, i: int) -> str:
+        start = self._ends[i - 1] if i else 0
+        name = self._blob[start : self._ends[i]].decode("utf-8", _ERRORS)
+        return self._dirs[self._dir_ids[i]] + name
+
+    @overload
+    def __getitem__(self, i: int) -> str: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[str]: ...
+
+    def __getitem__(self, i: int | slice) -> str | list[str]:
+        if isinstance(i, slice):
+            return [self._path(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("PathTable index out of range")
+        return self._path(i)
+
+    def __iter__(self) -> Iterator[str]:
+        dirs = self._dirs
+        start = 0
+        if self._ascii:
+            text = self._blob.decode("ascii")
+            for d, end in zip(self._dir_ids, self._ends, strict=True):
+                yield dirs[d] + text[start:end]
+                start = end
+            return
+        blob = self._blob
+        for d, end in zip(self._dir_ids, self._ends, strict=True):
+            yield dirs[d] + blob[start:end].decode("utf-8", _ERRORS)
+            start = end
+
+    def __eq__(self, other: object) -> bool:
+        # Compares equal to a list/tuple of the same paths, so it can stand in for one.
+        if isinstance(other, PathTable | list | tuple):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"PathTable({len(self)} paths, {len(self._dirs)} directories)"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickles (e.g. to check-all workers) as the compact columns, not as strings.
+        return (
+            _restore,
+            (
+                self._dirs,
+                self._dir_ids.tobytes(),
+                self._ends.tobytes(),
+                bytes(self._blob),
+                self._ascii,
+            ),
+        )
+
+
+def _restore(
+    dirs: list[str], dir_ids: bytes, ends: bytes, blob: bytes, ascii_only: bool
+) -> PathTable:
+    table = PathTable()
+    table._ascii = ascii_only
+    table._dirs = dirs
+    table._dir_index = {d: i for i, d in enumerate(dirs)}
+    table._dir_ids.frombytes(dir_ids)
+    table._ends.frombytes(ends)
+    table._blob = bytearray(blob)
+    return table
+
+
+def as_list(paths: Sequence[str]) -> list[str]:
+    """A list for JSON output; lists pass through without a copy."""
+    return paths if isinstance(paths, list) else list(paths)
+
+
+def front_code(paths: Iterable[str]) -> list[list[Any]]:
+    entries: list[list[Any]] = []
+    prev = ""
+    for p in paths:
+        n = len(os.path.commonprefix((prev, p)))
+        entries.append([n, p[n:]])
+        prev = p
+    return entries
+
+
+def front_decode(entries: Iterable[Sequence[Any]]) -> Iterator[str]:
+    prev = ""
+    for n, suffix in entries:
+        prev = prev[: int(n)] + str(suffix)
+        yield prev
@@ -0,0 +1,232 @@
+"""
+Org-level decision debt across many repositories (`adl portfolio`).
+
+Each repo root is scored with `compute_debt_report`, the same report as
+`adl debt`, in a process pool. Results are consumed in input order through a
+bounded window of in-flight repos and turned into flat rows right away:
+
+- contract rows: repo, decision_id, contract_path, debt_score, reasons
+- repo rows: per-repo rollup (contract count, average/max score, snapshots)
+- reason rows: per-reason rollup over the whole portfolio, emitted at the end
+
+Only the reason counters outlive a repo, so memory depends on the window and on
+the largest single repo, not on the number of repos. Rows go to NDJSON or CSV
+writers; a repo that cannot be scored yields a repo row with `error` set.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any, Protocol
+
+from adl.engine.debt import compute_debt_report
+
+CONTRACT_COLUMNS = ("repo", "decision_id", "contract_path", "debt_score", "reasons")
+REPO_COLUMNS = (
+    "repo",
+    "contract_count",
+    "avg_debt_score",
+    "max_debt_score",
+    "snapshot_count",
+    "error",
+)
+REASON_COLUMNS = ("reason", "contract_count", "repo_count", "contract_share")
+
+
+@dataclass(frozen=True)
+class RepoScan:
+    repo: str
+    report: dict[str, Any] | None
+    error: str | None = None
+
+
+def scan_repo(repo: str, use_index: bool = True, use_cache: bool = True) -> RepoScan:
+    """`adl debt` for one repo root, with its own parse cache and debt index."""
+    from adl.engine.contracts import ContractCache
+    from adl.engine.debt_index import DebtIndex
+
+    root = Path(repo).resolve()
+    if not (root / "decisions").is_dir():
+        return RepoScan(repo, None, "no decisions/ directory")
+    try:
+        report = compute_debt_report(
+            repo_root=root,
+            artifacts_dir=root / "artifacts",
+            cache=ContractCache.for_repo(root) if use_cache else None,
+            index=DebtIndex.for_repo(root) if use_index else None,
+        )
+    except Exception as e:  # one broken repo must not stop the portfolio
+        return RepoScan(repo, None, f"{type(e).__name__}: {e}")
+    return RepoScan(repo, report)
+
+
+def _scan_args(args: tuple[str, bool, bool]) -> RepoScan:
+    return scan_repo(*args)
+
+
+def iter_scans(
+    repos: Iterable[str],
+    workers: int | None = None,
+    use_index: bool = True,
+    use_cache: bool = True,
+) -> Iterator[RepoScan]:
+    """Scans in input order; at most 2 * workers repos are in flight."""
+    n_workers = workers or os.cpu_count() or 1
+    jobs = ((repo, use_index, use_cache) for repo in repos)
+    if n_workers == 1:
+        yield from map(_scan_args, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        pending: deque[Future[RepoScan]] = deque()
+        for job in jobs:
+            pending.append(pool.submit(_scan_args, job))
+            if len(pending) >= 2 * n_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def contract_rows(scan: RepoScan) -> Iterator[dict[str, Any]]:
+    for item in (scan.report or {}).get("contracts", []):
+        yield {
+            "repo": scan.repo,
+            "decision_id": item["decision_id"],
+            "contract_path": item["contract_path"],
+            "debt_score": item["debt_score"],
+            "reasons": item["reasons"],
+        }
+
+
+def repo_row(scan: RepoScan) -> dict[str, Any]:
+    report = scan.report or {}
+    items = report.get("contracts", [])
+    portfolio = report.get("portfolio", {})
+    return {
+        "repo": scan.repo,
+        "contract_count": len(items),
+        "avg_debt_score": portfolio.get("avg_debt_score", 0.0),
+        "max_debt_score": max((i["debt_score"] for i in items), default=0.0),
+        "snapshot_count": portfolio.get("snapshot_count", 0),
+        "error": scan.error,
+    }
+
+
+@dataclass
+class ReasonRollup:
+    contracts: int = 0
+    contract_counts: dict[str, int] = field(default_factory=dict)
+    repo_counts: dict[str, int] = field(default_factory=dict)
+
+    def add(self, scan: RepoScan) -> None:
+        seen: set[str] = set()
+        for item in (scan.report or {}).get("contracts", []):
+            self.contracts += 1
+            for reason in item["reasons"]:
+                self.contract_counts[reason] = self.contract_counts.get(reason, 0) + 1
+                seen.add(reason)
+        for reason in seen:
+            self.repo_counts[reason] = self.repo_counts.get(reason, 0) + 1
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        for reason, count in sorted(self.contract_counts.items(), key=lambda kv: (-kv[1], kv[0])):
+            yield {
+                "reason": reason,
+                "contract_count": count,
+                "repo_count": self.repo_counts[reason],
+                "contract_share": round(count / self.contracts, 3) if self.contracts else 0.0,
+            }
+
+
+class RowWriter(Protocol):
+    def write(self, row: dict[str, Any]) -> None: ...
+
+
+class NdjsonWriter:
+    """One compact JSON object per line; `kind`, if given, is added to every row."""
+
+    def __init__(self, stream: IO[str], kind: str | None = None) -> None:
+        self.stream = stream
+        self.kind = kind
+
+    def write(self, row: dict[str, Any]) -> None:
+        if self.kind is not None:
+            row = {"kind": self.kind, **row}
+        self.stream.write(json.dumps(row, sort_keys=True, separators=(",", ":")) + "\n")
+
+
+class CsvWriter:
+    """Fixed columns with a header row; list values are joined with ';'."""
+
+    def __init__(self, stream: IO[str], columns: tuple[str, ...]) -> None:
+        self._writer = csv.DictWriter(stream, fieldnames=columns, lineterminator="\n")
+        self._writer.writeheader()
+
+    def write(self, row: dict[str, Any]) -> None:
+        self._writer.writerow(
+            {
+                k: ";".join(v) if isinstance(v, list) else ("" if v is None else v)
+                for k, v in row.items()
+            }
+        )
+
+
+@dataclass
+class PortfolioSummary:
+    repo_count: int = 0
+    failed: int = 0
+    contract_count: int = 0
+    reasons: ReasonRollup = field(default_factory=ReasonRollup)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "repo_count": self.repo_count,
+            "failed": self.failed,
+            "contract_count": self.contract_count,
+        }
+
+
+def scan_portfolio(
+    repos: Iterable[str],
+    contracts: RowWriter,
+    repo_rows: RowWriter,
+    reasons: RowWriter,
+    workers: int | None = None,
+    use_index: bool = True,
+    use_cache: bool = True,
+    on_report: Callable[[RepoScan], None] | None = None,
+) -> PortfolioSummary:
+    """
+    Stream rows for every repo to the writers; reason rows follow the last repo.
+    `on_report(scan)` is called with each successful scan (e.g. to keep the
+    per-repo JSON report).
+    """
+    summary = PortfolioSummary()
+    for scan in iter_scans(repos, workers, use_index, use_cache):
+        summary.repo_count += 1
+        if scan.error is not None:
+            summary.failed += 1
+        elif on_report is not None:
+            on_report(scan)
+        for row in contract_rows(scan):
+            contracts.write(row)
+            summary.contract_count += 1
+        repo_rows.write(repo_row(scan))
+        summary.reasons.add(scan)
+    for row in summary.reasons.rows():
+        reasons.write(row)
+    return summary
+
+
+def read_repo_list(lines: Iterable[str]) -> Iterator[str]:
+    """Repo roots from a list file: one per line; blank lines and # comments skipped."""
+    for line in lines:
+        line = line.strip()
+        if line and not line.startswith("#"):
+            yield line
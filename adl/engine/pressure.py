@@ -0,0 +1,439 @@
+"""
+Boundary pressure over historical runs (docs/v0.2_steward_visibility.md).
+
+Snapshots (`snapshots/*.json`), ledger records and CAS refs are streamed in
+chunks; each chunk is folded into a `PressureAggregate` (in worker processes
+when there is enough input) and the partial aggregates are merged. Path frequencies use
+space-saving sketches, so memory stays bounded by `top_k` and the number of
+contracts, not by history length.
+"""
+
+from __future__ import annotations
+
+import ast
+import itertools
+import json
+import os
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from adl.artifacts.snapshot import snapshot_changed_paths
+from adl.engine.authority import compile_authority
+from adl.utils.sketch import SpaceSaving
+
+DEFAULT_TOP_K = 50
+# Sketches track this many candidates per reported row, which keeps the error
+# small for skewed (real) path distributions.
+SKETCH_FACTOR = 20
+CHUNK_SIZE = 512
+# Contract heuristics.
+MIN_RUNS = 5
+OUT_OF_BOUNDS_RATE = 0.2
+_ROOT_PREFIXES = frozenset({"", ".", "./", "/", "*", "**", "**/*"})
+_CONTRACT_CLASSES_K = 16
+
+_FORBIDDEN_PREFIX = "Forbidden paths modified: "
+_OOB_PREFIX = "Out-of-bounds modifications: "
+_MORE_RE = re.compile(r"\s\(\+\d+ more; \d+ total\)$")
+
+# A unit of work: ("file", [paths]), ("ledger", ledger_root, [LedgerEntry...]) or
+# ("cas", cas_root, [CasRef...]).
+Chunk = tuple[Any, ...]
+
+
+def path_class(path: str) -> str:
+    """Top-level directory ("docs/"), or "./" for files at the repo root."""
+    head, sep, _ = path.replace("\\", "/").partition("/")
+    return head + "/" if sep else "./"
+
+
+def _parse_path_list(text: str) -> list[str]:
+    try:
+        value = ast.literal_eval(_MORE_RE.sub("", text))
+    except (ValueError, SyntaxError):
+        return []
+    return [str(p) for p in value] if isinstance(value, list) else []
+
+
+def boundary_hits(record: dict[str, Any]) -> tuple[list[str], int, list[str], int]:
+    """
+    (forbidden paths, forbidden count, out-of-bounds paths, out-of-bounds count).
+    Uses the structured evidence block when present, otherwise the failure strings.
+    Path lists may be samples; counts are exact.
+    """
+    ev = record.get("evidence")
+    if isinstance(ev, dict) and "forbidden_count" in ev:
+        forbidden = [str(p) for p in ev.get("forbidden_sample") or []]
+        oob = [str(p) for p in ev.get("out_of_bounds_sample") or []]
+        return forbidden, int(ev["forbidden_count"]), oob, int(ev.get("out_of_bounds_count", 0))
+
+    forbidden, oob = [], []
+    forbidden_n = oob_n = 0
+    for failure in record.get("failures") or []:
+        if not isinstance(failure, str):
+            continue
+        if failure.startswith(_FORBIDDEN_PREFIX):
+            text = failure[len(_FORBIDDEN_PREFIX) :]
+            forbidden = _parse_path_list(text)
+            forbidden_n = _total(text, len(forbidden))
+        elif failure.startswith(_OOB_PREFIX):
+            text = failure[len(_OOB_PREFIX) :]
+            oob = _parse_path_list(text)
+            oob_n = _total(text, len(oob))
+    return forbidden, forbidden_n, oob, oob_n
+
+
+def _total(text: str, sampled: int) -> int:
+    m = re.search(r"; (\d+) total\)$", text)
+    return int(m.group(1)) if m else sampled
+
+
+@dataclass
+class ContractPressure:
+    runs: int = 0
+    blocked: int = 0
+    runs_with_forbidden: int = 0
+    runs_with_out_of_bounds: int = 0
+    forbidden_touches: int = 0
+    out_of_bounds_touches: int = 0
+    out_of_bounds_classes: SpaceSaving[str] = field(
+        default_factory=lambda: SpaceSaving(_CONTRACT_CLASSES_K)
+    )
+    used_prefixes: set[str] = field(default_factory=set)
+
+    def merge(self, other: ContractPressure) -> None:
+        self.runs += other.runs
+        self.blocked += other.blocked
+        self.runs_with_forbidden += other.runs_with_forbidden
+        self.runs_with_out_of_bounds += other.runs_with_out_of_bounds
+        self.forbidden_touches += other.forbidden_touches
+        self.out_of_bounds_touches += other.out_of_bounds_touches
+        self.out_of_bounds_classes = self.out_of_bounds_classes.merge(other.out_of_bounds_classes)
+        self.used_prefixes |= other.used_prefixes
+
+
+class PressureAggregate:
+    def __init__(self, top_k: int, authority: dict[str, list[str]]) -> None:
+        self.top_k = top_k
+        # decision_id -> current can_write_paths, to find authority never exercised.
+        self.authority = authority
+        self.runs = 0
+        self.blocked = 0
+        self.unreadable = 0
+        self.first_timestamp: str | None = None
+        self.last_timestamp: str | None = None
+        capacity = top_k * SKETCH_FACTOR
+        self.out_of_bounds_paths: SpaceSaving[str] = SpaceSaving(capacity)
+        self.forbidden_paths: SpaceSaving[str] = SpaceSaving(capacity)
+        self.forbidden_classes: SpaceSaving[str] = SpaceSaving(capacity)
+        self.contracts: dict[str, ContractPressure] = {}
+
+    def add(self, record: dict[str, Any]) -> None:
+        self.runs += 1
+        ts = record.get("timestamp")
+        if isinstance(ts, str):
+            if self.first_timestamp is None or ts < self.first_timestamp:
+                self.first_timestamp = ts
+            if self.last_timestamp is None or ts > self.last_timestamp:
+                self.last_timestamp = ts
+
+        decision_id = str(record.get("decision_id", "<unknown>"))
+        cp = self.contracts.get(decision_id)
+        if cp is None:
+            cp = self.contracts[decision_id] = ContractPressure()
+        cp.runs += 1
+        if record.get("admitted") is False:
+            self.blocked += 1
+            cp.blocked += 1
+
+        forbidden, forbidden_n, oob, oob_n = boundary_hits(record)
+        if forbidden_n:
+            cp.runs_with_forbidden += 1
+            cp.forbidden_touches += forbidden_n
+        for p in forbidden:
+            self.forbidden_paths.add(p)
+            self.forbidden_classes.add(path_class(p))
+        if oob_n:
+            cp.runs_with_out_of_bounds += 1
+            cp.out_of_bounds_touches += oob_n
+        for p in oob:
+            self.out_of_bounds_paths.add(p)
+            cp.out_of_bounds_classes.add(path_class(p))
+
+        self._mark_used(decision_id, cp, record)
+
+    def _mark_used(self, decision_id: str, cp: ContractPressure, record: dict[str, Any]) -> None:
+        prefixes = self.authority.get(decision_id)
+        if not prefixes:
+            return
+        pending = [p for p in prefixes if p not in cp.used_prefixes]
+        if not pending:
+            return
+        touched = snapshot_changed_paths(record)
+        ev = record.get("evidence")
+        if isinstance(ev, dict) and isinstance(ev.get("directories"), dict):
+            touched.extend(str(d) for d in ev["directories"])
+        for prefix in pending:
+            # Same (glob-aware) semantics as the gate; matchers are cached per rule.
+            matcher = compile_authority([prefix], [], ())
+            if any(matcher.classify(t)[1] for t in touched):
+                cp.used_prefixes.add(prefix)
+
+    def merge(self, other: PressureAggregate) -> None:
+        self.runs += other.runs
+        self.blocked += other.blocked
+        self.unreadable += other.unreadable
+        for ts in (other.first_timestamp, other.last_timestamp):
+            if ts is None:
+                continue
+            if self.first_timestamp is None or ts < self.first_timestamp:
+                self.first_timestamp = ts
+            if self.last_timestamp is None or ts > self.last_timestamp:
+                self.last_timestamp = ts
+        self.out_of_bounds_paths = self.out_of_bounds_paths.merge(other.out_of_bounds_paths)
+        self.forbidden_paths = self.forbidden_paths.merge(other.forbidden_paths)
+        self.forbidden_classes = self.forbidden_classes.merge(other.forbidden_classes)
+        for decision_id, cp in other.contracts.items():
+            mine = self.contracts.get(decision_id)
+            if mine is None:
+                self.contracts[decision_id] = cp
+            else:
+                mine.merge(cp)
+
+
+# -- inputs ----------------------------------------------------------------------
+
+
+def _iter_chunk_records(chunk: Chunk) -> Iterator[dict[str, Any] | None]:
+    if chunk[0] == "file":
+        for path in chunk[1]:
+            try:
+                obj: Any = json.loads(Path(path).read_bytes())
+            except (OSError, ValueError):
+                yield None
+                continue
+            yield obj if isinstance(obj, dict) else None
+    elif chunk[0] == "cas":
+        from adl.artifacts.cas import CasStore
+
+        yield from CasStore(Path(chunk[1])).iter_records(iter(chunk[2]))
+    else:
+        from adl.artifacts.ledger import Ledger
+
+        yield from Ledger(Path(chunk[1])).iter_records(iter(chunk[2]))
+
+
+def aggregate_chunk(chunk: Chunk, top_k: int, authority: dict[str, list[str]]) -> PressureAggregate:
+    agg = PressureAggregate(top_k, authority)
+    for record in _iter_chunk_records(chunk):
+        if record is None:
+            agg.unreadable += 1
+        else:
+            agg.add(record)
+    return agg
+
+
+def iter_chunks(artifacts_dir: Path, chunk_size: int = CHUNK_SIZE) -> Iterator[Chunk]:
+    """Snapshot files and ledger entries in chunks, without listing everything up front."""
+    snapshots_dir = artifacts_dir / "snapshots"
+    if snapshots_dir.is_dir():
+        batch: list[str] = []
+        with os.scandir(snapshots_dir) as it:
+            for e in it:
+                if e.name.endswith(".json") and e.is_file():
+                    batch.append(e.path)
+                    if len(batch) >= chunk_size:
+                        yield ("file", batch)
+                        batch = []
+        if batch:
+            yield ("file", batch)
+
+    from adl.artifacts.ledger import LEDGER_DIRNAME, Ledger
+
+    ledger = Ledger(artifacts_dir / LEDGER_DIRNAME)
+    entries: list[Any] = []
+    for entry in ledger.entries():
+        entries.append(entry)
+        if len(entries) >= chunk_size:
+            yield ("ledger", str(ledger.root), entries)
+            entries = []
+    if entries:
+        yield ("ledger", str(ledger.root), entries)
+
+    from adl.artifacts.cas import CAS_DIRNAME, CasStore
+
+    cas = CasStore(artifacts_dir / CAS_DIRNAME)
+    refs: list[Any] = []
+    for ref in cas.refs():
+        refs.append(ref)
+        if len(refs) >= chunk_size:
+            yield ("cas", str(cas.root), refs)
+            refs = []
+    if refs:
+        yield ("cas", str(cas.root), refs)
+
+
+def _windowed(
+    pool: ProcessPoolExecutor,
+    chunks: Iterable[Chunk],
+    window: int,
+    top_k: int,
+    authority: dict[str, list[str]],
+) -> Iterator[PressureAggregate]:
+    # Bounded number of chunks in flight, so huge histories are never materialized.
+    pending: deque[Future[PressureAggregate]] = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(aggregate_chunk, chunk, top_k, authority))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    for fut in pending:
+        yield fut.result()
+
+
+def aggregate(
+    artifacts_dir: Path,
+    authority: dict[str, list[str]],
+    top_k: int = DEFAULT_TOP_K,
+    workers: int | None = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> PressureAggregate:
+    total = PressureAggregate(top_k, authority)
+    chunks = iter_chunks(artifacts_dir, chunk_size)
+    n_workers = workers or os.cpu_count() or 1
+
+    # A pool only pays off with more than one chunk of input.
+    head = list(itertools.islice(chunks, 2))
+    if n_workers == 1 or len(head) < 2:
+        for chunk in itertools.chain(head, chunks):
+            total.merge(aggregate_chunk(chunk, top_k, authority))
+        return total
+
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        for partial in _windowed(
+            pool, itertools.chain(head, chunks), 2 * n_workers, top_k, authority
+        ):
+            total.merge(partial)
+    return total
+
+
+# -- report ----------------------------------------------------------------------
+
+
+def contract_authority(repo_root: Path) -> dict[str, list[str]]:
+    from adl.engine.contracts import list_contracts, load_yaml_file
+
+    out: dict[str, list[str]] = {}
+    for p in list_contracts(repo_root / "decisions" / "contracts"):
+        try:
+            c = load_yaml_file(p)
+        except Exception:
+            continue
+        if not isinstance(c, dict):
+            continue
+        ba = (c.get("constraints") or {}).get("bounded_authority") or {}
+        paths = ba.get("can_write_paths") if isinstance(ba, dict) else None
+        if isinstance(paths, list):
+            out[str(c.get("decision_id", p.stem))] = [str(x) for x in paths]
+    return out
+
+
+def _top(sketch: SpaceSaving[str], key: str, n: int) -> list[dict[str, Any]]:
+    return [{key: k, "count": c, "error": e} for k, c, e in sketch.top(n)]
+
+
+def _contract_findings(
+    agg: PressureAggregate,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    rows: list[dict[str, Any]] = []
+    under: list[dict[str, Any]] = []
+    over: list[dict[str, Any]] = []
+    for decision_id in sorted(set(agg.contracts) | set(agg.authority)):
+        cp = agg.contracts.get(decision_id, ContractPressure())
+        prefixes = agg.authority.get(decision_id, [])
+        unused = [p for p in prefixes if p not in cp.used_prefixes]
+        rows.append(
+            {
+                "decision_id": decision_id,
+                "runs": cp.runs,
+                "blocked": cp.blocked,
+                "runs_with_forbidden": cp.runs_with_forbidden,
+                "runs_with_out_of_bounds": cp.runs_with_out_of_bounds,
+                "forbidden_touches": cp.forbidden_touches,
+                "out_of_bounds_touches": cp.out_of_bounds_touches,
+                "unused_can_write_paths": unused if cp.runs else [],
+            }
+        )
+
+        oob_rate = cp.runs_with_out_of_bounds / cp.runs if cp.runs else 0.0
+        if cp.runs_with_out_of_bounds >= 2 and oob_rate >= OUT_OF_BOUNDS_RATE:
+            under.append(
+                {
+                    "decision_id": decision_id,
+                    "out_of_bounds_rate": round(oob_rate, 3),
+                    "top_path_classes": _top(cp.out_of_bounds_classes, "path_class", 5),
+                    "why": "Runs repeatedly exceed can_write_paths; authority is under-specified.",
+                }
+            )
+
+        reasons: list[str] = []
+        if any(p.strip() in _ROOT_PREFIXES for p in prefixes):
+            reasons.append("can_write_paths grants the whole repository")
+        if cp.runs >= MIN_RUNS and unused:
+            reasons.append(f"{len(unused)} of {len(prefixes)} can_write_paths never used")
+        if reasons:
+            over.append(
+                {"decision_id": decision_id, "unused_can_write_paths": unused, "reasons": reasons}
+            )
+    return rows, under, over
+
+
+def build_report(agg: PressureAggregate, generated_at: str | None = None) -> dict[str, Any]:
+    contracts, under, over = _contract_findings(agg)
+    return {
+        "schema_version": "v0.2",
+        "artifact": "boundary_pressure_report",
+        "generated_at_utc": generated_at,
+        "method": {
+            "deterministic": True,
+            "sketch": "space-saving",
+            "top_k": agg.top_k,
+            "note": "Path counts are upper bounds; each is at most `error` above the true count.",
+            "heuristics": {
+                "under_permissive": (
+                    f">= 2 runs and >= {OUT_OF_BOUNDS_RATE:.0%} of runs out of bounds"
+                ),
+                "over_permissive": (
+                    f"repo-wide authority, or unused can_write_paths after {MIN_RUNS} runs"
+                ),
+            },
+        },
+        "runs": {
+            "total": agg.runs,
+            "blocked": agg.blocked,
+            "unreadable": agg.unreadable,
+            "first_timestamp": agg.first_timestamp,
+            "last_timestamp": agg.last_timestamp,
+        },
+        "out_of_bounds_paths": _top(agg.out_of_bounds_paths, "path", agg.top_k),
+        "forbidden_paths": _top(agg.forbidden_paths, "path", agg.top_k),
+        "forbidden_by_path_class": _top(agg.forbidden_classes, "path_class", agg.top_k),
+        "contracts": contracts,
+        "under_permissive_contracts": under,
+        "over_permissive_contracts": over,
+    }
+
+
+def compute_pressure_report(
+    repo_root: Path,
+    artifacts_dir: Path,
+    top_k: int = DEFAULT_TOP_K,
+    workers: int | None = None,
+    generated_at: str | None = None,
+) -> dict[str, Any]:
+    agg = aggregate(artifacts_dir, contract_authority(repo_root), top_k=top_k, workers=workers)
+    return build_report(agg, generated_at)
@@ -0,0 +1,202 @@
+"""
+Evaluation result cache.
+
+CI re-runs, retries and matrix jobs evaluate the same contract against the same
+diff. `ResultCache` maps a key over everything an evaluation depends on:
+
+- the contract's canonical content hash (contracts.contract_digest)
+- the sorted changed-path set
+- the strict flag
+- the schema file hash
+- the check registry fingerprint
+- the engine version
+
+A hit returns the stored `AdmissibilityResult` without schema validation,
+contract checks or boundary matching. The diff is still collected, since it is
+part of the key. Streaming (`--evidence-limit`) runs are not cached.
+
+Backends only store bytes under a hex key:
+
+- `MemoryBackend`: in-process LRU (e.g. for `adl serve`)
+- `DirectoryBackend`: one file per entry, LRU by mtime and bounded in total
+  bytes; safe to share between runners on one volume
+
+Anything with `get(key) -> bytes | None` and `put(key, data)` can be plugged
+in.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+from adl import __version__
+from adl.engine.contracts import CACHE_DIRNAME, CacheStats, contract_digest
+from adl.engine.types import AdmissibilityResult
+from adl.engine.validation import DEFAULT_SCHEMA_PATH, schema_digest
+from adl.utils.io import atomic_write_bytes
+
+RESULT_CACHE_FORMAT = 1
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class ResultCacheBackend(Protocol):
+    def get(self, key: str) -> bytes | None: ...
+
+    def put(self, key: str, data: bytes) -> None: ...
+
+
+class MemoryBackend:
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class DirectoryBackend:
+    """
+    `<root>/<key[:2]>/<key>.json`. A hit bumps the entry's mtime; after a write
+    the least recently used entries are removed until the directory is within
+    `max_bytes`. Writes are atomic, so concurrent runners never read a torn entry.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> bytes | None:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        try:
+            atomic_write_bytes(self._path(key), data)
+            # Keep cache entries out of `git status` in host repositories.
+            ignore = self.root / ".gitignore"
+            if not ignore.exists():
+                ignore.write_text("*\n", encoding="utf-8")
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        entries: list[tuple[int, int, str]] = []
+        total = 0
+        for sub in _scandir(self.root):
+            if not sub.is_dir():
+                continue
+            for e in _scandir(Path(sub.path)):
+                if e.name.endswith(".json"):
+                    with contextlib.suppress(OSError):
+                        st = e.stat()
+                        entries.append((st.st_mtime_ns, st.st_size, e.path))
+                        total += st.st_size
+        if total <= self.max_bytes:
+            return
+        for _, size, path in sorted(entries):
+            with contextlib.suppress(OSError):
+                os.unlink(path)  # a concurrent runner may have evicted it already
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+
+def _scandir(path: Path) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def result_key(
+    contract: dict[str, Any],
+    changed_paths: Iterable[str],
+    strict: bool,
+    checks_fingerprint: str,
+    schema_path: Path = DEFAULT_SCHEMA_PATH,
+) -> str:
+    paths = hashlib.sha256()
+    for p in sorted(changed_paths):
+        paths.update(os.fsencode(p) + b"\0")
+    parts = {
+        "format": RESULT_CACHE_FORMAT,
+        "engine": __version__,
+        "contract": contract_digest(contract),
+        "changed_paths": paths.hexdigest(),
+        "strict": strict,
+        "schema": schema_digest(schema_path),
+        "checks": checks_fingerprint,
+    }
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """Stores results without their `profile`; callers attach the current run's."""
+
+    def __init__(self, backend: ResultCacheBackend) -> None:
+        self.backend = backend
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_repo(cls, repo_root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> ResultCache:
+        return cls(DirectoryBackend(repo_root / CACHE_DIRNAME / "results", max_bytes))
+
+    @classmethod
+    def for_dir(cls, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> ResultCache:
+        return cls(DirectoryBackend(root, max_bytes))
+
+    def get(self, key: str) -> AdmissibilityResult | None:
+        data = self.backend.get(key)
+        result = None
+        if data is not None:
+            try:
+                result = AdmissibilityResult.from_dict(json.loads(data))
+            except (ValueError, KeyError, TypeError):
+                result = None  # corrupt or foreign entry: treat as a miss
+        with self._lock:
+            if result is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return result
+
+    def put(self, key: str, result: AdmissibilityResult) -> None:
+        d = result.to_dict()
+        d.pop("profile", None)
+        self.backend.put(key, json.dumps(d, sort_keys=True, separators=(",", ":")).encode())
+        with self._lock:
+            self.stats.writes += 1
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+ROUTES_FILENAME = "routes.yaml"
+
+# Route kinds:
+#   any    - at least one changed path is under one of `paths`
+#   all    - every changed path is under one of `paths` (and the diff is non-empty)
+#   empty  - no changed paths were detected
+#   always - unconditional fallback
+ROUTE_KINDS = ("any", "all", "empty", "always")
+
+# Mirrors the routing the GitHub Action has always done in bash.
+DEFAULT_ROUTES: list[dict[str, Any]] = [
+    {
+        "name": "fallback_maintenance_no_diff",
+        "match": "empty",
+        "contract": "decisions/contracts/DC-REPO-001.yaml",
+    },
+    {
+        "name": "maintenance",
+        "match": "any",
+        "contract": "decisions/contracts/DC-REPO-001.yaml",
+        "paths": [
+            "README.md",
+            "docs/",
+            "examples/",
+            "scripts/",
+            "decisions/contracts/",
+            ".github/workflows/",
+            "integrations/github-action/",
+            "adl/",
+            "pyproject.toml",
+            "tests/",
+        ],
+    },
+    {
+        "name": "install_demo",
+        "match": "all",
+        "contract": "decisions/contracts/DC-INSTALL-DEMO-001.yaml",
+        "paths": ["docs/", "artifacts/"],
+    },
+    {
+        "name": "example_demo_fallback",
+        "match": "always",
+        "contract": "decisions/contracts/DC-2026-001.yaml",
+    },
+]
+
+
+@dataclass(frozen=True)
+class Route:
+    name: str
+    match: str
+    contract: str
+    paths: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    route: str
+    contract: str
+    changed_path_count: int
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "route": self.route,
+            "contract": self.contract,
+            "changed_path_count": self.changed_path_count,
+        }
+
+
+class _Node:
+    __slots__ = ("children", "mask")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _Node] = {}
+        self.mask = 0
+
+
+def _components(prefix: str) -> list[str]:
+    # Same prefix semantics as the authority matcher: "a/b/" and "a/b" cover
+    # "a/b" itself and everything below it.
+    return prefix.replace("\\", "/").rstrip("/").split("/")
+
+
+class RouteTable:
+    """
+    Ordered route rules compiled into one prefix trie.
+
+    Each trie node carries a bitmask of the rules whose `paths` end there, so a
+    changed path is classified against every rule in a single walk, and the
+    whole diff in a single pass.
+    """
+
+    def __init__(self, routes: Iterable[Route]) -> None:
+        self.routes = tuple(routes)
+        if not self.routes:
+            raise ValueError("Route table is empty.")
+        self._root = _Node()
+        self._any_mask = 0
+        self._all_mask = 0
+        for i, r in enumerate(self.routes):
+            if r.match not in ROUTE_KINDS:
+                raise ValueError(
+                    f"Route {r.name!r}: match must be one of {', '.join(ROUTE_KINDS)}."
+                )
+            if r.match in ("any", "all"):
+                if not r.paths:
+                    raise ValueError(f"Route {r.name!r}: match={r.match} needs paths.")
+                bit = 1 << i
+                if r.match == "any":
+                    self._any_mask |= bit
+                else:
+                    self._all_mask |= bit
+                for p in r.paths:
+                    self._insert(p, bit)
+
+    @classmethod
+    def from_config(cls, config: Any) -> RouteTable:
+        """Build from the parsed `routes.yaml` mapping (`{"routes": [...]}`) or a bare list."""
+        items = config.get("routes") if isinstance(config, Mapping) else config
+        if not isinstance(items, list):
+            raise ValueError("Route table must be a list under 'routes'.")
+        routes: list[Route] = []
+        for item in items:
+            if not isinstance(item, Mapping) or not item.get("name") or not item.get("contract"):
+                raise ValueError("Each route needs a 'name' and a 'contract'.")
+            routes.append(
+                Route(
+                    name=str(item["name"]),
+                    match=str(item.get("match", "any")),
+                    contract=str(item["contract"]),
+                    paths=tuple(str(p) for p in item.get("paths") or ()),
+                )
+            )
+        return cls(routes)
+
+    def with_contracts(self, overrides: Mapping[str, str]) -> RouteTable:
+        """Copy with the contracts of named routes replaced (e.g. from action inputs)."""
+        unknown = set(overrides) - {r.name for r in self.routes}
+        if unknown:
+            raise ValueError(f"Unknown route(s): {', '.join(sorted(unknown))}")
+        return RouteTable(
+            Route(r.name, r.match, overrides.get(r.name, r.contract), r.paths) for r in self.routes
+        )
+
+    def _insert(self, prefix: str, bit: int) -> None:
+        node = self._root
+        for part in _components(prefix):
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = _Node()
+            node = child
+        node.mask |= bit
+
+    def _path_mask(self, path: str) -> int:
+        node = self._root
+        mask = 0
+        for part in path.replace("\\", "/").split("/"):
+            nxt = node.children.get(part)
+            if nxt is None:
+                break
+            node = nxt
+            mask |= node.mask
+        return mask
+
+    def route(self, changed_paths: Iterable[str], explicit: str | None = None) -> RouteDecision:
+        """First matching rule wins; an `explicit` contract bypasses the table."""
+        if explicit:
+            count = sum(1 for _ in changed_paths)
+            return RouteDecision(route="explicit", contract=explicit, changed_path_count=count)
+        any_hit = 0
+        all_hit = self._all_mask
+        count = 0
+        for path in changed_paths:
+            count += 1
+            mask = self._path_mask(path)
+            any_hit |= mask
+            all_hit &= mask
+        satisfied = (any_hit & self._any_mask) | (all_hit if count else 0)
+
+        for i, r in enumerate(self.routes):
+            if r.match == "always" or (r.match == "empty" and count == 0) or satisfied >> i & 1:
+                return RouteDecision(route=r.name, contract=r.contract, changed_path_count=count)
+        raise LookupError("No route matched; add a match: always fallback to the route table.")
+
+
+def load_route_table(repo_root: Path, routes_path: Path | None = None) -> RouteTable:
+    """
+    `routes_path`, else `<repo_root>/decisions/routes.yaml` when present, else the
+    built-in default table.
+    """
+    from adl.engine.contracts import load_yaml_file
+
+    path = routes_path or repo_root / "decisions" / ROUTES_FILENAME
+    if routes_path is None and not path.exists():
+        return RouteTable.from_config(DEFAULT_ROUTES)
+    return RouteTable.from_config(load_yaml_file(path))
@@ -0,0 +1,216 @@
+"""
+Sharded evaluation across CI nodes.
+
+`--shard i/N` (1-based) gives a node the changed paths, or in batch mode the
+contracts, whose CRC-32 falls into bucket i. Every node collects the same diff
+and runs the contract checks; only boundary matching is split. A node writes a
+partial snapshot with one verdict per owned path, and `merge_path_shards`
+rebuilds the single-node result from N of them. Every shard keeps each path's
+position in the diff, and the merge reuses the evaluator's assembly code, so
+the merged result is identical to an unsharded run.
+"""
+
+from __future__ import annotations
+
+import os
+import zlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from adl.engine.checks import CheckContext, CheckOutcome, CheckRegistry, load_check_registry
+from adl.engine.contracts import contract_digest
+from adl.engine.diff_inspector import boundary_verdicts, classify_paths
+from adl.engine.evaluator import DiffStage, assemble_result
+from adl.engine.types import AdmissibilityResult, CheckResult
+
+SHARD_FORMAT = 1
+PATH_SHARD = "path_shard"
+BATCH_SHARD = "batch_shard"
+
+
+class ShardError(ValueError):
+    """Shards are missing, duplicated or disagree on what was evaluated."""
+
+
+@dataclass(frozen=True)
+class Shard:
+    index: int  # 1-based, matching CI matrix conventions
+    count: int
+
+    @classmethod
+    def parse(cls, spec: str) -> Shard:
+        index, sep, count = spec.partition("/")
+        try:
+            shard = cls(int(index), int(count))
+        except ValueError:
+            shard = None
+        if not sep or shard is None or not 1 <= shard.index <= shard.count:
+            raise ValueError(f"Expected a shard like 2/4 (1 <= i <= N), got {spec!r}")
+        return shard
+
+    @property
+    def label(self) -> str:
+        return f"{self.index}-of-{self.count}"
+
+    def owns(self, key: str) -> bool:
+        # fsencode keeps non-UTF-8 path bytes (surrogateescape) stable across nodes.
+        return zlib.crc32(os.fsencode(key)) % self.count == self.index - 1
+
+    def to_dict(self) -> dict[str, int]:
+        return {"index": self.index, "count": self.count}
+
+
+def evaluate_path_shard(
+    repo_root: Path,
+    contract_path: Path,
+    contract: dict[str, Any],
+    strict: bool,
+    shard: Shard,
+    changed_paths: Sequence[str],
+    registry: CheckRegistry | None = None,
+) -> dict[str, Any]:
+    """Partial snapshot: contract check outcome plus verdicts for the owned paths."""
+    registry = registry if registry is not None else load_check_registry(repo_root)
+    outcome = registry.run(CheckContext(contract=contract, strict=strict))
+    owned = [(i, p) for i, p in enumerate(changed_paths) if shard.owns(p)]
+    classified = classify_paths(contract, [p for _, p in owned])
+    verdicts = classified if classified is not None else [(False, False)] * len(owned)
+    try:
+        rel = contract_path.resolve().relative_to(repo_root.resolve()).as_posix()
+    except ValueError:
+        rel = contract_path.as_posix()
+    return {
+        "kind": PATH_SHARD,
+        "format": SHARD_FORMAT,
+        "shard": shard.to_dict(),
+        "decision_id": str(contract.get("decision_id", "UNKNOWN")),
+        "contract_path": rel,
+        "contract_sha256": contract_digest(contract),
+        "strict": strict,
+        "checks_fingerprint": registry.fingerprint,
+        "changed_path_count": len(changed_paths),
+        "checks": [c.to_dict() for c in outcome.checks],
+        "warnings": outcome.warnings,
+        "failures": outcome.failures,
+        "authority_valid": classified is not None,
+        "paths": [[i, p, f, a] for (i, p), (f, a) in zip(owned, verdicts, strict=True)],
+    }
+
+
+def shard_admitted(payload: dict[str, Any]) -> bool:
+    """Early signal for one node: no check failures and no boundary hits among its paths."""
+    if payload["failures"] or not payload["authority_valid"]:
+        return False
+    return not any(f or (not a and p.strip()) for _, p, f, a in payload["paths"])
+
+
+def _check_complete(payloads: list[dict[str, Any]], kind: str, same: Iterable[str]) -> None:
+    if not payloads:
+        raise ShardError("No shards to merge.")
+    first = payloads[0]
+    for p in payloads:
+        if p.get("kind") != kind or p.get("format") != SHARD_FORMAT:
+            raise ShardError(f"Not a {kind} (format {SHARD_FORMAT}) payload.")
+        for key in same:
+            if p.get(key) != first.get(key):
+                raise ShardError(f"Shards disagree on {key}.")
+    count = first["shard"]["count"]
+    indices = sorted(p["shard"]["index"] for p in payloads)
+    if any(p["shard"]["count"] != count for p in payloads) or indices != list(range(1, count + 1)):
+        raise ShardError(f"Expected shards 1..{count} exactly once, got {indices}.")
+
+
+def merge_path_shards(
+    payloads: list[dict[str, Any]],
+    registry: CheckRegistry,
+    contract: dict[str, Any] | None = None,
+) -> AdmissibilityResult:
+    """
+    Rebuild the single-node result. `contract` is only needed when the registry
+    has changed-path checks, which run here on the full diff.
+    """
+    _check_complete(
+        payloads,
+        PATH_SHARD,
+        (
+            "decision_id",
+            "contract_sha256",
+            "strict",
+            "checks_fingerprint",
+            "changed_path_count",
+            "checks",
+            "warnings",
+            "failures",
+            "authority_valid",
+        ),
+    )
+    first = payloads[0]
+    if registry.fingerprint != first["checks_fingerprint"]:
+        raise ShardError("Check registry differs from the one the shards ran with.")
+    needs_contract = bool(registry.phase(needs_paths=True))
+    if needs_contract and (
+        contract is None or contract_digest(contract) != first["contract_sha256"]
+    ):
+        raise ShardError("Changed-path checks need the contract the shards evaluated.")
+
+    total = first["changed_path_count"]
+    changed: list[str | None] = [None] * total
+    verdicts: list[tuple[bool, bool]] = [(False, False)] * total
+    seen = 0
+    for payload in payloads:
+        for i, path, forbidden, allowed in payload["paths"]:
+            if not 0 <= i < total or changed[i] is not None:
+                raise ShardError(f"Path position {i} is out of range or owned twice.")
+            changed[i] = path
+            verdicts[i] = (forbidden, allowed)
+            seen += 1
+    if seen != total:
+        raise ShardError(f"Shards cover {seen} of {total} changed paths.")
+    paths = [p for p in changed if p is not None]
+
+    boundary = boundary_verdicts(paths, verdicts if first["authority_valid"] else None)
+    outcome = CheckOutcome(
+        checks=[CheckResult(**c) for c in first["checks"]],
+        warnings=list(first["warnings"]),
+        failures=list(first["failures"]),
+    )
+    ctx = CheckContext(contract=contract or {}, strict=first["strict"])
+    return assemble_result(first["decision_id"], ctx, registry, outcome, DiffStage(boundary, paths))
+
+
+def batch_shard_payload(
+    shard: Shard, batch: dict[str, Any], indices: list[int], contract_count: int
+) -> dict[str, Any]:
+    """`batch` is BatchResult.to_dict() for the owned contracts, at `indices` of the full list."""
+    return {
+        "kind": BATCH_SHARD,
+        "format": SHARD_FORMAT,
+        "shard": shard.to_dict(),
+        "schema_version": batch["schema_version"],
+        "contract_count": contract_count,
+        "changed_paths": batch["changed_paths"],
+        "results": [[i, r] for i, r in zip(indices, batch["results"], strict=True)],
+    }
+
+
+def merge_batch_shards(payloads: list[dict[str, Any]]) -> dict[str, Any]:
+    """Rebuild BatchResult.to_dict() of the unsharded `check-all` run."""
+    _check_complete(payloads, BATCH_SHARD, ("schema_version", "contract_count", "changed_paths"))
+    first = payloads[0]
+    results: list[Any] = [None] * first["contract_count"]
+    for payload in payloads:
+        for i, r in payload["results"]:
+            if not 0 <= i < len(results) or results[i] is not None:
+                raise ShardError(f"Contract position {i} is out of range or owned twice.")
+            results[i] = r
+    if any(r is None for r in results):
+        raise ShardError("Shards do not cover every contract.")
+    return {
+        "schema_version": first["schema_version"],
+        "admitted": all(r["admitted"] for r in results),
+        "contract_count": len(results),
+        "changed_paths": first["changed_paths"],
+        "results": results,
+    }
@@ -1,33 +1,76 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
+from enum import StrEnum
 from typing import Any
 
+from adl.engine.pathtable import as_list
 
-@dataclass(frozen=True)
+
+class CheckStatus(StrEnum):
+    PASS = "PASS"
+    WARN = "WARN"
+    FAIL = "FAIL"
+
+
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     name: str
-    status: str  # PASS/WARN/FAIL
+    status: CheckStatus
     detail: str
 
+    def __post_init__(self) -> None:
+        # Plain "PASS"/"WARN"/"FAIL" strings (custom checks, stored JSON) are accepted.
+        if type(self.status) is not CheckStatus:
+            object.__setattr__(self, "status", CheckStatus(self.status))
 
-@dataclass(frozen=True)
+    def to_dict(self) -> dict[str, str]:
+        return {"name": self.name, "status": self.status.value, "detail": self.detail}
+
+
+@dataclass(frozen=True, slots=True)
 class AdmissibilityResult:
     decision_id: str
     admitted: bool
     checks: list[CheckResult]
-    changed_paths: list[str]
+    # A list, or a PathTable (adl.engine.pathtable) for diffs collected by the evaluator.
+    changed_paths: Sequence[str]
     warnings: list[str]
     failures: list[str]
     schema_version: str = "v0.1"
+    # Streaming mode only: counts and per-directory aggregates; changed_paths is then a sample.
+    evidence: dict[str, Any] | None = None
+    # --profile only: per-stage spans and counters (adl.utils.profiling).
+    profile: dict[str, Any] | None = None
 
     def to_dict(self) -> dict[str, Any]:
-        return {
+        d: dict[str, Any] = {
             "decision_id": self.decision_id,
             "admitted": self.admitted,
             "schema_version": self.schema_version,
-            "checks": [c.__dict__ for c in self.checks],
-            "changed_paths": self.changed_paths,
+            "checks": [c.to_dict() for c in self.checks],
+            "changed_paths": as_list(self.changed_paths),
             "warnings": self.warnings,
             "failures": self.failures,
         }
+        if self.evidence is not None:
+            d["evidence"] = self.evidence
+        if self.profile is not None:
+            d["profile"] = self.profile
+        return d
+
+    @classmethod
+    def from_dict(cls, d: dict[str, Any]) -> AdmissibilityResult:
+        """Inverse of to_dict (e.g. for cached or stored results)."""
+        return cls(
+            decision_id=d["decision_id"],
+            admitted=d["admitted"],
+            checks=[CheckResult(**c) for c in d["checks"]],
+            changed_paths=list(d["changed_paths"]),
+            warnings=list(d["warnings"]),
+            failures=list(d["failures"]),
+            schema_version=d.get("schema_version", "v0.1"),
+            evidence=d.get("evidence"),
+            profile=d.get("profile"),
+        )
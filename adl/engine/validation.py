@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from jsonschema import Draft202012Validator
+
+DEFAULT_SCHEMA_PATH = (
+    Path(__file__).resolve().parents[1] / "schema" / "decision_contract.schema.json"
+)
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    path: Path
+    sha256: str
+    validator: Draft202012Validator
+    fast_check: Callable[[Any], bool] | None = None
+
+    def is_valid(self, instance: Any) -> bool:
+        if self.fast_check is not None:
+            return self.fast_check(instance)
+        return bool(self.validator.is_valid(instance))
+
+    def error_messages(self, instance: Any) -> list[str]:
+        """
+        Sorted `<location>: <message>` strings; empty when valid.
+        Errors are only enumerated when the fast validity check fails.
+        """
+        if self.is_valid(instance):
+            return []
+        errors = sorted(self.validator.iter_errors(instance), key=lambda e: e.path)
+        msgs: list[str] = []
+        for e in errors:
+            loc = ".".join([str(p) for p in e.path]) if e.path else "<root>"
+            msgs.append(f"{loc}: {e.message}")
+        return msgs
+
+
+_lock = threading.Lock()
+_compiled: dict[tuple[str, str], CompiledSchema] = {}
+_stat_index: dict[str, tuple[int, int, str]] = {}
+
+
+def _codegen_check(schema: dict[str, Any]) -> Callable[[Any], bool] | None:
+    """
+    Optional code-generated validator (`pip install agentic-decision-ledger[fast]`).
+    Only used for the bundled schema, whose keywords are draft-07 compatible;
+    jsonschema stays authoritative for error messages.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        return None
+    try:
+        compiled = fastjsonschema.compile(schema)
+    except Exception:
+        return None
+
+    def check(instance: Any) -> bool:
+        try:
+            compiled(instance)
+        except fastjsonschema.JsonSchemaException:
+            return False
+        return True
+
+    return check
+
+
+def get_compiled_schema(schema_path: Path = DEFAULT_SCHEMA_PATH) -> CompiledSchema:
+    """
+    Process-wide validator cache keyed by (resolved schema path, content sha256).
+    A stat() guard avoids re-reading and re-hashing an unchanged schema file.
+    """
+    path = schema_path.resolve()
+    key = str(path)
+    st = path.stat()
+
+    with _lock:
+        known = _stat_index.get(key)
+        if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+            hit = _compiled.get((key, known[2]))
+            if hit is not None:
+                return hit
+
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    with _lock:
+        hit = _compiled.get((key, digest))
+        if hit is None:
+            schema: dict[str, Any] = json.loads(raw.decode("utf-8"))
+            fast = _codegen_check(schema) if path == DEFAULT_SCHEMA_PATH else None
+            hit = CompiledSchema(
+                path=path,
+                sha256=digest,
+                validator=Draft202012Validator(schema),
+                fast_check=fast,
+            )
+            _compiled[(key, digest)] = hit
+        _stat_index[key] = (st.st_mtime_ns, st.st_size, digest)
+        return hit
+
+
+def schema_digest(schema_path: Path = DEFAULT_SCHEMA_PATH) -> str:
+    """Content sha256 of a schema file without compiling it (same stat() guard)."""
+    path = schema_path.resolve()
+    key = str(path)
+    st = path.stat()
+    with _lock:
+        known = _stat_index.get(key)
+        if known is not None and known[:2] == (st.st_mtime_ns, st.st_size):
+            return known[2]
+    digest = hashlib.sha256(path.read_bytes()).hexdigest()
+    with _lock:
+        _stat_index[key] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+def clear_schema_cache() -> None:
+    with _lock:
+        _compiled.clear()
+        _stat_index.clear()
@@ -0,0 +1,141 @@
+"""
+Warm, resident evaluator for pre-commit hooks (`adl serve`).
+
+The server keeps imports, the compiled schema validator and parsed contracts in
+memory and runs the regular Typer commands in-process for each request, so the
+output is exactly what `adl <command>` would print. Requests are handled one at
+a time; each runs with the client's working directory and git/CI/ADL_* environment.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import socket
+import socketserver
+from pathlib import Path
+from typing import Any
+
+from adl import __version__
+from adl.client import SERVED_COMMANDS, is_forwarded
+
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def _fallback(reason: str) -> dict[str, Any]:
+    return {"status": "fallback", "reason": reason}
+
+
+@contextlib.contextmanager
+def _client_context(cwd: str, env: dict[str, str]) -> Any:
+    saved_cwd = os.getcwd()
+    saved_env = {k: v for k, v in os.environ.items() if is_forwarded(k)}
+    for k in saved_env:
+        del os.environ[k]
+    os.environ.update({k: v for k, v in env.items() if is_forwarded(k)})
+    os.chdir(cwd)
+    try:
+        yield
+    finally:
+        os.chdir(saved_cwd)
+        for k in [k for k in os.environ if is_forwarded(k)]:
+            del os.environ[k]
+        os.environ.update(saved_env)
+
+
+def run_command(argv: list[str], cwd: str, env: dict[str, str]) -> dict[str, Any]:
+    """Run one adl command in-process and capture what it would have printed."""
+    from adl.cli import app
+
+    out = io.StringIO()
+    err = io.StringIO()
+    try:
+        with (
+            _client_context(cwd, env),
+            contextlib.redirect_stdout(out),
+            contextlib.redirect_stderr(err),
+        ):
+            rv = app(args=argv, prog_name="adl", standalone_mode=False)
+    except Exception as e:
+        # Usage errors and crashes are reproduced by the client in-process,
+        # which renders them exactly as the CLI does.
+        return _fallback(f"{type(e).__name__}: {e}")
+
+    return {
+        "status": "ok",
+        "exit_code": rv if isinstance(rv, int) else 0,
+        "stdout": out.getvalue(),
+        "stderr": err.getvalue(),
+    }
+
+
+def handle_request(raw: bytes) -> dict[str, Any]:
+    try:
+        req: Any = json.loads(raw)
+    except ValueError:
+        return _fallback("malformed request")
+    if not isinstance(req, dict):
+        return _fallback("malformed request")
+    if req.get("version") != __version__:
+        return _fallback(f"version mismatch: server {__version__}")
+
+    argv = req.get("argv")
+    if not isinstance(argv, list) or not argv or argv[0] not in SERVED_COMMANDS:
+        return _fallback("unsupported command")
+
+    cwd = req.get("cwd")
+    env = req.get("env") or {}
+    if not isinstance(cwd, str) or not os.path.isdir(cwd) or not isinstance(env, dict):
+        return _fallback("invalid request context")
+
+    return run_command([str(a) for a in argv], cwd, {str(k): str(v) for k, v in env.items()})
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        raw = self.rfile.readline(MAX_REQUEST_BYTES)
+        response = handle_request(raw)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class AdlServer(socketserver.UnixStreamServer):
+    def __init__(self, socket_path: Path, idle_timeout: float | None = None) -> None:
+        self.socket_path = socket_path
+        self.idle = False
+        self.timeout = idle_timeout
+        _claim_socket_path(socket_path)
+        old_umask = os.umask(0o077)  # socket is owner-only
+        try:
+            super().__init__(str(socket_path), _Handler)
+        finally:
+            os.umask(old_umask)
+
+    def handle_timeout(self) -> None:
+        self.idle = True
+
+    def serve_until_idle(self) -> None:
+        try:
+            while not self.idle:
+                self.handle_request()
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        super().server_close()
+        with contextlib.suppress(FileNotFoundError):
+            self.socket_path.unlink()
+
+
+def _claim_socket_path(socket_path: Path) -> None:
+    socket_path.parent.mkdir(parents=True, exist_ok=True)
+    if not socket_path.exists():
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        try:
+            s.connect(str(socket_path))
+        except OSError:
+            socket_path.unlink()  # stale socket from a dead server
+            return
+    raise RuntimeError(f"An adl server is already listening on {socket_path}")
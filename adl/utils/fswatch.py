@@ -0,0 +1,225 @@
+"""
+Change notification for `adl watch`.
+
+`InotifyWatcher` (Linux) watches the git directory for index/HEAD rewrites and
+every working-tree directory for file writes, renames and deletions. It talks
+to the kernel through ctypes, so there is no third-party dependency. `git add`
+replaces `.git/index` by renaming `index.lock`, which arrives as one
+IN_MOVED_TO event; a short quiet period coalesces the bursts git produces.
+
+`PollingWatcher` is the fallback (other platforms, or when the inotify watch
+limit is reached): it stats the index, HEAD and the extra files every interval
+and also wakes periodically so working-tree edits are picked up by the caller's
+re-evaluation.
+
+Both expose `wait(timeout) -> bool` (True when something relevant may have
+changed) and `close()`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import ctypes
+import errno
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Protocol
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+
+_GIT_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_DELETE
+_TREE_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT = struct.Struct("iIII")
+_GIT_NAMES = frozenset({"index", "HEAD"})
+SKIP_DIRS = frozenset({".git", ".adl-cache"})
+
+DEFAULT_INTERVAL = 0.5
+DEFAULT_QUIET = 0.005
+_MAX_COALESCE = 0.05
+
+
+class Watcher(Protocol):
+    def wait(self, timeout: float | None = None) -> bool: ...
+
+    def close(self) -> None: ...
+
+
+class WatchUnavailable(OSError):
+    """inotify cannot be used here; callers fall back to polling."""
+
+
+def _libc() -> ctypes.CDLL:
+    if not sys.platform.startswith("linux"):
+        raise WatchUnavailable("inotify is Linux-only")
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError) as e:
+        raise WatchUnavailable(f"inotify not available: {e}") from e
+    return libc
+
+
+class InotifyWatcher:
+    def __init__(self, repo_root: Path, git_dir: Path, extra_dirs: tuple[Path, ...] = ()) -> None:
+        self._libc = _libc()
+        fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise WatchUnavailable(err, f"inotify_init1: {os.strerror(err)}")
+        self._fd = fd
+        self._git_wd = -1
+        self._dirs: dict[int, Path] = {}
+        try:
+            self._git_wd = self._add(git_dir, _GIT_MASK)
+            self._add_tree(repo_root)
+            for d in extra_dirs:
+                self._add(d, _TREE_MASK)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, path: Path, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), mask | IN_ONLYDIR)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise WatchUnavailable(err, "inotify watch limit reached")
+            raise OSError(err, os.strerror(err), str(path))
+        self._dirs[wd] = path
+        return int(wd)
+
+    def _add_tree(self, root: Path) -> None:
+        for dirpath, dirnames, _ in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            with contextlib.suppress(FileNotFoundError, NotADirectoryError):
+                self._add(Path(dirpath), _TREE_MASK)
+
+    @property
+    def watch_count(self) -> int:
+        return len(self._dirs)
+
+    def _drain(self) -> bool:
+        relevant = False
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return relevant
+            offset = 0
+            while offset < len(data):
+                wd, mask, _, size = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + size].rstrip(b"\0").decode(errors="surrogateescape")
+                offset += size
+                relevant |= self._handle(wd, mask, name)
+
+    def _handle(self, wd: int, mask: int, name: str) -> bool:
+        if mask & IN_Q_OVERFLOW:
+            return True
+        if mask & IN_IGNORED:
+            self._dirs.pop(wd, None)
+            return False
+        if wd == self._git_wd:
+            return name in _GIT_NAMES
+        parent = self._dirs.get(wd)
+        if parent is None or name in SKIP_DIRS:
+            return False
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            # New directories (mkdir -p, checkouts) are watched as they appear.
+            with contextlib.suppress(OSError):
+                self._add_tree(parent / name)
+        return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        relevant = self._drain()
+        # Coalesce the burst (index.lock, objects, rename) into one wake-up.
+        deadline = time.monotonic() + _MAX_COALESCE
+        while time.monotonic() < deadline:
+            ready, _, _ = select.select([self._fd], [], [], DEFAULT_QUIET)
+            if not ready:
+                break
+            relevant |= self._drain()
+        return relevant
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher:
+    """
+    Wakes when the stat signature of `files` changes, and at least every
+    `interval` seconds otherwise (working-tree edits are not stat-tracked).
+    """
+
+    def __init__(self, files: tuple[Path, ...], interval: float = DEFAULT_INTERVAL) -> None:
+        self.files = files
+        self.interval = interval
+        self._last = self._signature()
+
+    def _signature(self) -> tuple[tuple[int, int] | None, ...]:
+        sig: list[tuple[int, int] | None] = []
+        for f in self.files:
+            try:
+                st = f.stat()
+            except OSError:
+                sig.append(None)
+            else:
+                sig.append((st.st_mtime_ns, st.st_size))
+        return tuple(sig)
+
+    def wait(self, timeout: float | None = None) -> bool:
+        budget = self.interval if timeout is None else min(timeout, self.interval)
+        deadline = time.monotonic() + budget
+        step = min(0.02, budget)
+        while True:
+            sig = self._signature()
+            if sig != self._last:
+                self._last = sig
+                return True
+            if time.monotonic() >= deadline:
+                # A full interval elapsed: report a possible working-tree change;
+                # the caller re-collects the diff and drops no-ops.
+                return budget == self.interval
+            time.sleep(step)
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(
+    repo_root: Path,
+    git_dir: Path,
+    extra_files: tuple[Path, ...] = (),
+    interval: float = DEFAULT_INTERVAL,
+    poll: bool = False,
+) -> Watcher:
+    """inotify where available, else polling. `extra_files` (e.g. the contract) are watched too."""
+    if not poll:
+        with contextlib.suppress(WatchUnavailable):
+            extra_dirs = tuple(
+                {f.parent for f in extra_files if not f.parent.is_relative_to(repo_root)}
+            )
+            return InotifyWatcher(repo_root, git_dir, extra_dirs)
+    files = (git_dir / "index", git_dir / "HEAD", *extra_files)
+    return PollingWatcher(files, interval)
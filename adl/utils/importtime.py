@@ -0,0 +1,152 @@
+"""
+Cold-start measurement for the adl CLI, driven by `python -X importtime`.
+
+    python -m adl.utils.importtime           # report every scenario as JSON
+    python -m adl.utils.importtime --check   # exit 1 if a budget is exceeded
+
+Budgets are documented in docs/performance.md and enforced by
+tests/test_import_budget.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+
+# Heavy third-party stacks only the evaluating commands need.
+_ENGINE_DEPS = ("yaml", "jsonschema", "referencing", "rpds")
+
+
+@dataclass(frozen=True)
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+@dataclass(frozen=True)
+class Budget:
+    """
+    `argv` is passed to the interpreter after `-X importtime`.
+    `max_adl_self_ms` bounds the time spent executing adl's own modules (median
+    over runs), which is what this repo controls; `forbidden` lists module
+    prefixes that must not be imported at all.
+    """
+
+    name: str
+    argv: tuple[str, ...]
+    max_adl_self_ms: float
+    forbidden: tuple[str, ...] = field(default_factory=tuple)
+
+
+STARTUP_BUDGET: tuple[Budget, ...] = (
+    Budget(
+        name="import adl.cli",
+        argv=("-c", "import adl.cli"),
+        max_adl_self_ms=25.0,
+        forbidden=(*_ENGINE_DEPS, "adl.engine", "adl.artifacts"),
+    ),
+    Budget(
+        name="adl --help",
+        argv=("-m", "adl.cli", "--help"),
+        max_adl_self_ms=25.0,
+        forbidden=(*_ENGINE_DEPS, "adl.engine", "adl.artifacts"),
+    ),
+    Budget(
+        name="adl debt",
+        argv=("-m", "adl.cli", "debt", "--no-cache", "--no-index"),
+        max_adl_self_ms=40.0,
+        forbidden=("jsonschema", "referencing", "rpds", "adl.engine.evaluator"),
+    ),
+    Budget(
+        name="import adl.client",
+        argv=("-c", "import adl.client"),
+        max_adl_self_ms=10.0,
+        forbidden=("typer", *_ENGINE_DEPS, "adl.cli", "adl.engine"),
+    ),
+)
+
+
+def parse_importtime(stderr: str) -> list[ImportRecord]:
+    records: list[ImportRecord] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # header line
+        name = parts[2].rstrip()
+        stripped = name.lstrip(" ")
+        records.append(
+            ImportRecord(
+                module=stripped,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name) - len(stripped) - 1) // 2,
+            )
+        )
+    return records
+
+
+def measure(argv: tuple[str, ...], python: str = sys.executable) -> list[ImportRecord]:
+    p = subprocess.run(
+        [python, "-X", "importtime", *argv],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return parse_importtime(p.stderr)
+
+
+def _matches(module: str, prefix: str) -> bool:
+    return module == prefix or module.startswith(prefix + ".")
+
+
+def evaluate_budget(budget: Budget, runs: int = 5) -> dict[str, object]:
+    samples = [measure(budget.argv) for _ in range(runs)]
+    adl_self_ms = [
+        sum(r.self_us for r in recs if _matches(r.module, "adl")) / 1000 for recs in samples
+    ]
+    total_ms = [sum(r.self_us for r in recs) / 1000 for recs in samples]
+    imported = {r.module for r in samples[0]}
+    forbidden_hits = sorted(m for m in imported if any(_matches(m, f) for f in budget.forbidden))
+    median_adl = statistics.median(adl_self_ms)
+
+    violations: list[str] = []
+    if median_adl > budget.max_adl_self_ms:
+        violations.append(
+            f"adl modules took {median_adl:.1f} ms (budget {budget.max_adl_self_ms} ms)"
+        )
+    if forbidden_hits:
+        violations.append(f"imported forbidden modules: {forbidden_hits}")
+
+    return {
+        "name": budget.name,
+        "adl_self_ms": round(median_adl, 2),
+        "total_import_ms": round(statistics.median(total_ms), 2),
+        "module_count": len(imported),
+        "budget_adl_self_ms": budget.max_adl_self_ms,
+        "forbidden_imported": forbidden_hits,
+        "violations": violations,
+    }
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description="Measure adl CLI cold-start imports.")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--check", action="store_true", help="Exit 1 on any budget violation.")
+    args = ap.parse_args()
+
+    report = [evaluate_budget(b, runs=args.runs) for b in STARTUP_BUDGET]
+    print(json.dumps(report, indent=2, sort_keys=True))
+    failed = any(r["violations"] for r in report)
+    return 1 if args.check and failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
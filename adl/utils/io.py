@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import contextlib
 import json
+import os
+import sys
+import threading
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, TextIO, cast
 
 
 def ensure_dir(p: Path) -> None:
@@ -17,3 +22,91 @@ def now_utc_iso() -> str:
 def load_json_schema(path: Path) -> dict[str, Any]:
     obj: Any = json.loads(path.read_text(encoding="utf-8"))
     return cast(dict[str, Any], obj)
+
+
+def iter_json(obj: Any, indent: int | None = 2) -> Iterator[str]:
+    """Chunks of json.dumps(obj, indent=indent, sort_keys=True), produced lazily."""
+    return json.JSONEncoder(indent=indent, sort_keys=True).iterencode(obj)
+
+
+def write_json(obj: Any, fp: TextIO, indent: int | None = 2) -> None:
+    for chunk in iter_json(obj, indent=indent):
+        fp.write(chunk)
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def fsync_dir(path: Path) -> None:
+    """Make directory entries (new files, renames) durable; no-op on Windows."""
+    if sys.platform == "win32":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_bytes(path: Path, data: bytes, durable: bool = False) -> None:
+    """
+    Write via a temp file in the same directory + os.replace (no torn files).
+    With `durable`, the data and the rename are fsynced before returning.
+    """
+    ensure_dir(path.parent)
+    tmp = _tmp_path(path)
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+        if durable:
+            fsync_dir(path.parent)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+@contextlib.contextmanager
+def atomic_text_writer(path: Path) -> Iterator[TextIO]:
+    """
+    Streaming variant of atomic_write_bytes: the file appears under `path` only
+    once the block exits without an error. Text is UTF-8 with surrogateescape,
+    so non-UTF-8 path bytes from git round-trip.
+    """
+    ensure_dir(path.parent)
+    tmp = _tmp_path(path)
+    try:
+        with tmp.open("w", encoding="utf-8", errors="surrogateescape") as f:
+            yield f
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+@contextlib.contextmanager
+def exclusive_lock(path: Path) -> Iterator[None]:
+    """Blocking inter-process lock on `path` (created if missing)."""
+    with path.open("a+b") as f:
+        if sys.platform == "win32":
+            import msvcrt
+
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl
+
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import heapq
+from collections.abc import Hashable, Iterable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+
+
+class SpaceSaving(Generic[K]):
+    """
+    Approximate top-k counter (Metwally et al., "space-saving") in O(capacity) memory.
+
+    Every item whose true count exceeds total / capacity is guaranteed to be
+    tracked. A reported count overestimates the true count by at most `error`.
+    Sketches built on different shards can be merged (Agarwal et al., 2012).
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.total = 0
+        self.counts: dict[K, int] = {}
+        self.errors: dict[K, int] = {}
+        # Lazy min-heap of (count, seq, item); stale entries are skipped on pop.
+        self._heap: list[tuple[int, int, K]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def _push(self, item: K, count: int) -> None:
+        self._seq += 1
+        heapq.heappush(self._heap, (count, self._seq, item))
+        if len(self._heap) > 4 * self.capacity + 64:
+            self._heap = [(c, i, k) for i, (k, c) in enumerate(self.counts.items())]
+            heapq.heapify(self._heap)
+            self._seq = len(self._heap)
+
+    def _pop_min(self) -> tuple[K, int]:
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def add(self, item: K, weight: int = 1) -> None:
+        self.total += weight
+        if item in self.counts:
+            self.counts[item] += weight
+        elif len(self.counts) < self.capacity:
+            self.counts[item] = weight
+            self.errors[item] = 0
+        else:
+            evicted, floor = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[item] = floor + weight
+            self.errors[item] = floor
+        self._push(item, self.counts[item])
+
+    def update(self, items: Iterable[K]) -> None:
+        for item in items:
+            self.add(item)
+
+    def min_count(self) -> int:
+        """Upper bound on the count of any item not tracked."""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def merge(self, other: SpaceSaving[K]) -> SpaceSaving[K]:
+        merged: SpaceSaving[K] = SpaceSaving(max(self.capacity, other.capacity))
+        m1, m2 = self.min_count(), other.min_count()
+        counts: dict[K, int] = {}
+        errors: dict[K, int] = {}
+        for item in self.counts.keys() | other.counts.keys():
+            counts[item] = self.counts.get(item, m1) + other.counts.get(item, m2)
+            errors[item] = self.errors.get(item, m1) + other.errors.get(item, m2)
+        keep = sorted(counts, key=lambda k: (-counts[k], str(k)))[: merged.capacity]
+        merged.counts = {k: counts[k] for k in keep}
+        merged.errors = {k: errors[k] for k in keep}
+        merged.total = self.total + other.total
+        merged._heap = [(c, i, k) for i, (k, c) in enumerate(merged.counts.items())]
+        heapq.heapify(merged._heap)
+        merged._seq = len(merged._heap)
+        return merged
+
+    def top(self, n: int | None = None) -> list[tuple[K, int, int]]:
+        """(item, count, error) by descending count; ties broken by item for determinism."""
+        ranked = sorted(self.counts, key=lambda k: (-self.counts[k], str(k)))
+        return [(k, self.counts[k], self.errors[k]) for k in ranked[:n]]
@@ -0,0 +1,81 @@
+"""
+Regression benchmark: compiled AuthorityMatcher vs the legacy prefix loop.
+
+Usage:
+    python benchmarks/bench_authority.py --paths 80000 --prefixes 48
+
+Exits non-zero if any path gets a different verdict from the two implementations.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+
+from adl.engine.authority import IMPLICIT_ALLOW, compile_authority
+from adl.engine.diff_inspector import _prefix_match
+
+
+def _synthetic(paths: int, prefixes: int, seed: int) -> tuple[list[str], list[str], list[str]]:
+    rng = random.Random(seed)
+    tops = [f"svc{i}" for i in range(max(4, prefixes // 2))] + ["docs", "vendor", "secrets"]
+    subs = ["src", "config", "lib", "tests", "third_party", "pkg"]
+
+    def rand_path(depth: int) -> str:
+        parts = [rng.choice(tops)] + [rng.choice(subs) for _ in range(depth - 1)]
+        return "/".join(parts)
+
+    can_write = [rand_path(rng.randint(1, 3)) + rng.choice(["/", ""]) for _ in range(prefixes)]
+    cannot_touch = [rand_path(rng.randint(1, 2)) + "/" for _ in range(max(1, prefixes // 4))]
+    changed = [f"{rand_path(rng.randint(1, 6))}/file_{i}.py" for i in range(paths)]
+    return can_write, cannot_touch, changed
+
+
+def _legacy(can_write: list[str], cannot_touch: list[str], changed: list[str]) -> list[tuple]:
+    allowed_prefixes = [*can_write, *IMPLICIT_ALLOW]
+    return [(_prefix_match(p, cannot_touch), _prefix_match(p, allowed_prefixes)) for p in changed]
+
+
+def _compiled(can_write: list[str], cannot_touch: list[str], changed: list[str]) -> list[tuple]:
+    matcher = compile_authority(can_write, cannot_touch, IMPLICIT_ALLOW)
+    return [matcher.classify(p) for p in changed]
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--paths", type=int, default=80_000)
+    ap.add_argument("--prefixes", type=int, default=48)
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args()
+
+    can_write, cannot_touch, changed = _synthetic(args.paths, args.prefixes, args.seed)
+
+    t0 = time.perf_counter()
+    legacy = _legacy(can_write, cannot_touch, changed)
+    t1 = time.perf_counter()
+    compiled = _compiled(can_write, cannot_touch, changed)
+    t2 = time.perf_counter()
+
+    pairs = zip(legacy, compiled, strict=True)
+    mismatches = [changed[i] for i, (a, b) in enumerate(pairs) if a != b]
+    print(
+        json.dumps(
+            {
+                "paths": len(changed),
+                "prefixes": len(can_write) + len(cannot_touch) + len(IMPLICIT_ALLOW),
+                "legacy_seconds": round(t1 - t0, 4),
+                "compiled_seconds": round(t2 - t1, 4),
+                "speedup": round((t1 - t0) / max(t2 - t1, 1e-9), 2),
+                "mismatches": len(mismatches),
+            },
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
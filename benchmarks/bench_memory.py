@@ -0,0 +1,115 @@
+"""
+Memory benchmark: compact path/result representation vs plain lists and dicts.
+
+Measures, with tracemalloc, the retained size of a synthetic diff held as
+- a list[str] (what collect_changed_paths used to return)
+- a PathTable
+- front-coded snapshot entries
+
+plus a result's checks as slotted CheckResult objects vs per-instance dicts.
+It also checks that the JSON output is unchanged.
+
+Usage:
+    python benchmarks/bench_memory.py --paths 200000 --depth 8
+
+Exits non-zero if the PathTable is not smaller than the list, or if any
+encoding fails to round-trip.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from adl.engine.pathtable import PathTable, front_code, front_decode
+from adl.engine.types import AdmissibilityResult, CheckResult, CheckStatus
+
+
+def _synthetic(paths: int, depth: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    tops = ["services", "platform", "libraries", "tools", "docs"]
+    subs = ["src", "main", "java", "com", "example", "internal", "config", "generated"]
+    out: list[str] = []
+    while len(out) < paths:
+        # Files cluster in directories, as in a real tree.
+        parts = [rng.choice(tops)] + [rng.choice(subs) for _ in range(rng.randint(2, depth))]
+        directory = "/".join(parts)
+        out.extend(f"{directory}/File{len(out) + j}.java" for j in range(rng.randint(1, 20)))
+    return sorted(out[:paths])
+
+
+def _retained(build: Callable[[], Any]) -> tuple[Any, int]:
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+class _DictCheck:
+    # Stand-in for the previous non-slotted CheckResult dataclass.
+    def __init__(self, name: str, status: str, detail: str) -> None:
+        self.name = name
+        self.status = status
+        self.detail = detail
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--paths", type=int, default=200_000)
+    ap.add_argument("--depth", type=int, default=8)
+    ap.add_argument("--checks", type=int, default=100_000, help="CheckResult objects to hold.")
+    ap.add_argument("--seed", type=int, default=7)
+    args = ap.parse_args(argv)
+
+    # Paths are rebuilt from bytes so the baseline list does not share string objects.
+    raw = "\0".join(_synthetic(args.paths, args.depth, args.seed)).encode()
+    plain, plain_bytes = _retained(lambda: raw.decode().split("\0"))
+    table, table_bytes = _retained(lambda: PathTable(plain))
+    coded, coded_bytes = _retained(lambda: front_code(plain))
+
+    statuses = list(CheckStatus)
+    _, dict_checks = _retained(
+        lambda: [_DictCheck(f"c{i % 7}", statuses[i % 3].value, "d") for i in range(args.checks)]
+    )
+    _, slot_checks = _retained(
+        lambda: [CheckResult(f"c{i % 7}", statuses[i % 3], "d") for i in range(args.checks)]
+    )
+
+    result = AdmissibilityResult("DC-BENCH", True, [], table, [], [])
+    as_list = AdmissibilityResult("DC-BENCH", True, [], plain, [], [])
+    json_same = json.dumps(result.to_dict()) == json.dumps(as_list.to_dict())
+    ok = table == plain and list(front_decode(coded)) == plain and json_same
+
+    print(
+        json.dumps(
+            {
+                "paths": len(plain),
+                "directories": table.directory_count,
+                "list_bytes": plain_bytes,
+                "path_table_bytes": table_bytes,
+                "path_table_ratio": round(table_bytes / plain_bytes, 3),
+                "front_coded_bytes": coded_bytes,
+                "front_coded_json_ratio": round(
+                    len(json.dumps(coded, separators=(",", ":")))
+                    / len(json.dumps(plain, separators=(",", ":"))),
+                    3,
+                ),
+                "checks": args.checks,
+                "dict_check_bytes": dict_checks,
+                "slotted_check_bytes": slot_checks,
+                "round_trip_ok": ok,
+            },
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    return 0 if ok and table_bytes < plain_bytes else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
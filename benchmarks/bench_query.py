@@ -0,0 +1,110 @@
+"""
+Query benchmark: `adl query` over a synthetic history index.
+
+Fills a fresh index with `--runs` runs (each with `--paths` changed paths, so
+runs * paths rows in changed_paths), then times the queries the index is built
+for:
+
+- rejected runs that touched a path prefix in a time window
+- the last runs of one decision
+- admitted -> rejected flips of one decision
+- FAIL counts per check in a time window
+
+Usage:
+    python benchmarks/bench_query.py --runs 1000000 --paths 4
+
+Exits non-zero if a query takes longer than `--max-ms`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from adl.artifacts.history_index import HistoryIndex
+
+_EPOCH = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _record(rng: random.Random, i: int, paths: int) -> dict[str, Any]:
+    admitted = rng.random() < 0.8
+    tops = ["docs", "src", "trading", "platform", "tools"]
+    changed = sorted(
+        f"{rng.choice(tops)}/m{rng.randrange(50)}/f{rng.randrange(1000)}.py" for _ in range(paths)
+    )
+    status = "PASS" if admitted else "FAIL"
+    return {
+        "decision_id": f"DC-{i % 500:04d}",
+        "timestamp": (_EPOCH + timedelta(seconds=30 * i)).isoformat(),
+        "admitted": admitted,
+        "checks": [
+            {"name": "bounded_authority_respected", "status": status, "detail": ""},
+            {"name": "forbidden_paths_untouched", "status": "PASS", "detail": ""},
+        ],
+        "failures": [] if admitted else [f"Out-of-bounds modifications: {changed[:1]}"],
+        "changed_paths": changed,
+    }
+
+
+def _timed(fn: Callable[[], list[Any]], repeat: int = 3) -> tuple[float, int]:
+    best = float("inf")
+    rows = 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        rows = len(fn())
+        best = min(best, time.perf_counter() - t0)
+    return round(best * 1000, 3), rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument("--runs", type=int, default=200_000)
+    ap.add_argument("--paths", type=int, default=4, help="Changed paths per run.")
+    ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--max-ms", type=float, default=100.0)
+    args = ap.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        index = HistoryIndex(Path(tmp) / "history.sqlite3")
+        t0 = time.perf_counter()
+        index.add_all((_record(rng, i, args.paths), "ledger", str(i)) for i in range(args.runs))
+        build_s = time.perf_counter() - t0
+
+        # A window covering the last ~1% of runs.
+        since = (_EPOCH + timedelta(seconds=30 * (args.runs - args.runs // 100))).isoformat()
+        queries = {
+            "rejected_with_prefix_since": lambda: list(
+                index.runs(status="rejected", path_prefix="trading/m7/", since=since)
+            ),
+            "decision_last_runs": lambda: list(index.runs(decision_id="DC-0042", since=since)),
+            "decision_flips": lambda: list(index.flips("rejected", decision_id="DC-0042")),
+            "fail_counts_since": lambda: list(index.check_counts(status="FAIL", since=since)),
+        }
+        timings = {name: _timed(fn) for name, fn in queries.items()}
+        index.close()
+
+    print(
+        json.dumps(
+            {
+                "runs": args.runs,
+                "changed_path_rows": args.runs * args.paths,
+                "build_s": round(build_s, 2),
+                "queries": {name: {"ms": ms, "rows": rows} for name, (ms, rows) in timings.items()},
+            },
+            indent=2,
+            sort_keys=True,
+        )
+    )
+    return 0 if all(ms <= args.max_ms for ms, _ in timings.values()) else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
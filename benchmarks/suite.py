@@ -0,0 +1,319 @@
+"""
+Synthetic-repo benchmark suite for the gate.
+
+Each scenario builds a temporary git repo (contracts + a staged diff) and times
+the gate's hot paths: collect_changed_paths, evaluate_boundaries,
+evaluate_admissibility, compute_debt_report, artifact writing and
+integrations/github-action/route_contract.py:main.
+
+Usage:
+    python benchmarks/suite.py --out bench.json                 # run default matrix
+    python benchmarks/suite.py --quick                          # tiny smoke run
+    python benchmarks/suite.py --contracts 200 --diff-size 20000 --prefixes 64 --depth 6
+    python benchmarks/suite.py --compare baseline.json          # exit 1 on regressions
+
+A baseline is just a previous --out file; keep one per machine/runner class.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+REPO = Path(__file__).resolve().parents[1]
+ROUTE_SCRIPT = REPO / "integrations" / "github-action" / "route_contract.py"
+RESULT_SCHEMA_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    contracts: int
+    prefixes: int
+    diff_size: int
+    depth: int
+
+
+DEFAULT_MATRIX: tuple[Scenario, ...] = (
+    Scenario("baseline", contracts=3, prefixes=8, diff_size=50, depth=3),
+    Scenario("wide_diff", contracts=3, prefixes=8, diff_size=5000, depth=3),
+    Scenario("deep_paths", contracts=3, prefixes=8, diff_size=1000, depth=12),
+    Scenario("many_prefixes", contracts=3, prefixes=256, diff_size=1000, depth=4),
+    Scenario("many_contracts", contracts=200, prefixes=16, diff_size=200, depth=3),
+)
+QUICK_MATRIX: tuple[Scenario, ...] = (
+    Scenario("quick", contracts=2, prefixes=4, diff_size=10, depth=2),
+)
+
+
+# -- synthetic repo --------------------------------------------------------------
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _contract(decision_id: str, can_write: list[str], cannot_touch: list[str]) -> dict[str, Any]:
+    return {
+        "schema_version": "v0.1",
+        "decision_id": decision_id,
+        "title": f"Synthetic contract {decision_id}",
+        "owner": {"team": "bench", "approver": "human:@bench"},
+        "intent": {"goal": "Benchmark the gate.", "scope": {"includes": ["bench"]}},
+        "assumptions": ["Synthetic."],
+        "constraints": {
+            "bounded_authority": {"can_write_paths": can_write, "cannot_touch": cannot_touch}
+        },
+        "alternatives_rejected": [{"option": "none", "rejected_because": "synthetic"}],
+        "success_criteria": ["p95 latency < 200ms"],
+    }
+
+
+def _dir(rng: random.Random, depth: int) -> str:
+    return "/".join(f"d{rng.randint(0, 9)}" for _ in range(depth))
+
+
+def build_repo(root: Path, s: Scenario, seed: int = 7) -> dict[str, Any]:
+    """Create the repo under `root`; returns what the timers need."""
+    import yaml
+
+    rng = random.Random(seed)
+    contracts_dir = root / "decisions" / "contracts"
+    contracts_dir.mkdir(parents=True)
+    _git(root, "init", "-q")
+
+    prefixes = sorted(
+        {f"src/{_dir(rng, rng.randint(1, max(1, s.depth - 1)))}/" for _ in range(s.prefixes)}
+    )
+    cannot_touch = ["secrets/", ".github/workflows/"]
+    for i in range(s.contracts):
+        c = _contract(f"DC-BENCH-{i:04d}", [*prefixes, "docs/"], cannot_touch)
+        (contracts_dir / f"DC-BENCH-{i:04d}.yaml").write_text(yaml.safe_dump(c), encoding="utf-8")
+    (root / "README.md").write_text("bench\n", encoding="utf-8")
+    _git(root, "add", "-A")
+    _git(root, "commit", "-q", "-m", "base")
+
+    # ~90% of the diff lands inside can_write_paths, the rest out of bounds.
+    for i in range(s.diff_size):
+        if rng.random() < 0.9:
+            rel = f"{rng.choice(prefixes)}{_dir(rng, max(0, s.depth - 2))}/f{i}.py"
+        else:
+            rel = f"other/{_dir(rng, s.depth)}/f{i}.py"
+        p = root / rel.replace("//", "/")
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x\n", encoding="utf-8")
+    _git(root, "add", "-A")
+    return {"contract_path": contracts_dir / "DC-BENCH-0000.yaml"}
+
+
+# -- timing ----------------------------------------------------------------------
+
+
+def _time(fn: Callable[[], object], repeat: int) -> dict[str, Any]:
+    samples: list[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return {
+        "min_s": round(min(samples), 6),
+        "median_s": round(statistics.median(samples), 6),
+        "runs": repeat,
+    }
+
+
+@contextlib.contextmanager
+def _cwd(path: Path) -> Iterator[None]:
+    old = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(old)
+
+
+def _load_route_script() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("route_contract", ROUTE_SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_scenario(s: Scenario, repeat: int) -> dict[str, Any]:
+    from adl.artifacts.decision_record import write_decision_record
+    from adl.artifacts.snapshot import write_snapshot
+    from adl.engine.contracts import load_contract
+    from adl.engine.debt import compute_debt_report
+    from adl.engine.diff_inspector import collect_changed_paths, evaluate_boundaries
+    from adl.engine.evaluator import evaluate_admissibility
+
+    route = _load_route_script()
+
+    with tempfile.TemporaryDirectory(prefix="adl-bench-") as tmp:
+        root = Path(tmp) / "repo"
+        root.mkdir()
+        ctx = build_repo(root, s)
+        contract_path: Path = ctx["contract_path"]
+        contract = load_contract(contract_path)
+        artifacts = Path(tmp) / "artifacts"
+        changed = collect_changed_paths(root)
+        result = evaluate_admissibility(root, contract_path, contract, strict=True)
+
+        def write_artifacts() -> None:
+            (artifacts / "snapshots").mkdir(parents=True, exist_ok=True)
+            write_decision_record(artifacts / "record.md", result, "2026-01-01T00:00:00+00:00")
+            write_snapshot(
+                artifacts / "snapshots" / "bench.snapshot.json", result, "2026-01-01T00:00:00+00:00"
+            )
+
+        def route_main() -> None:
+            with _cwd(root), contextlib.redirect_stdout(io.StringIO()):
+                route.main()
+
+        timings = {
+            "collect_changed_paths": _time(lambda: collect_changed_paths(root), repeat),
+            "evaluate_boundaries": _time(lambda: evaluate_boundaries(contract, changed), repeat),
+            "evaluate_admissibility": _time(
+                lambda: evaluate_admissibility(root, contract_path, contract, strict=True), repeat
+            ),
+            "compute_debt_report": _time(lambda: compute_debt_report(root, artifacts), repeat),
+            "write_artifacts": _time(write_artifacts, repeat),
+            "route_contract_main": _time(route_main, repeat),
+        }
+
+    return {
+        "params": asdict(s),
+        "changed_path_count": len(changed),
+        "timings": timings,
+    }
+
+
+def _git_version() -> str:
+    p = subprocess.run(["git", "--version"], capture_output=True, text=True, check=False)
+    return p.stdout.strip()
+
+
+def run_suite(scenarios: tuple[Scenario, ...], repeat: int) -> dict[str, Any]:
+    return {
+        "schema_version": RESULT_SCHEMA_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "git": _git_version(),
+        "cpu_count": os.cpu_count(),
+        "scenarios": {s.name: run_scenario(s, repeat) for s in scenarios},
+    }
+
+
+# -- baseline comparison ---------------------------------------------------------
+
+
+def compare(
+    current: dict[str, Any],
+    baseline: dict[str, Any],
+    tolerance: float = 0.25,
+    min_delta_s: float = 0.002,
+) -> list[dict[str, Any]]:
+    """
+    Rows for every (scenario, op) in both runs. A row regresses when the best time
+    is more than `tolerance` slower than baseline AND slower by at least
+    `min_delta_s` (so sub-millisecond jitter never fails a build).
+    """
+    rows: list[dict[str, Any]] = []
+    for name, scen in sorted(current["scenarios"].items()):
+        base_scen = baseline.get("scenarios", {}).get(name)
+        if base_scen is None or base_scen.get("params") != scen["params"]:
+            continue
+        for op, t in sorted(scen["timings"].items()):
+            b = base_scen["timings"].get(op)
+            if b is None:
+                continue
+            ratio = t["min_s"] / b["min_s"] if b["min_s"] > 0 else 1.0
+            regressed = ratio > 1 + tolerance and t["min_s"] - b["min_s"] >= min_delta_s
+            rows.append(
+                {
+                    "scenario": name,
+                    "op": op,
+                    "baseline_s": b["min_s"],
+                    "current_s": t["min_s"],
+                    "ratio": round(ratio, 3),
+                    "regressed": regressed,
+                }
+            )
+    return rows
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    ap.add_argument("--out", type=Path, help="Write results JSON here (default: stdout).")
+    ap.add_argument("--compare", type=Path, help="Baseline results JSON; exit 1 on regression.")
+    ap.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown (0.25 = 25%%).")
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--quick", action="store_true", help="Tiny matrix for smoke runs.")
+    ap.add_argument("--contracts", type=int)
+    ap.add_argument("--prefixes", type=int)
+    ap.add_argument("--diff-size", type=int)
+    ap.add_argument("--depth", type=int)
+    args = ap.parse_args(argv)
+
+    custom = (args.contracts, args.prefixes, args.diff_size, args.depth)
+    if any(v is not None for v in custom):
+        base = DEFAULT_MATRIX[0]
+        scenarios: tuple[Scenario, ...] = (
+            Scenario(
+                "custom",
+                contracts=args.contracts or base.contracts,
+                prefixes=args.prefixes or base.prefixes,
+                diff_size=args.diff_size or base.diff_size,
+                depth=args.depth or base.depth,
+            ),
+        )
+    else:
+        scenarios = QUICK_MATRIX if args.quick else DEFAULT_MATRIX
+
+    results = run_suite(scenarios, repeat=args.repeat)
+    text = json.dumps(results, indent=2, sort_keys=True)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare is None:
+        return 0
+    baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+    rows = compare(results, baseline, tolerance=args.tolerance)
+    for r in rows:
+        flag = "REGRESSION" if r["regressed"] else "ok"
+        print(
+            f"{flag:>10}  {r['scenario']:<16} {r['op']:<24} "
+            f"{r['baseline_s']:.4f}s -> {r['current_s']:.4f}s (x{r['ratio']})",
+            file=sys.stderr,
+        )
+    if not rows:
+        print("No comparable scenarios in baseline.", file=sys.stderr)
+    return 1 if any(r["regressed"] for r in rows) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
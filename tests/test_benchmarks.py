@@ -0,0 +1,39 @@
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+SUITE = Path(__file__).resolve().parents[1] / "benchmarks" / "suite.py"
+
+
+def _suite() -> ModuleType:
+    spec = importlib.util.spec_from_file_location("bench_suite", SUITE)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses need the module registered
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_benchmark_suite_smoke_and_compare() -> None:
+    suite = _suite()
+    results = suite.run_suite(suite.QUICK_MATRIX, repeat=1)
+    quick = results["scenarios"]["quick"]
+    assert quick["changed_path_count"] == 10
+    assert set(quick["timings"]) == {
+        "collect_changed_paths",
+        "evaluate_boundaries",
+        "evaluate_admissibility",
+        "compute_debt_report",
+        "write_artifacts",
+        "route_contract_main",
+    }
+
+    assert not any(r["regressed"] for r in suite.compare(results, results))
+
+    faster = {"scenarios": {"quick": dict(quick, timings={})}}
+    faster["scenarios"]["quick"]["timings"] = {
+        op: dict(t, min_s=t["min_s"] / 10) for op, t in quick["timings"].items()
+    }
+    rows = suite.compare(results, faster, tolerance=0.25, min_delta_s=0.0)
+    assert {r["op"] for r in rows if r["regressed"]} >= {"collect_changed_paths", "write_artifacts"}
@@ -0,0 +1,121 @@
+import sys
+import time
+import types
+from pathlib import Path
+
+import pytest
+
+from adl.engine.checks import (
+    DEFAULT_REGISTRY,
+    Check,
+    CheckContext,
+    CheckOutcome,
+    CheckRegistry,
+    KeywordMatcher,
+    load_check_registry,
+    verdict,
+)
+from adl.engine.contracts import load_contract
+from adl.engine.evaluator import evaluate_admissibility
+
+
+def test_keyword_matcher_respects_word_boundaries() -> None:
+    m = KeywordMatcher(["ms", "ci", "%", "p95", "error"])
+    for text in ["p95 < 200ms", "CI blocks merge", "99% of runs", "no errors", "(ms)"]:
+        assert m.search(text), text
+    for text in ["Handles all items", "decision logged", "terrorism", "sp95"]:
+        assert not m.search(text), text
+
+
+def test_registry_runs_concurrently_in_order(monkeypatch: pytest.MonkeyPatch) -> None:
+    def slow(name: str, delay: float) -> Check:
+        def run(ctx: CheckContext) -> CheckOutcome:
+            time.sleep(delay)
+            return verdict(name, False, "ok", f"{name} failed", "strict", ctx.strict)
+
+        return Check(name, run)
+
+    registry = CheckRegistry([slow("a", 0.05), slow("b", 0.0), slow("c", 0.02)], concurrency=3)
+    out = registry.run(CheckContext(contract={}, strict=False))
+    assert [c.name for c in out.checks] == ["a", "b", "c"]
+    assert out.warnings == ["a failed", "b failed", "c failed"]
+    assert out.failures == []
+
+    module = types.ModuleType("adl_test_checks")
+
+    def no_vendor(ctx: CheckContext) -> CheckOutcome:
+        touched = [p for p in ctx.changed_paths or [] if p.startswith("vendor/")]
+        return verdict("no_vendor", not touched, "ok", f"vendor touched: {touched}", "fail", True)
+
+    module.no_vendor = no_vendor  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "adl_test_checks", module)
+    config = {
+        "checks": [
+            {"name": "goal_has_metric", "field": "intent.goal", "keywords": ["latency"]},
+            {
+                "name": "no_vendor",
+                "callable": "adl_test_checks:no_vendor",
+                "inputs": ["changed_paths"],
+            },
+        ]
+    }
+    configured = CheckRegistry.from_config(config)
+    assert configured.fingerprint != DEFAULT_REGISTRY.fingerprint
+    assert configured.fingerprint == CheckRegistry.from_config(config).fingerprint
+
+    repo_root = Path(".").resolve()
+    contract_path = repo_root / "decisions" / "contracts" / "DC-REPO-001.yaml"
+    result = evaluate_admissibility(
+        repo_root,
+        contract_path,
+        load_contract(contract_path),
+        strict=True,
+        changed_paths=["adl/cli.py", "vendor/x.py"],
+        registry=configured,
+    )
+    names = [c.name for c in result.checks]
+    assert names[:4] == [
+        "contract_schema_valid",
+        "success_criteria_falsifiable",
+        "alternatives_provided",
+        "goal_has_metric",
+    ]
+    assert names[-1] == "no_vendor"
+    assert result.failures[-1] == "vendor touched: ['vendor/x.py']"
+
+    with pytest.raises(ValueError, match="Duplicate"):
+        CheckRegistry.from_config(
+            {"checks": [{"name": "alternatives_provided", "keywords": ["x"]}]}
+        )
+
+
+def test_callable_check_edits_change_the_fingerprint(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "adl_edited_checks", raising=False)
+    source = tmp_path / "adl_edited_checks.py"
+
+    def write_check(detail: str) -> None:
+        source.write_text(
+            "from adl.engine.checks import verdict\n\n\n"
+            "def check(ctx):\n"
+            f"    return verdict('edited', True, {detail!r}, 'no', 'fail', ctx.strict)\n",
+            encoding="utf-8",
+        )
+
+    write_check("first")
+    repo = tmp_path / "repo"
+    (repo / "decisions").mkdir(parents=True)
+    (repo / "decisions" / "checks.yaml").write_text(
+        "checks:\n  - name: edited\n    callable: adl_edited_checks:check\n", encoding="utf-8"
+    )
+    ctx = CheckContext(contract={}, strict=True)
+    before = load_check_registry(repo)
+    assert load_check_registry(repo) is before
+    assert before.run(ctx).checks[-1].detail == "first"
+
+    write_check("second, edited body")  # checks.yaml itself is untouched
+    after = load_check_registry(repo)
+    assert after.fingerprint != before.fingerprint
+    assert after.run(ctx).checks[-1].detail == "second, edited body"
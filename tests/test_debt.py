@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from adl.engine.debt import compute_debt_report
@@ -9,3 +10,174 @@ def test_debt_report_runs() -> None:
     report = compute_debt_report(repo_root=repo_root, artifacts_dir=artifacts_dir)
     assert "portfolio" in report
     assert "contracts" in report
+
+
+def test_contract_cache_hits_and_invalidates(tmp_path: Path) -> None:
+    import yaml
+
+    from adl.engine.contracts import ContractCache, load_contract
+
+    contract = tmp_path / "c.yaml"
+    contract.write_text("decision_id: DC-1\nsuccess_criteria: ['p95 < 200ms']\n", encoding="utf-8")
+
+    cold = ContractCache(tmp_path / "cache")
+    first = load_contract(contract, cold)
+    assert first == yaml.safe_load(contract.read_text(encoding="utf-8"))
+    assert cold.stats.to_dict() == {"hits": 0, "misses": 1, "writes": 1}
+
+    warm = ContractCache(tmp_path / "cache")
+    assert load_contract(contract, warm) == first
+    assert warm.stats.to_dict() == {"hits": 1, "misses": 0, "writes": 0}
+
+    contract.write_text("decision_id: DC-2\n", encoding="utf-8")
+    assert load_contract(contract, warm)["decision_id"] == "DC-2"
+    assert warm.stats.misses == 1
+
+
+def test_debt_report_with_cache_matches_uncached(tmp_path: Path) -> None:
+    from adl.engine.contracts import ContractCache
+
+    repo_root = Path(".").resolve()
+    artifacts_dir = repo_root / "artifacts"
+    cache = ContractCache(tmp_path / "cache")
+    plain = compute_debt_report(repo_root=repo_root, artifacts_dir=artifacts_dir)
+    cached = compute_debt_report(repo_root=repo_root, artifacts_dir=artifacts_dir, cache=cache)
+    assert cached == plain
+
+
+def test_debt_index_rescores_only_changed_contracts(tmp_path: Path) -> None:
+    from adl.engine.debt_index import DebtIndex
+
+    contracts = tmp_path / "decisions" / "contracts"
+    contracts.mkdir(parents=True)
+    (contracts / "a.yaml").write_text("decision_id: DC-A\n", encoding="utf-8")
+    (contracts / "b.yaml").write_text("decision_id: DC-B\nsuccess_criteria: ['p95 < 200ms']\n")
+    artifacts = tmp_path / "artifacts"
+    index_path = tmp_path / ".adl-cache" / "debt_index.json"
+
+    # Backdate so the racy-clean check treats the files as older than the index.
+    for p in contracts.iterdir():
+        os.utime(p, ns=(1, 1))
+
+    plain = compute_debt_report(repo_root=tmp_path, artifacts_dir=artifacts)
+    first = DebtIndex(index_path)
+    assert compute_debt_report(tmp_path, artifacts, index=first) == plain
+    assert first.stats.rescored == 2
+
+    warm = DebtIndex(index_path)
+    report = compute_debt_report(tmp_path, artifacts, index=warm)
+    assert warm.stats.to_dict() == {"reused": 2, "rehashed": 0, "rescored": 0, "removed": 0}
+    assert report == plain
+
+    (contracts / "a.yaml").write_text("decision_id: DC-A2\n", encoding="utf-8")
+    (contracts / "b.yaml").unlink()
+    edited = DebtIndex(index_path)
+    report = compute_debt_report(tmp_path, artifacts, index=edited)
+    assert edited.stats.rescored == 1 and edited.stats.removed == 1
+    assert report == compute_debt_report(repo_root=tmp_path, artifacts_dir=artifacts)
+
+
+def test_snapshot_count_tracks_writes(tmp_path: Path) -> None:
+    from adl.artifacts.snapshot import snapshot_count, write_snapshot
+    from adl.engine.types import AdmissibilityResult
+
+    snapshots = tmp_path / "artifacts" / "snapshots"
+    assert snapshot_count(snapshots) == 0
+    snapshots.mkdir(parents=True)
+    (snapshots / "x.snapshot.json").write_text("{}", encoding="utf-8")
+    assert snapshot_count(snapshots) == 1
+
+    result = AdmissibilityResult(
+        decision_id="DC-T", admitted=True, checks=[], changed_paths=[], warnings=[], failures=[]
+    )
+    write_snapshot(out_path=snapshots / "DC-T.snapshot.json", result=result, timestamp="t")
+    assert snapshot_count(snapshots) == 2
+    write_snapshot(out_path=snapshots / "DC-T.snapshot.json", result=result, timestamp="t2")
+    assert snapshot_count(snapshots) == len(list(snapshots.glob("*.json")))
+
+
+def _portfolio_repos(tmp_path: Path) -> list[str]:
+    import shutil
+
+    src = Path(__file__).resolve().parents[1] / "decisions" / "contracts"
+    repos = []
+    for i in range(3):
+        repo = tmp_path / f"r{i}"
+        shutil.copytree(src, repo / "decisions" / "contracts")
+        repos.append(str(repo))
+    (tmp_path / "r1" / "decisions" / "contracts" / "DC-2026-001.yaml").write_text(
+        "decision_id: DC-2026-001\n", encoding="utf-8"
+    )
+    (tmp_path / "empty").mkdir()
+    return [*repos, str(tmp_path / "empty")]
+
+
+def test_portfolio_scan_streams_rows_and_rollups(tmp_path: Path) -> None:
+    import io
+    import json
+
+    from adl.engine.portfolio import NdjsonWriter, scan_portfolio
+
+    repos = _portfolio_repos(tmp_path)
+    out = io.StringIO()
+    summary = scan_portfolio(
+        iter(repos),
+        contracts=NdjsonWriter(out, "contract"),
+        repo_rows=NdjsonWriter(out, "repo"),
+        reasons=NdjsonWriter(out, "reason"),
+        workers=2,
+        use_index=False,
+        use_cache=False,
+    )
+    rows = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert summary.to_dict() == {"repo_count": 4, "failed": 1, "contract_count": 9}
+
+    repo_rows = [r for r in rows if r["kind"] == "repo"]
+    assert [r["repo"] for r in repo_rows] == repos  # input order
+    assert repo_rows[-1]["error"] is not None
+    for row in repo_rows[:-1]:
+        report = compute_debt_report(Path(row["repo"]), Path(row["repo"]) / "artifacts")
+        assert row["avg_debt_score"] == report["portfolio"]["avg_debt_score"]
+        contracts = [r for r in rows if r["kind"] == "contract" and r["repo"] == row["repo"]]
+        assert [c["debt_score"] for c in contracts] == [
+            c["debt_score"] for c in report["contracts"]
+        ]
+
+    reasons = {r["reason"]: r for r in rows if r["kind"] == "reason"}
+    assert reasons["missing_success_criteria"]["repo_count"] == 1
+    assert reasons["missing_signals_considered"]["contract_count"] == 9
+    assert rows[-1]["kind"] == "reason"
+
+
+def test_portfolio_cli_writes_csv_and_per_repo_json(tmp_path: Path) -> None:
+    import csv
+    import json
+
+    from typer.testing import CliRunner
+
+    from adl.cli import app
+
+    repos = _portfolio_repos(tmp_path)[:3]
+    runner = CliRunner()
+    res = runner.invoke(
+        app,
+        [
+            "portfolio",
+            *repos,
+            "--format",
+            "csv",
+            "--out-dir",
+            str(tmp_path / "out"),
+            "--report-dir",
+            str(tmp_path / "reports"),
+            "--no-cache",
+            "--no-index",
+        ],
+    )
+    assert res.exit_code == 0, res.output
+    with (tmp_path / "out" / "repos.csv").open(newline="") as f:
+        assert [r["repo"] for r in csv.DictReader(f)] == repos
+
+    debt = runner.invoke(app, ["debt", "--repo-root", repos[1], "--no-cache", "--no-index"])
+    (kept,) = (tmp_path / "reports").glob("r1-*.debt.json")
+    assert json.loads(kept.read_text()) == json.loads(debt.stdout)
@@ -0,0 +1,208 @@
+import fnmatch
+import io
+import json
+import os
+import random
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from adl.engine.authority import IMPLICIT_ALLOW, compile_authority
+from adl.engine.diff_inspector import (
+    _prefix_match,
+    collect_changed_paths_with_stats,
+    evaluate_boundaries,
+    evaluate_boundaries_streaming,
+)
+from adl.utils.io import write_json
+
+
+def _contract(can_write: list[str], cannot_touch: list[str]) -> dict:
+    return {
+        "constraints": {
+            "bounded_authority": {"can_write_paths": can_write, "cannot_touch": cannot_touch}
+        }
+    }
+
+
+def test_matcher_agrees_with_prefix_match() -> None:
+    can_write = ["src/", "README.md", "a\\b", "pkg//", "/", "x/y/z"]
+    cannot_touch = ["src/secret/", "pkg", ".github/workflows/"]
+    edge = [
+        "",
+        " ",
+        "src",
+        "src/",
+        "srcx/a",
+        "README.md",
+        "README.md/x",
+        "README.mdx",
+        "a/b/c",
+        "a\\b\\c",
+        "pkg/x",
+        "/abs",
+        ".github/workflows/ci.yml",
+        "x/y",
+        "x/y/z/w",
+    ]
+    rng = random.Random(3)
+    parts = ["src", "secret", "pkg", "a", "b", "x", "y", "z", "docs", "", "README.md"]
+    generated = ["/".join(rng.choice(parts) for _ in range(rng.randint(1, 5))) for _ in range(2000)]
+
+    matcher = compile_authority(can_write, cannot_touch, IMPLICIT_ALLOW)
+    allowed = [*can_write, *IMPLICIT_ALLOW]
+    for p in [*edge, *generated]:
+        expected = (_prefix_match(p, cannot_touch), _prefix_match(p, allowed))
+        assert matcher.classify(p) == expected, p
+
+
+def test_evaluate_boundaries_flags_forbidden_and_out_of_bounds() -> None:
+    contract = _contract(["src/"], ["src/secret/"])
+    res = evaluate_boundaries(contract, ["src/ok.py", "src/secret/key", "other/file", "docs/a.md"])
+    status = {c.name: c.status for c in res.checks}
+    assert status["forbidden_paths_untouched"] == "FAIL"
+    assert status["bounded_authority_respected"] == "FAIL"
+    assert "Forbidden paths modified: ['src/secret/key']" in res.failures
+    assert "Out-of-bounds modifications: ['other/file']" in res.failures
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_collect_changed_paths_strategies_and_odd_names(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    repo = tmp_path
+    _git(repo, "init", "-q")
+    (repo / "base.txt").write_text("x", encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-qm", "base")
+
+    odd = "docs/new\nline.md"
+    raw = os.fsdecode(b"docs/caf\xe9.md")
+    (repo / "docs").mkdir()
+    (repo / odd).write_text("a", encoding="utf-8")
+    (repo / raw).write_text("b", encoding="utf-8")
+    _git(repo, "add", "-A")
+
+    paths, stats = collect_changed_paths_with_stats(repo)
+    assert stats.strategy == "staged"
+    assert stats.subprocess_count == 1
+    assert sorted(paths) == sorted([odd, raw])
+
+    _git(repo, "commit", "-qm", "odd names")
+    (repo / "base.txt").write_text("y", encoding="utf-8")
+    paths, stats = collect_changed_paths_with_stats(repo)
+    assert (stats.strategy, paths) == ("working_tree", ["base.txt"])
+
+    _git(repo, "checkout", "-q", "--", "base.txt")
+    paths, stats = collect_changed_paths_with_stats(repo)
+    assert stats.strategy == "last_commit"
+    assert [t.strategy for t in stats.timings] == ["staged", "working_tree", "last_commit"]
+    assert sorted(paths) == sorted([odd, raw])
+
+
+def test_streaming_boundaries_match_list_mode_and_cap_evidence() -> None:
+    contract = _contract(["src/"], ["src/secret/"])
+    paths = [f"src/secret/k{i}" for i in range(5)] + ["other/a", "top.txt", "src/ok.py"]
+
+    full = evaluate_boundaries(contract, paths)
+    streamed, evidence = evaluate_boundaries_streaming(contract, iter(paths), evidence_limit=100)
+    assert streamed == full
+
+    capped, evidence = evaluate_boundaries_streaming(contract, iter(paths), evidence_limit=2)
+    assert [c.status for c in capped.checks] == [c.status for c in full.checks]
+    assert evidence.forbidden_count == 5
+    assert evidence.forbidden_sample == ["src/secret/k0", "src/secret/k1"]
+    assert "(+3 more; 5 total)" in capped.failures[0]
+    d = evidence.to_dict()
+    assert d["changed_path_count"] == 8
+    assert d["directories"]["src/"] == {"changed": 6, "forbidden": 5, "out_of_bounds": 0}
+    assert d["directories"]["./"] == {"changed": 1, "forbidden": 0, "out_of_bounds": 1}
+
+
+def test_write_json_matches_json_dumps() -> None:
+    obj = {"b": [1, {"z": None, "a": "é\udcff"}], "a": True}
+    buf = io.StringIO()
+    write_json(obj, buf)
+    assert buf.getvalue() == json.dumps(obj, indent=2, sort_keys=True)
+
+
+def _glob_reference(path: str, rule: str) -> bool:
+    # Exhaustive backtracking over path components; any matched leading run counts.
+    parts = path.replace("\\", "/").split("/")
+    pats = rule.replace("\\", "/").rstrip("/").split("/")
+
+    def match(i: int, j: int) -> bool:
+        if j == len(pats):
+            return True
+        if pats[j] == "**":
+            return any(match(k, j + 1) for k in range(i, len(parts) + 1))
+        if i == len(parts):
+            return False
+        pat = pats[j]
+        hit = fnmatch.fnmatchcase(parts[i], pat) if "*" in pat or "?" in pat else parts[i] == pat
+        return hit and match(i + 1, j + 1)
+
+    return match(0, 0)
+
+
+def test_glob_rules_match_reference_and_keep_prefix_semantics() -> None:
+    can_write = ["services/*/config/", "docs/**/*.md", "src/[ab]?.py", "lib", "**/generated"]
+    cannot_touch = ["**/secrets/", "services/legacy/"]
+    matcher = compile_authority(can_write, cannot_touch, ())
+
+    assert matcher.classify("services/api/config/app.yml") == (False, True)
+    assert matcher.classify("services/api/config") == (False, True)
+    assert matcher.classify("services/api/other/config/x") == (False, False)
+    assert matcher.classify("services/legacy/config/x") == (True, True)
+    assert matcher.classify("a/b/secrets/key") == (True, False)
+    assert matcher.classify("docs/x/y/z.md") == (False, True)
+    assert matcher.classify("docs/x/y/z.txt") == (False, False)
+    assert matcher.classify("src/a1.py") == (False, True)
+    assert matcher.classify("src/c1.py") == (False, False)
+    assert matcher.classify("libx/a") == (False, False)
+    assert compile_authority(can_write, cannot_touch, ()) is matcher
+
+    rng = random.Random(5)
+    parts = [
+        "services",
+        "api",
+        "legacy",
+        "config",
+        "docs",
+        "x",
+        "a.md",
+        "src",
+        "a1.py",
+        "b2.py",
+        "secrets",
+        "lib",
+        "generated",
+        "",
+    ]
+    for _ in range(3000):
+        p = "/".join(rng.choice(parts) for _ in range(rng.randint(1, 6)))
+        expected = (
+            any(_glob_reference(p, r) for r in cannot_touch),
+            any(_glob_reference(p, r) for r in can_write),
+        )
+        assert matcher.classify(p) == expected, p
+
+
+def test_bracketed_rules_without_wildcards_stay_literal_prefixes() -> None:
+    matcher = compile_authority(["docs/", "app/[id]/"], ["secrets[prod]/"], ())
+    assert matcher.classify("secrets[prod]/key.pem") == (True, False)
+    assert matcher.classify("secretsp/key.pem") == (False, False)
+    assert matcher.classify("app/[id]/page.tsx") == (False, True)
+    assert matcher.classify("app/i/page.tsx") == (False, False)
+    # Next to `*`/`?` the brackets are a character class.
+    assert compile_authority(["v[12]*/"], [], ()).classify("v2beta/x") == (False, True)
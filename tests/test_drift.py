@@ -0,0 +1,139 @@
+import datetime
+import json
+import subprocess
+from pathlib import Path
+
+import yaml
+from typer.testing import CliRunner
+
+from adl.cli import app
+from adl.engine.drift import BlobReader, compute_drift_report, diff_contract
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def _contract(decision_id: str, **overrides: object) -> dict[str, object]:
+    c: dict[str, object] = {
+        "decision_id": decision_id,
+        "title": "t",
+        "owner": {"team": "platform", "approver": "human:@a"},
+        "intent": {"goal": "Collect prices.", "scope": {"includes": ["a"], "excludes": ["x"]}},
+        "constraints": {
+            "bounded_authority": {"can_write_paths": ["docs/"], "cannot_touch": ["secrets/"]}
+        },
+    }
+    c.update(overrides)
+    return c
+
+
+def test_diff_contract_classification() -> None:
+    base = _contract("DC-1")
+    assert diff_contract(base, base) == []
+
+    head = _contract("DC-1", title="renamed")
+    head["intent"] = {"goal": "collect prices", "scope": {"includes": ["a"], "excludes": ["x"]}}
+    assert {(d["field"], d["risk"]) for d in diff_contract(base, head)} == {
+        ("title", "low"),
+        ("intent.goal", "low"),
+    }
+
+    head = _contract("DC-1")
+    head["constraints"] = {
+        "bounded_authority": {"can_write_paths": ["docs/", "scripts/"], "cannot_touch": []},
+        "safety": {"max_orders": 0},
+    }
+    deltas = {d["field"]: d for d in diff_contract(base, head)}
+    assert deltas["constraints.bounded_authority.can_write_paths"]["type"] == "set_expansion"
+    assert deltas["constraints.bounded_authority.can_write_paths"]["risk"] == "medium"
+    assert deltas["constraints.bounded_authority.cannot_touch"]["risk"] == "high"
+    assert deltas["constraints.safety"]["risk"] == "low"  # limit added = tightened
+
+
+def test_compute_drift_report_batches_base_and_head(tmp_path: Path) -> None:
+    repo = tmp_path
+    contracts = repo / "decisions" / "contracts"
+    contracts.mkdir(parents=True)
+    _git(repo, "init", "-q")
+
+    def write(name: str, obj: dict[str, object]) -> None:
+        (contracts / name).write_text(yaml.safe_dump(obj), encoding="utf-8")
+
+    write("DC-A.yaml", _contract("DC-A"))
+    write("DC-B.yaml", _contract("DC-B"))
+    write("DC-C.yaml", _contract("DC-C"))
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+
+    write("DC-A.yaml", _contract("DC-A", owner={"team": "other", "approver": "human:@a"}))
+    (contracts / "DC-B.yaml").unlink()
+    write("DC-D.yaml", _contract("DC-D"))
+    (contracts / "DC-C.yaml").write_text(
+        "# comment only\n" + yaml.safe_dump(_contract("DC-C")), encoding="utf-8"
+    )
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "head")
+
+    report = compute_drift_report(repo, base="HEAD~1", head="HEAD", generated_at="t")
+    by_id = {c["decision_id"]: c for c in report["contracts"]}
+    assert sorted(by_id) == ["DC-A", "DC-B", "DC-C", "DC-D"]
+    assert by_id["DC-A"]["drift"]["level"] == "high"
+    assert by_id["DC-B"]["head_present"] is False
+    assert by_id["DC-C"]["drift"] == {
+        "level": "low",
+        "summary": "No semantic change to tracked fields.",
+        "deltas": [],
+        "guardrails": by_id["DC-C"]["drift"]["guardrails"],
+    }
+    assert by_id["DC-D"]["base_present"] is False
+    new = by_id["DC-D"]["drift"]
+    assert new["level"] == "medium"  # head-only: classified against an empty base
+    assert {d["type"] for d in new["deltas"]} == {"added", "set_expansion"}
+    assert new["summary"].startswith("New contract; medium-risk additions to intent.goal")
+    assert new["guardrails"][0]["status"] == "FAIL"  # write paths granted, no alternatives
+    assert report["rollups"]["high_risk_contracts"] == [
+        {"decision_id": "DC-A", "level": "high", "primary_field": "owner.team"}
+    ]
+
+    again = compute_drift_report(repo, base="HEAD~1", head="HEAD", generated_at="later")
+    assert again["integrity"] == report["integrity"]
+
+    with BlobReader(repo) as reader:
+        blobs = reader.read_many(["HEAD:decisions/contracts/DC-D.yaml", "HEAD:missing.yaml"] * 50)
+    assert blobs[0] is not None and blobs[1] is None
+    assert blobs[0].data == (contracts / "DC-D.yaml").read_bytes()
+
+
+def test_drift_report_with_yaml_date_values_is_json_safe(tmp_path: Path) -> None:
+    repo = tmp_path
+    contracts = repo / "decisions" / "contracts"
+    contracts.mkdir(parents=True)
+    _git(repo, "init", "-q")
+    path = contracts / "DC-A.yaml"
+    path.write_text(yaml.safe_dump(_contract("DC-A")), encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "base")
+    head = _contract("DC-A")
+    head["intent"] = {"goal": datetime.date(2025, 1, 1), "scope": {"includes": ["a"]}}
+    path.write_text(yaml.safe_dump(head), encoding="utf-8")
+    _git(repo, "add", "-A")
+    _git(repo, "commit", "-q", "-m", "head")
+
+    report = compute_drift_report(repo, base="HEAD~1", head="HEAD")
+    goal = next(d for d in report["contracts"][0]["drift"]["deltas"] if d["field"] == "intent.goal")
+    assert goal["head"] == "2025-01-01"
+
+    artifacts = tmp_path / "artifacts"
+    res = CliRunner().invoke(
+        app,
+        ["drift", "--base", "HEAD~1", "--repo-root", str(repo), "--artifacts-dir", str(artifacts)],
+    )
+    assert res.exit_code == 0, res.output
+    written = json.loads((artifacts / "steward" / "contract_drift_report.json").read_text())
+    assert written["integrity"] == report["integrity"]
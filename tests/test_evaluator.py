@@ -0,0 +1,161 @@
+import asyncio
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from adl.engine.batch import _evaluate_in_worker, _init_worker, evaluate_all
+from adl.engine.contracts import ContractCache, list_contracts, load_contract
+from adl.engine.evaluator import evaluate_admissibility, evaluate_admissibility_async
+
+
+def test_evaluate_all_shares_diff_and_keeps_order() -> None:
+    repo_root = Path(".").resolve()
+    contracts = list_contracts(repo_root / "decisions" / "contracts")
+    changed = ["docs/a.md", "adl/cli.py"]
+
+    serial = evaluate_all(repo_root, contracts, strict=True, workers=1, changed_paths=changed)
+    pooled = evaluate_all(repo_root, contracts, strict=True, workers=2, changed_paths=changed)
+
+    assert [p for p, _ in pooled.results] == contracts
+    assert pooled.to_dict() == serial.to_dict()
+    by_id = {r.decision_id: r.admitted for _, r in serial.results}
+    assert by_id["DC-REPO-001"] is True
+    assert by_id["DC-INSTALL-DEMO-001"] is False
+    assert serial.to_dict()["changed_paths"] == changed
+    # Workers send results back without the diff; the parent's one copy is re-attached.
+    assert all(r.changed_paths is changed for _, r in pooled.results)
+    _init_worker(repo_root, changed, True, None, False)
+    assert _evaluate_in_worker(contracts[0])[0].changed_paths == ()
+
+
+@pytest.mark.parametrize("evidence_limit", [None, 1])
+@pytest.mark.parametrize("strict", [True, False])
+def test_async_evaluation_matches_sync(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, strict: bool, evidence_limit: int | None
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    contract_path = Path("decisions/contracts/DC-INSTALL-DEMO-001.yaml").resolve()
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+    (tmp_path / "docs").mkdir()
+    for name in ("docs/a.md", "docs/b.md", "src.py"):
+        (tmp_path / name).write_text("x", encoding="utf-8")
+    subprocess.run([*git, "add", "-A"], cwd=tmp_path, check=True)
+
+    sync = evaluate_admissibility(
+        tmp_path, contract_path, load_contract(contract_path), strict, evidence_limit=evidence_limit
+    )
+    overlapped = asyncio.run(
+        evaluate_admissibility_async(
+            tmp_path, contract_path, strict, cache=ContractCache(), evidence_limit=evidence_limit
+        )
+    )
+    assert overlapped.to_dict() == sync.to_dict()
+    assert not sync.admitted
+
+
+def test_result_cache_hit_skips_checks(tmp_path: Path) -> None:
+    from adl.engine.checks import BUILTIN_CHECKS, Check, CheckContext, CheckOutcome, CheckRegistry
+    from adl.engine.result_cache import ResultCache
+
+    runs: list[str] = []
+
+    def counting(ctx: CheckContext) -> CheckOutcome:
+        runs.append("contract")
+        return CheckOutcome()
+
+    registry = CheckRegistry([*BUILTIN_CHECKS, Check("counting", counting)])
+    contract_path = Path("decisions/contracts/DC-INSTALL-DEMO-001.yaml").resolve()
+    contract = load_contract(contract_path)
+    cache = ResultCache.for_dir(tmp_path / "results")
+
+    def run(changed: list[str], strict: bool = True) -> dict[str, object]:
+        result = asyncio.run(
+            evaluate_admissibility_async(
+                Path("."),
+                contract_path,
+                strict,
+                contract=contract,
+                changed_paths=changed,
+                registry=registry,
+                result_cache=cache,
+            )
+        )
+        return result.to_dict()
+
+    first = run(["docs/a.md", "src.py"])
+    assert run(["docs/a.md", "src.py"]) == first
+    assert len(runs) == 1 and cache.stats.hits == 1
+    run(["docs/a.md"])
+    run(["docs/a.md", "src.py"], strict=False)
+    assert len(runs) == 3 and cache.stats.writes == 3
+
+    sync = evaluate_admissibility(
+        Path("."),
+        contract_path,
+        contract,
+        True,
+        changed_paths=["docs/a.md", "src.py"],
+        registry=registry,
+        result_cache=cache,
+    )
+    assert sync.to_dict() == first and len(runs) == 3
+
+
+def test_result_cache_directory_evicts_least_recently_used(tmp_path: Path) -> None:
+    import os
+
+    from adl.engine.result_cache import DirectoryBackend
+
+    backend = DirectoryBackend(tmp_path, max_bytes=250)
+    for i, key in enumerate(("aa01", "bb02", "cc03")):
+        backend.put(key, b"x" * 100)
+        os.utime(backend._path(key), ns=(i * 10**9, i * 10**9))
+    # Only two entries fit; the oldest one is gone, and a read refreshes an entry.
+    assert backend.get("aa01") is None
+    assert backend.get("bb02") is not None
+    backend.put("dd04", b"x" * 100)
+    assert backend.get("cc03") is None
+    assert backend.get("bb02") is not None and backend.get("dd04") is not None
+
+
+def test_result_cache_miss_still_overlaps_checks_with_git(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import threading
+
+    from adl.engine import evaluator
+    from adl.engine.checks import BUILTIN_CHECKS, Check, CheckContext, CheckOutcome, CheckRegistry
+    from adl.engine.result_cache import ResultCache
+
+    checked = threading.Event()
+    overlapped: list[bool] = []
+
+    def signal(ctx: CheckContext) -> CheckOutcome:
+        checked.set()
+        return CheckOutcome()
+
+    def slow_diff(repo_root: Path, profiler: object = None) -> list[str]:
+        # Stands in for git: finishes only once the contract checks have run.
+        overlapped.append(checked.wait(timeout=5))
+        return ["docs/a.md", "src.py"]
+
+    monkeypatch.setattr(evaluator, "collect_changed_paths", slow_diff)
+    registry = CheckRegistry([*BUILTIN_CHECKS, Check("signal", signal)])
+    contract_path = Path("decisions/contracts/DC-INSTALL-DEMO-001.yaml").resolve()
+    cache = ResultCache.for_dir(tmp_path / "results")
+
+    def run() -> dict[str, object]:
+        checked.clear()
+        result = asyncio.run(
+            evaluate_admissibility_async(
+                Path("."), contract_path, True, registry=registry, result_cache=cache
+            )
+        )
+        return result.to_dict()
+
+    first = run()
+    assert run() == first
+    assert overlapped == [True, True]
+    assert (cache.stats.hits, cache.stats.writes) == (1, 1)
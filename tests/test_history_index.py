@@ -0,0 +1,152 @@
+import json
+import os
+import shutil
+import subprocess
+from pathlib import Path
+from typing import Any
+
+import pytest
+from typer.testing import CliRunner
+
+from adl.artifacts.cas import CasStore
+from adl.artifacts.history_index import HistoryIndex
+from adl.artifacts.ledger import Ledger
+from adl.artifacts.snapshot import FRONT_CODED_KEY
+from adl.cli import app
+from adl.engine.pathtable import front_code
+
+
+def _rec(decision_id: str, second: int, admitted: bool, paths: list[str]) -> dict[str, Any]:
+    return {
+        "decision_id": decision_id,
+        "timestamp": f"2026-01-01T00:00:{second:02d}+00:00",
+        "admitted": admitted,
+        "checks": [{"name": "bounded_authority_respected", "status": "PASS", "detail": "ok"}]
+        if admitted
+        else [{"name": "bounded_authority_respected", "status": "FAIL", "detail": "no"}],
+        "warnings": [],
+        "failures": [] if admitted else [f"Out-of-bounds modifications: {paths}"],
+        "changed_paths": paths,
+        "schema_version": "v0.1",
+    }
+
+
+def test_index_syncs_incrementally_from_every_store(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    ledger = Ledger.for_artifacts(artifacts)
+    cas = CasStore.for_artifacts(artifacts, codec="gzip")
+    ledger.append(_rec("DC-A", 1, True, ["docs/a.md"]))
+    cas.put(_rec("DC-A", 2, False, ["trading/engine.py", "docs/a.md"]))
+    cas.put(_rec("DC-A", 3, False, ["trading/engine.py", "docs/a.md"]))  # same body
+    compact = _rec("DC-B", 4, False, ["trading/risk.py"])
+    compact[FRONT_CODED_KEY] = front_code(compact.pop("changed_paths"))
+    (artifacts / "snapshots").mkdir()
+    (artifacts / "snapshots" / "DC-B.snapshot.json").write_text(json.dumps(compact))
+
+    with HistoryIndex.for_artifacts(artifacts) as index:
+        assert index.sync(artifacts) == 4
+        assert index.sync(artifacts) == 0
+        ledger.append(_rec("DC-A", 5, True, ["docs/b.md"]))
+        assert index.sync(artifacts) == 1
+
+        rejected = list(index.runs(status="rejected", path_prefix="trading/"))
+        assert [(r["decision_id"], r["source"]) for r in rejected] == [
+            ("DC-A", "cas"),
+            ("DC-A", "cas"),
+            ("DC-B", "file"),
+        ]
+        assert rejected[2]["failures"] == ["Out-of-bounds modifications: ['trading/risk.py']"]
+        assert list(index.runs(path_prefix="trading/r")) == rejected[2:]
+        assert list(index.runs(path_prefix="tradinG")) == []
+
+        flips = [(f["from"], f["to"], f["timestamp"][-8:-6]) for f in index.flips()]
+        assert flips == [("admitted", "rejected", "02"), ("rejected", "admitted", "05")]
+        assert [f["to"] for f in index.flips(to_status="rejected")] == ["rejected"]
+
+        counts = list(index.check_counts(status="FAIL"))
+        assert counts == [{"name": "bounded_authority_respected", "status": "FAIL", "runs": 3}]
+        assert index.reindex(artifacts) == 5
+
+
+def test_snapshot_writes_are_indexed_for_query(tmp_path: Path) -> None:
+    repo = Path(__file__).resolve().parents[1]
+    contract = repo / "decisions" / "contracts" / "DC-2026-001.yaml"
+    artifacts = tmp_path / "artifacts"
+    runner = CliRunner()
+    for store in ("file", "ledger", "cas"):
+        res = runner.invoke(
+            app,
+            [
+                "record",
+                "--contract",
+                str(contract),
+                "--repo-root",
+                str(repo),
+                "--artifacts-dir",
+                str(artifacts),
+                "--store",
+                store,
+                "--non-strict",
+                "--no-cache",
+            ],
+        )
+        assert res.exit_code in (0, 1), res.output
+
+    with HistoryIndex.for_artifacts(artifacts) as index:
+        assert index.run_count() == 3  # indexed at write time
+
+    res = runner.invoke(app, ["query", "runs", "--artifacts-dir", str(artifacts)])
+    assert res.exit_code == 0
+    runs = [json.loads(line) for line in res.stdout.splitlines()]
+    assert sorted(r["source"] for r in runs) == ["cas", "file", "ledger"]
+    assert {r["decision_id"] for r in runs} == {"DC-2026-001"}
+
+
+def test_non_utf8_paths_are_indexed_and_queryable(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    repo = tmp_path / "repo"
+    contracts = Path(__file__).resolve().parents[1] / "decisions" / "contracts"
+    shutil.copytree(contracts, repo / "decisions" / "contracts")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=repo, check=True)
+    subprocess.run([*git, "add", "-A"], cwd=repo, check=True)
+    subprocess.run([*git, "commit", "-qm", "base"], cwd=repo, check=True)
+    (repo / "docs").mkdir()
+    with open(os.path.join(os.fsencode(repo), b"docs", b"bad\xff.txt"), "wb") as f:
+        f.write(b"x")
+    subprocess.run([*git, "add", "-A"], cwd=repo, check=True)
+
+    artifacts = tmp_path / "artifacts"
+    runner = CliRunner()
+    for store in ("file", "ledger", "cas"):
+        res = runner.invoke(
+            app,
+            [
+                "record",
+                "--contract",
+                str(repo / "decisions" / "contracts" / "DC-2026-001.yaml"),
+                "--repo-root",
+                str(repo),
+                "--artifacts-dir",
+                str(artifacts),
+                "--store",
+                store,
+                "--no-cache",
+            ],
+        )
+        assert res.exit_code == 0, res.output
+        assert json.loads(res.stdout)["admitted"] is True
+
+    bad = os.fsdecode(b"docs/bad\xff.txt")
+    with HistoryIndex.for_artifacts(artifacts) as index:
+        assert index.run_count() == 3
+        assert len(list(index.runs(path_prefix=bad))) == 3
+        assert len(list(index.runs(path_prefix="docs/bad"))) == 3
+        assert list(index.runs(path_prefix="docs/good")) == []
+        assert index.reindex(artifacts) == 3
+
+    res = runner.invoke(app, ["query", "runs", "--artifacts-dir", str(artifacts)])
+    assert res.exit_code == 0
+    assert len(res.stdout.splitlines()) == 3
@@ -0,0 +1,22 @@
+import pytest
+
+from adl.utils.importtime import STARTUP_BUDGET, Budget, evaluate_budget, parse_importtime
+
+
+def test_parse_importtime_reads_depth_and_timings() -> None:
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   adl.utils\n"
+        "import time:       774 |        894 | adl.utils.io\n"
+    )
+    recs = parse_importtime(stderr)
+    assert [(r.module, r.self_us, r.cumulative_us, r.depth) for r in recs] == [
+        ("adl.utils", 120, 120, 1),
+        ("adl.utils.io", 774, 894, 0),
+    ]
+
+
+@pytest.mark.parametrize("budget", STARTUP_BUDGET, ids=lambda b: b.name)
+def test_cold_start_budget(budget: Budget) -> None:
+    report = evaluate_budget(budget, runs=3)
+    assert report["violations"] == []
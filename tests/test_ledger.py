@@ -0,0 +1,177 @@
+import gzip
+import json
+import multiprocessing
+from pathlib import Path
+
+import pytest
+
+from adl.artifacts.ledger import Ledger
+
+
+def _rec(decision_id: str, ts: str, n: int = 0) -> dict[str, object]:
+    return {"decision_id": decision_id, "timestamp": ts, "admitted": True, "n": n}
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_ledger_appends_rotates_and_seeks(tmp_path: Path, compress: bool) -> None:
+    ledger = Ledger(tmp_path / "ledger", max_segment_bytes=200, compress=compress)
+    written = [
+        _rec("DC-A" if i % 2 else "DC-B", f"2026-01-01T00:00:{i:02d}+00:00", i) for i in range(12)
+    ]
+    for r in written:
+        ledger.append(r)
+
+    assert len(ledger.segments()) > 1
+    assert list(ledger.history()) == written
+    assert [r["n"] for r in ledger.history("DC-A")] == [1, 3, 5, 7, 9, 11]
+    window = ledger.history(since="2026-01-01T00:00:04+00:00", until="2026-01-01T00:00:06+00:00")
+    assert [r["n"] for r in window] == [4, 5, 6]
+
+    if compress:
+        # Concatenated gzip members still form one valid .gz file.
+        seg = ledger.root / ledger.segments()[0]
+        lines = gzip.decompress(seg.read_bytes()).splitlines()
+        assert json.loads(lines[0]) == written[0]
+
+
+def test_ledger_truncates_uncommitted_bytes(tmp_path: Path) -> None:
+    ledger = Ledger(tmp_path / "ledger")
+    ledger.append(_rec("DC-A", "t1"))
+
+    # A writer that died after writing its record but before its index line,
+    # plus a torn index line.
+    seg = ledger.root / ledger.segments()[-1]
+    with seg.open("ab") as f:
+        f.write(b'{"decision_id":"DC-X","timest')
+    with ledger.index_path.open("ab") as f:
+        f.write(b'{"decision_id": "DC-X"')
+
+    assert [r["decision_id"] for r in ledger.history()] == ["DC-A"]
+    ledger.append(_rec("DC-B", "t2"))
+    assert [r["decision_id"] for r in ledger.history()] == ["DC-A", "DC-B"]
+    assert seg.read_bytes().count(b"\n") == 2
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_ledger_rebuilds_a_lost_index_without_dropping_records(
+    tmp_path: Path, compress: bool
+) -> None:
+    ledger = Ledger(tmp_path / "ledger", max_segment_bytes=150, compress=compress)
+    for i in range(3):
+        ledger.append(_rec("DC-A", f"t{i}", i))
+    assert len(ledger.segments()) > 1
+
+    ledger.index_path.unlink()
+    ledger.append(_rec("DC-B", "t3", 3))
+    assert [r["n"] for r in ledger.history()] == [0, 1, 2, 3]
+
+    # Index lost its tail: the complete record past it is re-indexed, the torn one dropped.
+    lines = ledger.index_path.read_bytes().splitlines(keepends=True)
+    ledger.index_path.write_bytes(b"".join(lines[:-1]))
+    seg = ledger.root / ledger.segments()[-1]
+    with seg.open("ab") as f:
+        f.write(gzip.compress(b'{"decision_id":', mtime=0)[:-4] if compress else b'{"decision')
+    ledger.append(_rec("DC-B", "t4", 4))
+    assert [r["n"] for r in ledger.history()] == [0, 1, 2, 3, 4]
+    assert [r["n"] for r in ledger.history("DC-B")] == [3, 4]
+
+
+def _append_many(root: str, worker: int) -> None:
+    ledger = Ledger(Path(root), max_segment_bytes=1024)
+    for i in range(25):
+        ledger.append(_rec(f"DC-{worker}", f"t{i:03d}", i))
+
+
+def test_ledger_concurrent_writers(tmp_path: Path) -> None:
+    root = tmp_path / "ledger"
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=_append_many, args=(str(root), w)) for w in range(4)]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=60)
+        assert p.exitcode == 0
+
+    ledger = Ledger(root)
+    assert ledger.count() == 100
+    for w in range(4):
+        assert [r["n"] for r in ledger.history(f"DC-{w}")] == list(range(25))
+
+
+@pytest.mark.parametrize("codec", ["none", "gzip", "lzma"])
+def test_cas_stores_identical_bodies_once(tmp_path: Path, codec: str) -> None:
+    from adl.artifacts.cas import CasStore
+
+    cas = CasStore(tmp_path / "cas", codec=codec)
+    written = [
+        _rec("DC-A", "2026-01-01T00:00:01+00:00"),
+        _rec("DC-A", "2026-01-01T00:00:02+00:00"),  # re-run, same verdict
+        _rec("DC-B", "2026-01-01T00:00:03+00:00", 1),
+        _rec("DC-A", "2026-01-01T00:00:04+00:00"),
+    ]
+    created = [cas.put(r)[1] for r in written]
+
+    assert created == [True, False, True, False]
+    assert cas.object_count() == 2
+    assert list(cas.history()) == written
+    assert [r["timestamp"] for r in cas.history("DC-A", since="2026-01-01T00:00:02+00:00")] == [
+        "2026-01-01T00:00:02+00:00",
+        "2026-01-01T00:00:04+00:00",
+    ]
+
+    # Another codec reuses the stored object instead of writing a second copy.
+    other = CasStore(cas.root, codec="none" if codec != "none" else "gzip")
+    assert other.put(_rec("DC-B", "2026-01-01T00:00:05+00:00", 1))[1] is False
+    assert cas.object_count() == 2
+
+
+def test_cas_keeps_profiles_on_the_ref_and_syncs_objects_first(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+    import sys
+
+    from adl.artifacts.cas import CasStore
+
+    synced: list[str] = []
+    real_fsync = os.fsync
+
+    def fsync(fd: int) -> None:
+        if sys.platform.startswith("linux"):
+            synced.append(os.readlink(f"/proc/self/fd/{fd}"))
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    cas = CasStore(tmp_path / "cas")
+    profiled = [
+        {**_rec("DC-A", f"2026-01-01T00:00:0{i}+00:00"), "profile": {"total_ms": i}}
+        for i in range(3)
+    ]
+    assert [cas.put(r)[1] for r in profiled] == [True, False, False]
+    assert cas.object_count() == 1
+    assert list(cas.history()) == profiled
+    assert b"profile" not in next((cas.root / "objects").glob("*/*.json")).read_bytes()
+
+    if synced:
+        # Object data, its shard dir and objects/ are durable before the first ref line.
+        before_ref = [Path(p).name for p in synced[: synced.index(str(cas.refs_path))]]
+        assert before_ref[0].endswith(".tmp")
+        assert before_ref[1:] == [next((cas.root / "objects").iterdir()).name, "objects"]
+
+
+def test_history_merges_ledger_and_cas(tmp_path: Path) -> None:
+    from typer.testing import CliRunner
+
+    from adl.artifacts.cas import CasStore
+    from adl.cli import app
+
+    artifacts = tmp_path / "artifacts"
+    Ledger.for_artifacts(artifacts).append(_rec("DC-A", "2026-01-01T00:00:02+00:00"))
+    cas = CasStore.for_artifacts(artifacts, codec="gzip")
+    cas.put(_rec("DC-A", "2026-01-01T00:00:01+00:00"))
+    cas.put(_rec("DC-A", "2026-01-01T00:00:03+00:00"))
+
+    res = CliRunner().invoke(app, ["history", "--artifacts-dir", str(artifacts)])
+    assert res.exit_code == 0
+    stamps = [json.loads(line)["timestamp"] for line in res.stdout.splitlines()]
+    assert stamps == [f"2026-01-01T00:00:0{i}+00:00" for i in (1, 2, 3)]
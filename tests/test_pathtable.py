@@ -0,0 +1,47 @@
+import json
+import pickle
+from pathlib import Path
+
+from adl.engine.pathtable import PathTable, front_code, front_decode
+from adl.engine.types import AdmissibilityResult, CheckResult, CheckStatus
+
+ODD = ["a/b\udcff", "é/ü.md", "top", "dir/", "", "a/b/c", "a/b/c.txt", "a/bc"]
+
+
+def test_path_table_reads_like_a_list() -> None:
+    paths = [f"src/pkg{i % 3}/mod{i}.py" for i in range(10_000)] + ODD
+    table = PathTable(paths)
+
+    assert table == paths and list(table) == paths
+    assert len(table) == len(paths) and table.directory_count < 20
+    assert table[0] == paths[0] and table[-1] == paths[-1] and table[5:9] == paths[5:9]
+    assert pickle.loads(pickle.dumps(table)) == table
+    assert list(front_decode(front_code(table))) == paths
+    assert json.loads(json.dumps(front_code(paths))) == front_code(paths)
+
+
+def test_compact_results_keep_json_output() -> None:
+    paths = ["docs/a.md", "docs/b.md", "src/x.py"]
+    checks = [CheckResult("diff_detected", "PASS", "3 changed paths detected.")]  # type: ignore[arg-type]
+    compact = AdmissibilityResult("DC-X", True, checks, PathTable(paths), [], [])
+    plain = AdmissibilityResult("DC-X", True, checks, paths, [], [])
+
+    assert checks[0].status is CheckStatus.PASS
+    assert json.dumps(compact.to_dict()) == json.dumps(plain.to_dict())
+    assert AdmissibilityResult.from_dict(compact.to_dict()) == plain
+
+
+def test_front_coded_snapshots_decode_transparently(tmp_path: Path) -> None:
+    from adl.artifacts.snapshot import expand_snapshot, snapshot_changed_paths, write_snapshot
+
+    paths = [f"services/api/src/main/java/Handler{i}.java" for i in range(50)]
+    result = AdmissibilityResult("DC-X", True, [], PathTable(paths), [], [])
+    write_snapshot(tmp_path / "plain.json", result, "t")
+    write_snapshot(tmp_path / "compact.json", result, "t", compact_paths=True)
+
+    plain = json.loads((tmp_path / "plain.json").read_bytes())
+    compact = json.loads((tmp_path / "compact.json").read_bytes())
+    assert "changed_paths" not in compact
+    assert snapshot_changed_paths(compact) == snapshot_changed_paths(plain) == paths
+    assert expand_snapshot(compact) == plain
+    assert (tmp_path / "compact.json").stat().st_size < (tmp_path / "plain.json").stat().st_size
@@ -0,0 +1,82 @@
+import json
+import random
+from pathlib import Path
+
+from adl.artifacts.ledger import Ledger
+from adl.engine.pressure import aggregate, boundary_hits, build_report
+from adl.utils.sketch import SpaceSaving
+
+
+def test_space_saving_keeps_heavy_hitters_and_merges() -> None:
+    rng = random.Random(7)
+    stream = ["hot"] * 300 + ["warm"] * 120 + [f"cold{rng.randint(0, 5000)}" for _ in range(600)]
+    rng.shuffle(stream)
+
+    left: SpaceSaving[str] = SpaceSaving(20)
+    right: SpaceSaving[str] = SpaceSaving(20)
+    left.update(stream[:500])
+    right.update(stream[500:])
+    merged = left.merge(right)
+
+    top = {k: (c, e) for k, c, e in merged.top(2)}
+    assert set(top) == {"hot", "warm"}
+    assert top["hot"][0] - top["hot"][1] <= 300 <= top["hot"][0]
+    assert merged.total == len(stream)
+
+    exact: SpaceSaving[str] = SpaceSaving(10)
+    exact.update("abcabca")
+    assert exact.top() == [("a", 3, 0), ("b", 2, 0), ("c", 2, 0)]
+
+
+def test_boundary_hits_prefers_evidence_and_parses_failures() -> None:
+    legacy = {
+        "failures": [
+            "Forbidden paths modified: ['secrets/k', \"it's.txt\"]",
+            "Out-of-bounds modifications: ['src/a.py'] (+2 more; 3 total)",
+        ]
+    }
+    assert boundary_hits(legacy) == (["secrets/k", "it's.txt"], 2, ["src/a.py"], 3)
+
+    streamed = dict(
+        legacy,
+        evidence={
+            "forbidden_count": 0,
+            "forbidden_sample": [],
+            "out_of_bounds_count": 9,
+            "out_of_bounds_sample": ["x/y"],
+        },
+    )
+    assert boundary_hits(streamed) == ([], 0, ["x/y"], 9)
+
+
+def test_pressure_aggregate_parallel_matches_serial(tmp_path: Path) -> None:
+    artifacts = tmp_path / "artifacts"
+    snapshots = artifacts / "snapshots"
+    snapshots.mkdir(parents=True)
+    ledger = Ledger.for_artifacts(artifacts)
+    for i in range(40):
+        oob = [f"src/m{i % 3}.py"] if i % 2 else []
+        record = {
+            "decision_id": "DC-1" if i % 4 else "DC-2",
+            "timestamp": f"2026-01-01T00:00:{i:02d}+00:00",
+            "admitted": not oob,
+            "changed_paths": ["docs/x.md", *oob],
+            "failures": [f"Out-of-bounds modifications: {oob}"] if oob else [],
+        }
+        if i < 10:
+            (snapshots / f"{i}.snapshot.json").write_text(json.dumps(record), encoding="utf-8")
+        else:
+            ledger.append(record)
+
+    authority = {"DC-1": ["docs/", "scripts/"], "DC-2": ["."]}
+    serial = build_report(aggregate(artifacts, authority, top_k=5, workers=1, chunk_size=7))
+    parallel = build_report(aggregate(artifacts, authority, top_k=5, workers=2, chunk_size=7))
+    assert parallel == serial
+
+    assert serial["runs"]["total"] == 40
+    assert serial["runs"]["blocked"] == 20
+    assert sum(r["count"] for r in serial["out_of_bounds_paths"]) == 20
+    assert [c["decision_id"] for c in serial["under_permissive_contracts"]] == ["DC-1"]
+    over = {c["decision_id"]: c for c in serial["over_permissive_contracts"]}
+    assert over["DC-1"]["unused_can_write_paths"] == ["scripts/"]
+    assert "can_write_paths grants the whole repository" in over["DC-2"]["reasons"]
@@ -0,0 +1,56 @@
+from pathlib import Path
+
+from adl.engine.contracts import load_contract
+from adl.engine.evaluator import evaluate_admissibility
+from adl.utils.profiling import NULL_PROFILER, Profiler, Span, add_span_hook, remove_span_hook
+
+
+def test_profiler_nests_spans_and_calls_hooks() -> None:
+    seen: list[str] = []
+    global_seen: list[Span] = []
+    profiler = Profiler(hooks=[lambda s: seen.append(s.name)])
+    add_span_hook(global_seen.append)
+    try:
+        with profiler.span("outer", kind="test") as attrs:
+            with profiler.span("inner"):
+                profiler.count("items", 3)
+            attrs["done"] = True
+    finally:
+        remove_span_hook(global_seen.append)
+
+    assert seen == ["inner", "outer"]
+    assert [s.name for s in global_seen] == ["inner", "outer"]
+    d = profiler.to_dict()
+    assert [(s["name"], s["parent"], s["depth"]) for s in d["spans"]] == [
+        ("outer", None, 0),
+        ("inner", "outer", 1),
+    ]
+    assert d["spans"][0]["attrs"] == {"kind": "test", "done": True}
+    assert d["counters"] == {"items": 3}
+
+    with NULL_PROFILER.span("ignored") as attrs:
+        attrs["x"] = 1
+    assert NULL_PROFILER.to_dict() == {} and not NULL_PROFILER.spans
+
+
+def test_evaluate_admissibility_profile_is_additive() -> None:
+    repo_root = Path(".").resolve()
+    contract_path = repo_root / "decisions" / "contracts" / "DC-REPO-001.yaml"
+    contract = load_contract(contract_path)
+    changed = ["docs/a.md", "adl/cli.py"]
+
+    plain = evaluate_admissibility(repo_root, contract_path, contract, True, changed)
+    assert plain.profile is None and "profile" not in plain.to_dict()
+
+    profiled = evaluate_admissibility(
+        repo_root, contract_path, contract, True, changed, profiler=Profiler()
+    )
+    assert profiled.profile is not None
+    assert [s["name"] for s in profiled.profile["spans"]] == [
+        "schema_validation",
+        "boundary_matching",
+    ]
+    assert profiled.profile["spans"][1]["attrs"] == {"path_count": 2}
+    d = profiled.to_dict()
+    d.pop("profile")
+    assert d == plain.to_dict()
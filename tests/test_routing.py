@@ -0,0 +1,90 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from adl.cli import app
+from adl.engine.contracts import load_yaml_file
+from adl.engine.routing import DEFAULT_ROUTES, RouteTable, load_route_table
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+@pytest.mark.parametrize(
+    ("changed", "route"),
+    [
+        ([], "fallback_maintenance_no_diff"),
+        (["adl/cli.py"], "maintenance"),
+        (["src/x.py", "README.md"], "maintenance"),
+        (["docs/a.md", "artifacts/x.json"], "maintenance"),
+        (["artifacts/x.json", "artifacts\\y.json"], "install_demo"),
+        (["artifacts/x.json", "src/y.py"], "example_demo_fallback"),
+        (["README.mdx", "adlx/y.py"], "example_demo_fallback"),
+    ],
+)
+def test_default_route_table(changed: list[str], route: str) -> None:
+    table = RouteTable.from_config(DEFAULT_ROUTES)
+    assert table.route(changed).route == route
+    assert table.route(iter(changed), explicit="c.yaml").to_dict() == {
+        "route": "explicit",
+        "contract": "c.yaml",
+        "changed_path_count": len(changed),
+    }
+
+
+def test_repo_route_table_matches_builtin_and_overrides() -> None:
+    assert load_yaml_file(REPO / "decisions" / "routes.yaml") == {"routes": DEFAULT_ROUTES}
+
+    table = load_route_table(REPO).with_contracts({"install_demo": "x.yaml"})
+    assert table.route(["artifacts/a"]).contract == "x.yaml"
+    with pytest.raises(ValueError, match="nope"):
+        table.with_contracts({"nope": "y.yaml"})
+    with pytest.raises(ValueError, match="needs paths"):
+        RouteTable.from_config({"routes": [{"name": "a", "contract": "c", "match": "all"}]})
+
+
+def test_gate_routes_and_records_on_one_diff(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    shutil.copytree(REPO / "decisions" / "contracts", tmp_path / "decisions" / "contracts")
+    (tmp_path / "decisions" / "routes.yaml").write_text(
+        "routes:\n"
+        "  - {name: docs, match: all, paths: [docs/], "
+        "contract: decisions/contracts/DC-INSTALL-DEMO-001.yaml}\n"
+        "  - {name: other, match: always, contract: decisions/contracts/DC-2026-001.yaml}\n",
+        encoding="utf-8",
+    )
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-qm", "base")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text("a", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+
+    output = tmp_path / "gh_output"
+    monkeypatch.setenv("GITHUB_OUTPUT", str(output))
+    res = CliRunner().invoke(
+        app, ["gate", "--repo-root", str(tmp_path), "--github-output", "--no-cache"]
+    )
+    assert res.exit_code == 0, res.output
+    out = json.loads(res.stdout)
+    assert out["route"]["route"] == "docs"
+    assert out["decision_id"] == "DC-INSTALL-DEMO-001"
+    assert out["changed_paths"] == ["docs/a.md"]
+    assert (tmp_path / "artifacts" / "snapshots" / "DC-INSTALL-DEMO-001.snapshot.json").exists()
+    assert output.read_text(encoding="utf-8") == (
+        "route=docs\ncontract=decisions/contracts/DC-INSTALL-DEMO-001.yaml\n"
+    )
@@ -21,3 +21,32 @@ def test_contract_schema_accepts_example() -> None:
     )
     assert res.decision_id.startswith("DC-")
     assert isinstance(res.checks, list)
+
+
+def test_compiled_schema_is_cached_and_invalidated_on_change(tmp_path: Path) -> None:
+    from adl.engine.validation import get_compiled_schema
+
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text('{"type": "object", "required": ["a"]}', encoding="utf-8")
+    first = get_compiled_schema(schema_path)
+    assert get_compiled_schema(schema_path) is first
+    assert first.error_messages({"a": 1}) == []
+    assert first.error_messages({}) == ["<root>: 'a' is a required property"]
+
+    schema_path.write_text('{"type": "object", "required": ["a", "bb"]}', encoding="utf-8")
+    second = get_compiled_schema(schema_path)
+    assert second is not first
+    assert second.sha256 != first.sha256
+    assert not second.is_valid({"a": 1})
+
+
+def test_bundled_schema_fast_path_agrees_with_jsonschema() -> None:
+    from adl.engine.validation import get_compiled_schema
+
+    compiled = get_compiled_schema()
+    repo_root = Path(".").resolve()
+    samples: list[object] = [{}, {"decision_id": 1}, []]
+    for p in sorted((repo_root / "decisions" / "contracts").glob("*.yaml")):
+        samples.append(yaml.safe_load(p.read_text(encoding="utf-8")))
+    for s in samples:
+        assert compiled.is_valid(s) == compiled.validator.is_valid(s)
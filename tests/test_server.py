@@ -0,0 +1,79 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from adl.client import request
+from adl.server import AdlServer
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="Unix domain sockets")
+
+
+def test_served_check_is_byte_identical_to_cli(tmp_path: Path) -> None:
+    argv = ["check", "--contract", "decisions/contracts/DC-INSTALL-DEMO-001.yaml", "--no-cache"]
+    direct = subprocess.run(
+        [sys.executable, "-m", "adl.cli", *argv], capture_output=True, text=True, check=False
+    )
+
+    sock = tmp_path / "adl.sock"
+    server = AdlServer(sock, idle_timeout=1.0)
+    thread = threading.Thread(target=server.serve_until_idle, daemon=True)
+    thread.start()
+
+    served = request(argv, str(sock))
+
+    assert served is not None
+    assert served["stdout"] == direct.stdout
+    assert served["exit_code"] == direct.returncode
+
+    # Usage errors are declined so the client reproduces them in-process.
+    assert request(["check", "--bogus"], str(sock)) is None
+    assert sock.exists()
+
+    thread.join(timeout=5)
+    assert not sock.exists()
+
+
+def test_served_check_uses_the_client_adl_environment(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # The server is a separate process that does not have the variable set.
+    server_env = {k: v for k, v in os.environ.items() if not k.startswith("ADL_")}
+    sock = tmp_path / "adl.sock"
+    server = subprocess.Popen(
+        [sys.executable, "-m", "adl.cli", "serve", "--socket", str(sock), "--idle-timeout", "5"],
+        env=server_env,
+        stdout=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 30
+        while not sock.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+        argv = ["check", "--contract", "decisions/contracts/DC-INSTALL-DEMO-001.yaml", "--no-cache"]
+        direct_cache = tmp_path / "direct-results"
+        direct = subprocess.run(
+            [sys.executable, "-m", "adl.cli", *argv],
+            capture_output=True,
+            text=True,
+            check=False,
+            env={**server_env, "ADL_RESULT_CACHE_DIR": str(direct_cache)},
+        )
+        served_cache = tmp_path / "served-results"
+        monkeypatch.setenv("ADL_RESULT_CACHE_DIR", str(served_cache))
+        served = request(argv, str(sock))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+    assert served is not None
+    assert served["stdout"] == direct.stdout
+    assert served["exit_code"] == direct.returncode
+    assert sorted(p.name for p in served_cache.rglob("*") if p.is_file()) == sorted(
+        p.name for p in direct_cache.rglob("*") if p.is_file()
+    )
+    assert any(served_cache.rglob("*"))
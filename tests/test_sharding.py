@@ -0,0 +1,96 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from adl.cli import app
+
+REPO = Path(__file__).resolve().parents[1]
+
+
+def _repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    shutil.copytree(REPO / "decisions" / "contracts", repo / "decisions" / "contracts")
+    git = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+    subprocess.run([*git, "init", "-q"], cwd=repo, check=True)
+    subprocess.run([*git, "add", "-A"], cwd=repo, check=True)
+    subprocess.run([*git, "commit", "-qm", "base"], cwd=repo, check=True)
+    for i in range(60):
+        top = ("docs", "src", "secrets", "examples")[i % 4]
+        p = repo / top / f"d{i % 7}" / f"f{i}.txt"
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x", encoding="utf-8")
+    subprocess.run([*git, "add", "-A"], cwd=repo, check=True)
+    return repo
+
+
+def _without_timestamp(text: str) -> str:
+    return "\n".join(line for line in text.splitlines() if "imestamp" not in line)
+
+
+def test_merged_shards_match_single_node_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    repo = _repo(tmp_path)
+    runner = CliRunner()
+    contract = str(repo / "decisions" / "contracts" / "DC-2026-001.yaml")
+    base = ["--repo-root", str(repo), "--contract", contract, "--no-cache"]
+
+    single = runner.invoke(app, ["record", *base, "--artifacts-dir", str(tmp_path / "single")])
+    assert single.exit_code == 1
+
+    sharded = tmp_path / "sharded"
+    owned = 0
+    for i in (1, 2, 3):
+        res = runner.invoke(
+            app, ["record", *base, "--artifacts-dir", str(sharded), "--shard", f"{i}/3"]
+        )
+        owned += len(json.loads(res.stdout)["paths"])
+    assert owned == 60
+
+    incomplete = tmp_path / "incomplete"
+    shutil.copytree(sharded, incomplete)
+    (incomplete / "shards" / "DC-2026-001.2-of-3.shard.json").unlink()
+    res = runner.invoke(
+        app, ["merge", "--repo-root", str(repo), "--artifacts-dir", str(incomplete)]
+    )
+    assert res.exit_code == 2
+
+    merged = runner.invoke(
+        app, ["merge", "--repo-root", str(repo), "--artifacts-dir", str(sharded)]
+    )
+    assert merged.exit_code == single.exit_code
+    assert merged.stdout == single.stdout
+    for rel in (
+        "snapshots/DC-2026-001.snapshot.json",
+        "decision_records/DC-2026-001.decision_record.md",
+    ):
+        a = (tmp_path / "single" / rel).read_text(encoding="utf-8")
+        b = (sharded / rel).read_text(encoding="utf-8")
+        assert _without_timestamp(a) == _without_timestamp(b)
+
+
+def test_merged_batch_shards_match_check_all(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    repo = _repo(tmp_path)
+    runner = CliRunner()
+    base = ["check-all", "--repo-root", str(repo), "--no-cache", "-j", "1"]
+    single = runner.invoke(app, base)
+
+    artifacts = tmp_path / "artifacts"
+    for i in (1, 2):
+        runner.invoke(
+            app,
+            [*base, "--artifacts-dir", str(artifacts), "--write-artifacts", "--shard", f"{i}/2"],
+        )
+    merged = runner.invoke(
+        app, ["merge", "--batch", "--repo-root", str(repo), "--artifacts-dir", str(artifacts)]
+    )
+    assert merged.exit_code == single.exit_code == 1
+    assert merged.stdout == single.stdout
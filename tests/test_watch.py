@@ -0,0 +1,112 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from adl.engine.contracts import load_contract
+from adl.engine.evaluator import evaluate_admissibility
+from adl.engine.incremental import IncrementalEvaluator, WatchError, WatchUpdate
+from adl.utils.fswatch import InotifyWatcher, PollingWatcher, WatchUnavailable
+
+REPO = Path(__file__).resolve().parents[1]
+GIT = ["git", "-c", "user.name=t", "-c", "user.email=t@example.com"]
+
+
+def _repo(tmp_path: Path) -> Path:
+    repo = tmp_path / "repo"
+    shutil.copytree(REPO / "decisions" / "contracts", repo / "decisions" / "contracts")
+    subprocess.run([*GIT, "init", "-q"], cwd=repo, check=True)
+    subprocess.run([*GIT, "add", "-A"], cwd=repo, check=True)
+    subprocess.run([*GIT, "commit", "-qm", "base"], cwd=repo, check=True)
+    return repo
+
+
+def _stage(repo: Path, rel: str) -> None:
+    p = repo / rel
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text("x", encoding="utf-8")
+    subprocess.run([*GIT, "add", rel], cwd=repo, check=True)
+
+
+def test_incremental_matches_full_evaluation_and_reclassifies_only_new_paths(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    repo = _repo(tmp_path)
+    contract_path = repo / "decisions" / "contracts" / "DC-2026-001.yaml"
+    for i in range(5):
+        _stage(repo, f"docs/f{i}.md")
+    inc = IncrementalEvaluator(repo, contract_path, strict=True)
+
+    first = inc.refresh()
+    assert first is not None and first.reclassified == 5 and first.result.admitted
+    assert inc.refresh() is None  # nothing changed
+
+    _stage(repo, "src/out_of_bounds.py")
+    second = inc.refresh()
+    assert second is not None
+    assert second.added == ["src/out_of_bounds.py"] and second.reclassified == 1
+    assert not second.contract_reloaded
+
+    full = evaluate_admissibility(
+        repo_root=repo,
+        contract_path=contract_path,
+        contract=load_contract(contract_path),
+        strict=True,
+    )
+    assert second.result.to_dict() == full.to_dict()
+
+    subprocess.run([*GIT, "rm", "-q", "--cached", "src/out_of_bounds.py"], cwd=repo, check=True)
+    third = inc.refresh()
+    assert third is not None and third.removed == ["src/out_of_bounds.py"]
+    assert third.reclassified == 0 and third.result.admitted
+
+
+def test_broken_contract_is_reported_once_and_last_good_contract_kept(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
+    repo = _repo(tmp_path)
+    # Outside the tree, so editing it does not change the diff itself.
+    contract_path = tmp_path / "contract.yaml"
+    good = (repo / "decisions" / "contracts" / "DC-2026-001.yaml").read_text(encoding="utf-8")
+    contract_path.write_text(good, encoding="utf-8")
+    inc = IncrementalEvaluator(repo, contract_path, strict=True)
+    assert isinstance(inc.refresh(), WatchUpdate)
+
+    contract_path.write_text("decision_id: [unclosed\n", encoding="utf-8")
+    error = inc.refresh()
+    assert isinstance(error, WatchError) and error.to_dict()["error"].startswith("ParserError")
+    assert inc.refresh() is None  # same error, nothing else changed
+
+    _stage(repo, "src/out_of_bounds.py")  # still judged by the last good contract
+    update = inc.refresh()
+    assert isinstance(update, WatchUpdate) and not update.result.admitted
+
+    contract_path.unlink()  # e.g. an atomic save between unlink and rename
+    assert isinstance(inc.refresh(), WatchError)
+
+    contract_path.write_text(good, encoding="utf-8")
+    recovered = inc.refresh()
+    assert isinstance(recovered, WatchUpdate) and recovered.added == []
+    assert recovered.result.decision_id == "DC-2026-001"
+
+
+@pytest.mark.parametrize("kind", ["inotify", "polling"])
+def test_watcher_wakes_on_git_add(tmp_path: Path, kind: str) -> None:
+    repo = _repo(tmp_path)
+    git_dir = repo / ".git"
+    if kind == "inotify":
+        try:
+            watcher: InotifyWatcher | PollingWatcher = InotifyWatcher(repo, git_dir)
+        except WatchUnavailable:
+            pytest.skip("inotify not available")
+        assert watcher.wait(timeout=0.05) is False
+    else:
+        watcher = PollingWatcher((git_dir / "index",), interval=5.0)
+    try:
+        _stage(repo, "docs/new.md")
+        assert watcher.wait(timeout=2.0) is True
+    finally:
+        watcher.close()